@@ -0,0 +1,240 @@
+"""
+필터링된 볼린저 밴드 백테스트 공통 커널
+
+filtered_strategy_backtest.py / final_portfolio_backtest.py가 함께 사용합니다.
+- 이동평균/이동 표준편차 (bottleneck 설치 시 C 구현 사용,
+  없으면 평균은 누적합, 표준편차는 sliding_window_view 창 단위 계산)
+- 상태와 무관한 필터의 불리언 마스크
+- 시간 필터 + 매매 루프 (AOT 빌드 → numba JIT → 순수 Python 순으로 사용)
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from utils._njit import njit, NUMBA_AVAILABLE
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+def rolling_mean(x: np.ndarray, period: int) -> np.ndarray:
+    """O(n) 단순 이동평균 (누적합 차분, 앞쪽 period-1개는 NaN)"""
+    if bn is not None and len(x) >= period:
+        return bn.move_mean(x, window=period, min_count=period)
+    
+    out = np.full(len(x), np.nan)
+    if len(x) < period:
+        return out
+    
+    # 기준값을 빼서 누적합 크기를 줄임 (부동소수점 오차 완화)
+    base = x[0]
+    c = np.concatenate(([0.0], np.cumsum(x - base)))
+    out[period - 1:] = (c[period:] - c[:-period]) / period + base
+    return out
+
+
+# rolling_std 창 계산 시 한 번에 처리할 행 수 (임시 배열 크기 제한)
+_STD_CHUNK = 65536
+
+
+def rolling_std(x: np.ndarray, period: int) -> np.ndarray:
+    """이동 표준편차 (표본 표준편차, pandas rolling().std()와 동일한 ddof=1)"""
+    if bn is not None and len(x) >= period:
+        return bn.move_std(x, window=period, min_count=period, ddof=1)
+    
+    out = np.full(len(x), np.nan)
+    if len(x) < period:
+        return out
+    
+    # 제곱 누적합 차분은 긴 시계열에서 상쇄 오차가 커지므로,
+    # 복사 없는 창 뷰에서 창마다 직접 계산 (O(n·period)이지만 정확)
+    win = sliding_window_view(x, period)
+    res = out[period - 1:]
+    for start in range(0, len(win), _STD_CHUNK):
+        stop = start + _STD_CHUNK
+        res[start:stop] = win[start:stop].std(axis=1, ddof=1)
+    return out
+
+
+# 거래 유형 코드 (커널 결과 배열)
+TRADE_BUY = 0
+TRADE_SELL = 1
+
+# 거래 전 시간 필터 기준 (어떤 타임스탬프보다 작음)
+_NO_TRADE_TS = np.iinfo(np.int64).min
+
+
+def build_signal_masks(close, upper, lower, ma240, atr, atr_mult, start=300):
+    """
+    상태와 무관한 필터를 한 번에 벡터화
+
+    Returns:
+        tuple: (buy_sig, sell_sig, event_idx)
+            - buy_sig: 하단 밴드 + 4시간 MA 아래 (하락 추세)
+            - sell_sig: 상단 밴드 + 4시간 MA 위 (상승 추세)
+            - event_idx: ATR 필터를 통과한 신호 캔들 인덱스 (start 이후)
+    """
+    # 지표 NaN은 앞쪽 워밍업 구간(최대 240개)에만 있으므로,
+    # NaN 검사 없이 start 이후 유효 구간만 잘라서 계산
+    n = len(close)
+    buy_sig = np.zeros(n, dtype=np.bool_)
+    sell_sig = np.zeros(n, dtype=np.bool_)
+    
+    c = close[start:]
+    ma = ma240[start:]
+    buy_sig[start:] = (c < lower[start:]) & (c < ma)
+    sell_sig[start:] = (c > upper[start:]) & (c > ma)
+    
+    # 변동성 필터: ATR이 가격의 일정 비율 이상
+    # (비율을 스칼라로 먼저 계산해 배열 곱셈 한 번으로 임계값 생성)
+    atr_thresh = c * (atr_mult / 100.0)
+    atr_ok = atr[start:] >= atr_thresh
+    
+    event_idx = np.flatnonzero((buy_sig[start:] | sell_sig[start:]) & atr_ok) + start
+    
+    return buy_sig, sell_sig, event_idx
+
+
+@njit(cache=True)
+def _run_bb_loop(close, buy_sig, sell_sig, event_idx, ts_ns,
+                 min_ns, initial_capital, fee=0.0005):
+    """
+    필터링된 볼린저 밴드 백테스팅 루프 (NumPy 배열 전용 커널)
+
+    신호 후보 캔들(event_idx)만 순회하며, 상태가 필요한
+    시간 필터(마지막 거래 후 대기)만 루프 안에서 확인합니다.
+    시간은 int64 나노초(ts_ns, min_ns)로 비교합니다.
+
+    Returns:
+        tuple: (trade_type, trade_price, trade_amount, trade_profit,
+                trade_idx, k, cash, position, entry_price, entry_amount)
+            - trade_*: 길이 k까지 유효한 거래 배열
+            - trade_idx: 거래가 발생한 캔들 인덱스
+    """
+    n_max = len(event_idx) + 1
+
+    trade_type = np.empty(n_max, np.int8)
+    trade_price = np.empty(n_max, np.float64)
+    trade_amount = np.empty(n_max, np.float64)
+    trade_profit = np.zeros(n_max, np.float64)
+    trade_idx = np.empty(n_max, np.int64)
+    k = 0
+
+    cash = initial_capital
+    position = 0.0
+    entry_price = 0.0
+    entry_amount = 0.0
+    next_trade_ts = _NO_TRADE_TS
+
+    for i in event_idx:
+        # 시간 필터: 마지막 거래 후 충분한 시간 경과 확인
+        if ts_ns[i] < next_trade_ts:
+            continue
+
+        price = close[i]
+
+        # 매수 신호
+        if position == 0:
+            if buy_sig[i] and cash > 0:
+                amount = (cash * 0.99) / price
+                buy_fee = amount * price * fee
+                cost = amount * price + buy_fee
+
+                position = amount
+                cash -= cost
+                entry_price = price
+                entry_amount = amount
+                next_trade_ts = ts_ns[i] + min_ns
+
+                trade_type[k] = TRADE_BUY
+                trade_price[k] = price
+                trade_amount[k] = amount
+                trade_idx[k] = i
+                k += 1
+
+        # 매도 신호
+        elif position > 0:
+            if sell_sig[i]:
+                proceeds = position * price
+                sell_fee = proceeds * fee
+                cash += proceeds - sell_fee
+
+                trade_type[k] = TRADE_SELL
+                trade_price[k] = price
+                trade_amount[k] = position
+                trade_profit[k] = ((price - entry_price) * position
+                                   - (entry_amount * entry_price * fee) - sell_fee)
+                trade_idx[k] = i
+                k += 1
+
+                next_trade_ts = ts_ns[i] + min_ns
+                position = 0.0
+                entry_price = 0.0
+
+    return (trade_type, trade_price, trade_amount, trade_profit,
+            trade_idx, k, cash, position, entry_price, entry_amount)
+
+
+# 실행 커널 선택: AOT 빌드 모듈(build_kernel.py) → numba JIT → 순수 Python
+try:
+    from _bb_kernel_aot import run_bb_loop as _bb_loop
+    KERNEL_BACKEND = 'aot'
+except ImportError:
+    _bb_loop = _run_bb_loop
+    KERNEL_BACKEND = 'jit' if NUMBA_AVAILABLE else 'python'
+
+if KERNEL_BACKEND == 'jit':
+    # 첫 실행 시 JIT 컴파일 비용을 import 시점에 미리 처리 (cache=True로 디스크 캐시)
+    _run_bb_loop(np.zeros(1), np.zeros(1, np.bool_), np.zeros(1, np.bool_),
+                 np.zeros(0, np.int64), np.zeros(1, np.int64), 0, 0.0)
+
+
+def run_bb_backtest(close, upper, lower, ma240, atr, ts_ns,
+                    min_hours_between_trades, atr_mult, initial_capital,
+                    fee=0.0005):
+    """
+    필터링된 볼린저 밴드 백테스트 실행 (마스크 → 커널 → 최종 청산)
+
+    Args:
+        close, upper, lower, ma240, atr: 지표 배열 (float64)
+        ts_ns: 캔들 타임스탬프 (int64 나노초)
+        min_hours_between_trades: 거래 간 최소 대기 시간
+        atr_mult: ATR 필터 승수 (가격 대비 %)
+        initial_capital: 초기 자본
+        fee: 거래 수수료율
+
+    Returns:
+        tuple: (trade_type, trade_price, trade_amount, trade_profit,
+                trade_idx, cash, final_liquidation)
+            - trade_*: 실제 거래 수만큼 잘린 배열 (매수·매도가 번갈아 기록)
+            - final_liquidation: 마지막 매도가 기간 종료 청산인지 여부
+    """
+    buy_sig, sell_sig, event_idx = build_signal_masks(
+        close, upper, lower, ma240, atr, atr_mult
+    )
+    
+    (trade_type, trade_price, trade_amount, trade_profit, trade_idx,
+     k, cash, position, entry_price, entry_amount) = _bb_loop(
+        close, buy_sig, sell_sig, event_idx, ts_ns,
+        int(min_hours_between_trades * 3600 * 1_000_000_000), float(initial_capital), fee
+    )
+    
+    # 최종 청산 (커널 결과 배열의 마지막 칸에 기록)
+    final_liquidation = position > 0
+    if final_liquidation:
+        final_price = close[-1]
+        
+        proceeds = position * final_price
+        sell_fee = proceeds * fee
+        cash += proceeds - sell_fee
+        
+        trade_type[k] = TRADE_SELL
+        trade_price[k] = final_price
+        trade_amount[k] = position
+        trade_profit[k] = (final_price - entry_price) * position - (entry_amount * entry_price * fee) - sell_fee
+        trade_idx[k] = len(close) - 1
+        k += 1
+    
+    return (trade_type[:k], trade_price[:k], trade_amount[:k], trade_profit[:k],
+            trade_idx[:k], cash, final_liquidation)
@@ -0,0 +1,55 @@
+"""
+백테스트 커널 AOT(사전) 컴파일 스크립트
+
+_backtest_kernel._run_bb_loop를 numba.pycc로 미리 컴파일하여
+프로젝트 루트에 _bb_kernel_aot 확장 모듈(.so/.pyd)을 생성합니다.
+생성된 모듈이 있으면 _backtest_kernel이 JIT 대신 자동으로 사용하므로,
+스크립트 실행마다 발생하는 첫 JIT 컴파일 비용이 사라집니다.
+
+사용법:
+    python build_kernel.py
+
+커널 코드(_backtest_kernel.py)를 수정했다면 다시 빌드해야 합니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+# _run_bb_loop 시그니처
+#   (close, buy_sig, sell_sig, event_idx, ts_ns, min_ns, initial_capital, fee)
+#   → (trade_type, trade_price, trade_amount, trade_profit, trade_idx,
+#      k, cash, position, entry_price, entry_amount)
+KERNEL_SIGNATURE = (
+    'Tuple((i1[:], f8[:], f8[:], f8[:], i8[:], i8, f8, f8, f8, f8))'
+    '(f8[:], b1[:], b1[:], i8[:], i8[:], i8, f8, f8)'
+)
+
+
+def main():
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        print("❌ numba가 설치되지 않았습니다.")
+        print("설치 명령: pip install numba")
+        sys.exit(1)
+
+    from _backtest_kernel import _run_bb_loop
+
+    cc = CC('_bb_kernel_aot')
+    cc.output_dir = PROJECT_ROOT
+
+    # @njit 데코레이터가 적용되기 전의 원본 Python 함수를 export
+    kernel = getattr(_run_bb_loop, 'py_func', _run_bb_loop)
+    cc.export('run_bb_loop', KERNEL_SIGNATURE)(kernel)
+
+    print("🔨 _bb_kernel_aot 컴파일 중...")
+    cc.compile()
+    print(f"✅ 빌드 완료: {PROJECT_ROOT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -60,7 +60,8 @@ class AutoTradingManager:
         semi_auto_manager: SemiAutoManager,
         config: AutoTradingConfig,
         notification_callback: Optional[Callable] = None,
-        dry_run: bool = True
+        dry_run: bool = True,
+        status_callback: Optional[Callable] = None
     ):
         """
         Args:
@@ -70,6 +71,7 @@ class AutoTradingManager:
             config: 자동매수 설정
             notification_callback: 알림 콜백 함수
             dry_run: 페이퍼 트레이딩 모드 (True: 테스트, False: 실거래)
+            status_callback: 상태 변경 콜백 함수 (인자 없음, 모니터링 대상/거래 횟수 변경 시 호출)
         """
         self.api = upbit_api
         self.order_manager = order_manager
@@ -77,6 +79,7 @@ class AutoTradingManager:
         self.config = config
         self.notification_callback = notification_callback
         self.dry_run = dry_run  # 🔧 dry_run 모드 저장
+        self.status_callback = status_callback
         
         # ScalpingStrategy 인스턴스들 (코인별)
         self.strategies: Dict[str, ScalpingStrategy] = {}
@@ -116,6 +119,7 @@ class AutoTradingManager:
         
         # 모니터링 대상 코인 설정
         await self._setup_monitoring_symbols()
+        self._notify_status_changed()
         
         # ScalpingStrategy 인스턴스 생성
         await self._setup_strategies()
@@ -399,6 +403,7 @@ class AutoTradingManager:
             if order_result and order_result.get('success'):
                 # 통계 업데이트
                 self.daily_trades += 1
+                self._notify_status_changed()
                 
                 # 알림
                 if self.notification_callback:
@@ -499,6 +504,11 @@ class AutoTradingManager:
             
             # 비동기 초기화는 다음 루프에서 수행됨
     
+    def _notify_status_changed(self):
+        """상태 변경 알림 (상태 조회는 콜백을 받은 쪽에서 get_status로 수행)"""
+        if self.status_callback:
+            self.status_callback()
+    
     def get_status(self) -> Dict:
         """
         현재 상태 조회
@@ -10,6 +10,7 @@ Upbit API를 통한 과거 캔들 데이터 수집
 
 import time
 import logging
+import threading
 from typing import Optional, List
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -18,6 +19,11 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# 여러 스레드가 동시에 수집할 때도 초당 요청 수 제한(10회)을 지키기 위한 공유 간격 제어
+_REQUEST_INTERVAL = 0.1
+_request_lock = threading.Lock()
+_last_request_time = 0.0
+
 
 class HistoricalDataFetcher:
     """
@@ -195,6 +201,8 @@ class HistoricalDataFetcher:
 
         interval_path = interval_map.get(interval, 'minutes/1')
 
+        self._wait_rate_limit()
+
         # API URL
         url = f"{self.base_url}/candles/{interval_path}"
 
@@ -220,6 +228,21 @@ class HistoricalDataFetcher:
             logger.error(f"API 요청 실패: {e}")
             return []
 
+    @staticmethod
+    def _wait_rate_limit():
+        """
+        모든 스레드 공통으로 직전 요청 후 최소 간격만큼 대기
+
+        fetch_candles를 여러 스레드에서 동시에 호출해도 Rate Limit을 넘지 않도록 합니다.
+        """
+        global _last_request_time
+
+        with _request_lock:
+            wait = _last_request_time + _REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            _last_request_time = time.monotonic()
+
     def _convert_to_dataframe(self, candles: List[dict]) -> pd.DataFrame:
         """
         API 응답을 DataFrame으로 변환
@@ -96,7 +96,8 @@ class SemiAutoManager:
         scan_interval: int = 10,  # 스캔 주기 (초)
         notification_callback: Optional[Callable] = None,
         position_callback: Optional[Callable] = None,  # 🔧 포지션 업데이트 콜백
-        balance_update_callback: Optional[Callable] = None  # 🔧 잔고 갱신 콜백
+        balance_update_callback: Optional[Callable] = None,  # 🔧 잔고 갱신 콜백
+        status_callback: Optional[Callable] = None  # 상태 변경 콜백
     ):
         """
         Args:
@@ -107,6 +108,7 @@ class SemiAutoManager:
             notification_callback: 알림 콜백 함수
             position_callback: 포지션 업데이트 콜백 함수 (새 포지션 감지, 업데이트 시 호출)
             balance_update_callback: 잔고 갱신 콜백 함수 (수동 매수 감지 시 호출)
+            status_callback: 상태 변경 콜백 함수 (인자 없음, 포지션 추가/제거·DCA 체결 시 호출)
         """
         self.api = upbit_api
         self.order_manager = order_manager
@@ -115,6 +117,7 @@ class SemiAutoManager:
         self.notification_callback = notification_callback
         self.position_callback = position_callback  # 🔧 저장
         self.balance_update_callback = balance_update_callback  # 🔧 저장
+        self.status_callback = status_callback
         
         # PositionDetector 초기화
         self.detector = PositionDetector(upbit_api)
@@ -123,7 +126,7 @@ class SemiAutoManager:
         self.managed_positions: Dict[str, ManagedPosition] = {}
         
         # 🔧 WebSocket 실시간 가격 수신
-        self.websocket = UpbitWebSocket()
+        self.websocket = UpbitWebSocket(coalesce_tickers=True)  # 심볼별 최신 가격만 사용
         self.last_prices: Dict[str, float] = {}  # {symbol: last_price}
         self.last_check_time: Dict[str, float] = {}  # {symbol: timestamp} DCA/익절/손절 체크
         self.last_gui_update: Dict[str, float] = {}  # {symbol: timestamp} GUI 업데이트
@@ -362,6 +365,7 @@ class SemiAutoManager:
         
         # PositionDetector에 관리 포지션 등록
         self.detector.register_managed_position(symbol, position)
+        self._notify_status_changed()
         
         # 알림
         if self.notification_callback:
@@ -482,6 +486,7 @@ class SemiAutoManager:
                 # DCA 추가 매수 실행
                 await self._execute_dca_buy(managed, level_config, current_price)
                 managed.executed_dca_levels.add(level)
+                self._notify_status_changed()
     
     async def _check_take_profit(self, managed: ManagedPosition, current_price: float):
         """익절 체크"""
@@ -579,6 +584,7 @@ class SemiAutoManager:
             # 포지션 제거
             del self.managed_positions[symbol]
             self.detector.unregister_managed_position(symbol)
+            self._notify_status_changed()
             
             # 알림
             if self.notification_callback:
@@ -616,6 +622,7 @@ class SemiAutoManager:
             # 포지션 제거
             del self.managed_positions[symbol]
             self.detector.unregister_managed_position(symbol)
+            self._notify_status_changed()
             
             # 알림
             if self.notification_callback:
@@ -649,6 +656,11 @@ class SemiAutoManager:
         
         return None
     
+    def _notify_status_changed(self):
+        """상태 변경 알림 (상태 조회는 콜백을 받은 쪽에서 get_status로 수행)"""
+        if self.status_callback:
+            self.status_callback()
+    
     def get_status(self) -> Dict:
         """현재 상태 조회"""
         return {
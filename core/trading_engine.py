@@ -171,7 +171,7 @@ class TradingEngine:
         logger.info(f"  웹소켓: 1분봉, 10초 간격")
 
         # 🔧 실시간 가격 추적용 Ticker WebSocket
-        self.ticker_ws = UpbitWebSocket()
+        self.ticker_ws = UpbitWebSocket(coalesce_tickers=True)  # 최신 가격만 사용
         logger.info(f"  Ticker WebSocket: 실시간 가격 추적 활성화")
         
         # 5. 주문 관리자
@@ -19,6 +19,7 @@ import uuid
 import hashlib
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from typing import Dict, List, Optional
 from urllib.parse import urlencode, unquote
@@ -45,6 +46,12 @@ class UpbitAPI:
         self.secret_key = secret_key
         self.base_url = "https://api.upbit.com/v1"
         
+        # 세션 생성 (연결 재사용: 요청마다 TCP/TLS 핸드셰이크 생략)
+        # 워커의 여러 매니저가 이 인스턴스 하나를 공유하므로 풀 크기를 넉넉하게
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        self.session.mount("https://", adapter)
+        
         logger.info("✅ Upbit API 클라이언트 초기화 완료")
     
     def _generate_jwt_token(self, query: Optional[Dict] = None) -> str:
@@ -105,11 +112,11 @@ class UpbitAPI:
             timeout = 30 if method == "POST" else 10
             
             if method == "GET":
-                response = requests.get(url, headers=headers, params=query, timeout=timeout)
+                response = self.session.get(url, headers=headers, params=query, timeout=timeout)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=body, timeout=timeout)
+                response = self.session.post(url, headers=headers, json=body, timeout=timeout)
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers, params=query, timeout=timeout)
+                response = self.session.delete(url, headers=headers, params=query, timeout=timeout)
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
             
@@ -306,13 +313,11 @@ class UpbitAPI:
                     ...
                 }
         """
-        import requests
-        
         url = "https://api.upbit.com/v1/ticker"
         params = {'markets': symbol}
         
         try:
-            response = requests.get(url, params=params, timeout=10)  # 🔧 10초 timeout
+            response = self.session.get(url, params=params, timeout=10)  # 🔧 10초 timeout
             response.raise_for_status()
             
             data = response.json()
@@ -328,6 +333,11 @@ class UpbitAPI:
         except requests.exceptions.RequestException as e:
             logger.error(f"현재가 조회 실패 ({symbol}): {e}")
             return {}
+    
+    def close(self):
+        """세션 종료"""
+        self.session.close()
+        logger.info("Upbit API 세션 종료")
 
 
 # 테스트 코드
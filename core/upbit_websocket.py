@@ -19,6 +19,7 @@ Example:
 import json
 import asyncio
 import logging
+from collections import deque
 from typing import List, Dict, Optional, Callable, AsyncIterator
 from datetime import datetime
 import websockets
@@ -33,14 +34,30 @@ class UpbitWebSocket:
     실시간 시장 데이터를 수신합니다.
     """
 
-    def __init__(self):
-        """웹소켓 클라이언트 초기화"""
+    def __init__(self, max_queue: int = 256, coalesce_tickers: bool = False):
+        """
+        웹소켓 클라이언트 초기화
+
+        Args:
+            max_queue: 라이브러리 수신 큐 크기 (버스트 시 네트워크 리더 블로킹 방지)
+            coalesce_tickers: 소비자가 느릴 때 심볼별 최신 Ticker만 전달
+                (중간 Ticker는 버려지므로 최신 가격만 필요한 소비자만 사용)
+        """
         self.url = "wss://api.upbit.com/websocket/v1"
         self.websocket = None
         self.is_connected = False
         self.subscriptions = []
         self.callbacks = {}
 
+        self.max_queue = max_queue
+        self.coalesce_tickers = coalesce_tickers
+
+        # 수신 버퍼 (Ticker는 심볼별 최신값만 유지)
+        self._pending = deque()
+        self._latest_ticker: Dict[str, Dict] = {}
+        self._message_event: Optional[asyncio.Event] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
     async def connect(self) -> bool:
         """
         웹소켓 연결
@@ -49,7 +66,11 @@ class UpbitWebSocket:
             bool: 연결 성공 여부
         """
         try:
-            self.websocket = await websockets.connect(self.url)
+            self.websocket = await websockets.connect(
+                self.url,
+                max_queue=self.max_queue,
+                write_limit=2 ** 18
+            )
             self.is_connected = True
             logger.info("✅ 업비트 웹소켓 연결 성공")
             return True
@@ -61,6 +82,12 @@ class UpbitWebSocket:
     async def disconnect(self):
         """웹소켓 연결 종료"""
         self.is_connected = False
+
+        # 소비자가 aclose() 없이 루프를 빠져나간 경우에도 수신 태스크 정리
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+
         if self.websocket:
             await self.websocket.close()
             logger.info("웹소켓 연결 종료")
@@ -145,18 +172,61 @@ class UpbitWebSocket:
         if not self.is_connected:
             raise ConnectionError("웹소켓이 연결되지 않았습니다.")
 
+        if not self.coalesce_tickers:
+            try:
+                while self.is_connected:
+                    message = await self.websocket.recv()
+                    yield self._decode(message)
+
+            except websockets.exceptions.ConnectionClosed:
+                logger.warning("⚠️ 웹소켓 연결 끊김")
+                self.is_connected = False
+            except Exception as e:
+                logger.error(f"❌ 메시지 수신 오류: {e}")
+                self.is_connected = False
+            return
+
+        # 수신은 별도 태스크가 계속 수행하고, 소비자는 준비된 메시지만 가져감
+        self._message_event = asyncio.Event()
+        reader = self._reader_task = asyncio.create_task(self._reader())
+
+        try:
+            while True:
+                await self._message_event.wait()
+                self._message_event.clear()
+
+                while self._pending or self._latest_ticker:
+                    if self._pending:
+                        yield self._pending.popleft()
+                    else:
+                        code = next(iter(self._latest_ticker))
+                        yield self._latest_ticker.pop(code)
+
+                if reader.done():
+                    break
+        finally:
+            reader.cancel()
+            if self._reader_task is reader:
+                self._reader_task = None
+
+    async def _reader(self):
+        """
+        메시지 수신 루프 (listen에서 태스크로 실행)
+
+        Ticker는 심볼별 최신값으로 덮어써서, 소비자가 느려도
+        지난 시세가 쌓이지 않도록 합니다.
+        """
         try:
             while self.is_connected:
                 message = await self.websocket.recv()
+                data = self._decode(message)
 
-                # 바이너리 데이터 디코딩
-                if isinstance(message, bytes):
-                    message = message.decode('utf-8')
-
-                # JSON 파싱
-                data = json.loads(message)
+                if data.get('type') == 'ticker':
+                    self._latest_ticker[data.get('code')] = data
+                else:
+                    self._pending.append(data)
 
-                yield data
+                self._message_event.set()
 
         except websockets.exceptions.ConnectionClosed:
             logger.warning("⚠️ 웹소켓 연결 끊김")
@@ -164,6 +234,26 @@ class UpbitWebSocket:
         except Exception as e:
             logger.error(f"❌ 메시지 수신 오류: {e}")
             self.is_connected = False
+        finally:
+            self._message_event.set()
+
+    @staticmethod
+    def _decode(message) -> Dict:
+        """
+        수신 메시지 디코딩
+
+        Args:
+            message: 웹소켓 원본 메시지 (bytes 또는 str)
+
+        Returns:
+            Dict: 파싱된 데이터
+        """
+        # 바이너리 데이터 디코딩
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
+
+        # JSON 파싱
+        return json.loads(message)
 
     async def listen_with_callback(self, callback: Callable):
         """
@@ -6,6 +6,8 @@ ETH 파라미터 최적화 백테스팅
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from core.historical_data import HistoricalDataFetcher
 import pandas as pd
@@ -50,8 +52,30 @@ def calculate_atr(candles, period=14):
     return atr
 
 
+def prepare_indicators(candles: pd.DataFrame) -> dict:
+    """
+    설정과 무관한 지표를 한 번만 계산해 NumPy 배열로 묶음
+
+    std_dev에 따라 달라지는 밴드는 20기간 평균/표준편차만 보관하고
+    설정별로 upper/lower를 만듭니다.
+
+    Returns:
+        dict: close, ts_ns(int64 나노초), ma20, std20, ma240, atr 배열
+    """
+    close = candles['close']
+
+    return {
+        'close': close.to_numpy(dtype=np.float64),
+        'ts_ns': candles.index.values.astype('datetime64[ns]').view('i8'),
+        'ma20': close.rolling(window=20).mean().to_numpy(),
+        'std20': close.rolling(window=20).std().to_numpy(),
+        'ma240': calculate_ma(candles, period=240).to_numpy(),
+        'atr': calculate_atr(candles, period=14).to_numpy(),
+    }
+
+
 def backtest_eth_config(
-    candles: pd.DataFrame,
+    indicators: dict,
     std_dev: float,
     min_hours_between_trades: int,
     atr_multiplier: float,
@@ -59,75 +83,74 @@ def backtest_eth_config(
 ):
     """
     ETH 백테스팅 (단일 설정)
+
+    Args:
+        indicators: prepare_indicators() 결과 (미리 계산한 지표 배열)
     """
-    # 지표 계산
-    ma20, upper, lower = calculate_bollinger_bands(candles, period=20, std_dev=std_dev)
-    ma240 = calculate_ma(candles, period=240)
-    atr = calculate_atr(candles, period=14)
+    close = indicators['close']
+    ts_ns = indicators['ts_ns']
+    ma240 = indicators['ma240']
+    atr = indicators['atr']
+
+    # 설정별 볼린저 밴드
+    upper = indicators['ma20'] + (indicators['std20'] * std_dev)
+    lower = indicators['ma20'] - (indicators['std20'] * std_dev)
 
     # 상태 변수
     balance = initial_capital
     position = 0
-    trades = []
-    last_trade_time = None
-    min_minutes_between_trades = min_hours_between_trades * 60
+    n_trades = 0
+    wins = 0
+    losses = 0
+    last_buy_price = 0.0
+    last_trade_ns = None
+    min_ns_between_trades = int(min_hours_between_trades * 3600 * 1_000_000_000)
 
     # 백테스팅 루프
-    for i in range(300, len(candles)):
-        current_time = candles.index[i]
-        price = candles['close'].iloc[i]
+    for i in range(300, len(close)):
+        price = close[i]
 
         # 시간 필터
-        if last_trade_time is not None:
-            time_diff = (current_time - last_trade_time).total_seconds() / 60
-            if time_diff < min_minutes_between_trades:
-                continue
+        if last_trade_ns is not None and ts_ns[i] - last_trade_ns < min_ns_between_trades:
+            continue
 
         # 변동성 필터
-        if np.isnan(atr.iloc[i]) or atr.iloc[i] < (price * atr_multiplier / 100):
+        if np.isnan(atr[i]) or atr[i] < (price * atr_multiplier / 100):
             continue
 
         # 매수 신호
-        if position == 0 and price < lower.iloc[i] and price < ma240.iloc[i]:
-            if not np.isnan(lower.iloc[i]) and not np.isnan(ma240.iloc[i]):
+        if position == 0 and price < lower[i] and price < ma240[i]:
+            if not np.isnan(lower[i]) and not np.isnan(ma240[i]):
                 buy_amount = balance * 0.99 / price
                 fee = balance * 0.99 * 0.0005
 
                 position = buy_amount
                 balance = balance * 0.01
-                last_trade_time = current_time
+                last_trade_ns = ts_ns[i]
 
-                trades.append({
-                    'time': current_time,
-                    'type': 'buy',
-                    'price': price,
-                    'amount': buy_amount,
-                    'balance': balance,
-                    'position': position
-                })
+                last_buy_price = price
+                n_trades += 1
 
         # 매도 신호
-        elif position > 0 and price > upper.iloc[i] and price > ma240.iloc[i]:
-            if not np.isnan(upper.iloc[i]) and not np.isnan(ma240.iloc[i]):
+        elif position > 0 and price > upper[i] and price > ma240[i]:
+            if not np.isnan(upper[i]) and not np.isnan(ma240[i]):
                 sell_value = position * price
                 fee = sell_value * 0.0005
 
                 balance = balance + sell_value - fee
                 position = 0
-                last_trade_time = current_time
+                last_trade_ns = ts_ns[i]
 
-                trades.append({
-                    'time': current_time,
-                    'type': 'sell',
-                    'price': price,
-                    'amount': 0,
-                    'balance': balance,
-                    'position': position
-                })
+                # 승패 집계 (직전 매수가 대비)
+                n_trades += 1
+                if price > last_buy_price:
+                    wins += 1
+                else:
+                    losses += 1
 
     # 최종 청산
     if position > 0:
-        final_price = candles['close'].iloc[-1]
+        final_price = close[-1]
         sell_value = position * final_price
         fee = sell_value * 0.0005
         balance = balance + sell_value - fee
@@ -138,17 +161,6 @@ def backtest_eth_config(
     total_return = ((final_capital - initial_capital) / initial_capital) * 100
 
     # 승률 계산
-    wins = 0
-    losses = 0
-    for i in range(1, len(trades), 2):
-        if i < len(trades):
-            buy_price = trades[i-1]['price']
-            sell_price = trades[i]['price']
-            if sell_price > buy_price:
-                wins += 1
-            else:
-                losses += 1
-
     win_rate = (wins / (wins + losses) * 100) if (wins + losses) > 0 else 0
 
     return {
@@ -157,13 +169,38 @@ def backtest_eth_config(
         'atr_mult': atr_multiplier,
         'return': total_return,
         'final_capital': final_capital,
-        'trades': len(trades),
+        'trades': n_trades,
         'wins': wins,
         'losses': losses,
         'win_rate': win_rate
     }
 
 
+# 워커 프로세스별 지표 배열 (initializer에서 한 번만 전달)
+_worker_indicators = None
+
+
+def _init_worker(indicators: dict):
+    """워커 초기화: 부모에서 계산한 지표 배열을 프로세스당 한 번만 역직렬화"""
+    global _worker_indicators
+    _worker_indicators = indicators
+
+
+def _run_config(config):
+    """워커에서 단일 설정 백테스팅 실행"""
+    std_dev, wait_hours, atr_mult, desc = config
+
+    result = backtest_eth_config(
+        indicators=_worker_indicators,
+        std_dev=std_dev,
+        min_hours_between_trades=wait_hours,
+        atr_multiplier=atr_mult,
+        initial_capital=2000000
+    )
+    result['description'] = desc
+    return result
+
+
 def main():
     """메인 실행"""
     print("=" * 80)
@@ -188,6 +225,9 @@ def main():
 
     print(f"✅ {len(candles):,}개 캔들 로드 완료\n")
 
+    # 설정과 무관한 지표는 한 번만 계산해 워커에 배열로 전달
+    indicators = prepare_indicators(candles)
+
     # 2. 테스트할 파라미터 조합
     configs = [
         # (std_dev, wait_hours, atr_multiplier, 설명)
@@ -203,24 +243,19 @@ def main():
     print("🔬 테스트 시작...\n")
     print("-" * 80)
 
-    # 3. 각 설정 테스트
-    results = []
-
-    for std_dev, wait_hours, atr_mult, desc in configs:
-        print(f"\n테스트: {desc}")
-        print(f"  파라미터: std={std_dev}, wait={wait_hours}h, atr={atr_mult}")
-
-        result = backtest_eth_config(
-            candles=candles,
-            std_dev=std_dev,
-            min_hours_between_trades=wait_hours,
-            atr_multiplier=atr_mult,
-            initial_capital=2000000
-        )
+    # 3. 각 설정 테스트 (설정별로 독립적이므로 CPU 코어에 분산)
+    max_workers = min(len(configs), os.cpu_count() or 1)
 
-        result['description'] = desc
-        results.append(result)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(indicators,)
+    ) as executor:
+        results = list(executor.map(_run_config, configs))
 
+    for result in results:
+        print(f"\n테스트: {result['description']}")
+        print(f"  파라미터: std={result['std_dev']}, wait={result['wait_hours']}h, atr={result['atr_mult']}")
         print(f"  결과: {result['return']:+.2f}% | "
               f"거래 {result['trades']}회 | "
               f"승률 {result['win_rate']:.1f}%")
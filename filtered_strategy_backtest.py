@@ -6,12 +6,15 @@
 - 목표: 적정 거래 빈도 (연 10-30회)
 """
 
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
-from core.historical_data import HistoricalDataFetcher
+from _backtest_kernel import rolling_mean, rolling_std, run_bb_backtest, TRADE_BUY, TRADE_SELL
 
 # 로깅 설정
 logging.basicConfig(
@@ -19,6 +22,12 @@ logging.basicConfig(
     format='%(message)s'
 )
 
+# 지표 디스크 캐시 위치 (프로젝트 디렉토리 밖, 삭제해도 다시 계산됨)
+INDICATOR_CACHE_DIR = Path.home() / '.cache' / 'backtest_indicators'
+
+# 캐시 키에 포함되는 지표 파라미터 (기간을 바꾸면 캐시가 자동으로 분리됨)
+_INDICATOR_PARAMS = (('ma20', 20), ('std20', 20), ('ma240', 240), ('atr', 14))
+
 
 def calculate_atr(candles: pd.DataFrame, period: int = 14):
     """ATR (Average True Range) 계산"""
@@ -26,16 +35,21 @@ def calculate_atr(candles: pd.DataFrame, period: int = 14):
     low = candles['low'].values
     close = candles['close'].values
     
-    # True Range 계산
-    tr1 = high - low
-    tr2 = np.abs(high - np.roll(close, 1))
-    tr3 = np.abs(low - np.roll(close, 1))
+    # True Range 계산 (첫 번째 값은 high-low)
+    # 전일 종가는 close[:-1] 뷰로 참조하고 임시 버퍼 하나에 out=으로 기록
+    tr = high - low
+    tmp = np.empty_like(tr)
     
-    tr = np.maximum(tr1, np.maximum(tr2, tr3))
-    tr[0] = tr1[0]  # 첫 번째 값은 high-low
+    np.subtract(high[1:], close[:-1], out=tmp[1:])
+    np.abs(tmp[1:], out=tmp[1:])
+    np.maximum(tr[1:], tmp[1:], out=tr[1:])
+    
+    np.subtract(low[1:], close[:-1], out=tmp[1:])
+    np.abs(tmp[1:], out=tmp[1:])
+    np.maximum(tr[1:], tmp[1:], out=tr[1:])
     
     # ATR = TR의 이동평균
-    atr = pd.Series(tr).rolling(window=period).mean().values
+    atr = rolling_mean(tr, period)
     
     return atr
 
@@ -44,8 +58,8 @@ def calculate_bollinger_bands(candles: pd.DataFrame, period: int = 20, std_dev:
     """볼린저 밴드 계산"""
     closes = candles['close'].values
     
-    ma = pd.Series(closes).rolling(window=period).mean().values
-    std = pd.Series(closes).rolling(window=period).std().values
+    ma = rolling_mean(closes, period)
+    std = rolling_std(closes, period)
     
     upper = ma + (std * std_dev)
     lower = ma - (std * std_dev)
@@ -56,18 +70,112 @@ def calculate_bollinger_bands(candles: pd.DataFrame, period: int = 20, std_dev:
 def calculate_ma(candles: pd.DataFrame, period: int = 240):
     """이동평균 계산 (240분 = 4시간)"""
     closes = candles['close'].values
-    ma = pd.Series(closes).rolling(window=period).mean().values
+    ma = rolling_mean(closes, period)
     return ma
 
 
+def _indicator_cache_path(candles: pd.DataFrame, symbol: str, cache_dir: Path) -> Path:
+    """
+    지표 캐시 파일 경로 생성
+
+    심볼/기간은 파일명에, 캔들 수·OHLC 내용·지표 파라미터는 해시에 반영하여
+    같은 기간이라도 데이터가 바뀌면 다른 캐시를 사용합니다.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr(_INDICATOR_PARAMS).encode())
+    digest.update(str(len(candles)).encode())
+    digest.update(candles.index.values.astype('datetime64[ns]').view('i8')[[0, -1]].tobytes())
+    for column in ('high', 'low', 'close'):
+        digest.update(candles[column].to_numpy(dtype=np.float64).tobytes())
+    
+    start_str = candles.index[0].strftime('%Y%m%d%H%M')
+    end_str = candles.index[-1].strftime('%Y%m%d%H%M')
+    
+    return cache_dir / f"{symbol}_{start_str}_{end_str}_{digest.hexdigest()[:16]}.npz"
+
+
+def precompute_indicators(
+    candles: pd.DataFrame,
+    dtype=np.float64,
+    symbol: Optional[str] = None,
+    use_cache: bool = False,
+    cache_dir: Optional[Path] = None
+) -> Dict[str, np.ndarray]:
+    """
+    설정(std_dev 등)과 무관한 지표를 한 번만 계산
+
+    볼린저 밴드는 std_dev에 따라 달라지므로 MA20/표준편차만 저장하고,
+    밴드는 설정마다 ma20 ± std_dev * std20으로 만듭니다.
+
+    Args:
+        candles: 캔들 데이터
+        dtype: 지표 배열 저장 타입 (np.float32면 메모리/대역폭 절반)
+            누적 계산은 항상 float64로 하고 결과만 변환합니다.
+            종가는 자본 계산에 쓰이므로 float64로 유지합니다.
+        symbol: 심볼 (캐시 파일명에 사용)
+        use_cache: 디스크 캐시 사용 여부 (symbol이 있어야 적용)
+        cache_dir: 캐시 디렉토리 (None이면 INDICATOR_CACHE_DIR)
+
+    Returns:
+        Dict: {'close', 'ma20', 'std20', 'ma240', 'atr'}
+    """
+    close = candles['close'].to_numpy(dtype=np.float64)
+    
+    cache_file = None
+    if use_cache and symbol and len(candles) > 0:
+        cache_file = _indicator_cache_path(candles, symbol, cache_dir or INDICATOR_CACHE_DIR)
+    
+    indicators = None
+    
+    # 캐시 확인 (손상된 파일이면 다시 계산)
+    if cache_file is not None and cache_file.exists():
+        try:
+            with np.load(cache_file) as data:
+                indicators = {name: data[name] for name, _ in _INDICATOR_PARAMS}
+            print(f"💾 지표 캐시 로드: {cache_file.name}")
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            print(f"⚠️ 지표 캐시 로드 실패, 다시 계산: {e}")
+            indicators = None
+    
+    if indicators is None:
+        indicators = {
+            'ma20': rolling_mean(close, 20),
+            'std20': rolling_std(close, 20),
+            'ma240': calculate_ma(candles, period=240),
+            'atr': calculate_atr(candles, period=14)
+        }
+        
+        # 캐시 저장 (float64 원본 저장, 임시 파일에 쓴 뒤 교체)
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+                with open(tmp_file, 'wb') as f:
+                    np.savez(f, **indicators)
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                print(f"⚠️ 지표 캐시 저장 실패: {e}")
+    
+    result = {'close': close}
+    for name, _ in _INDICATOR_PARAMS:
+        result[name] = indicators[name].astype(dtype, copy=False)
+    return result
+
+
 def backtest_filtered_bb(
     candles: pd.DataFrame,
     std_dev: float = 3.0,
     min_hours_between_trades: int = 12,
     atr_multiplier: float = 0.5,
-    initial_capital: float = 1000000
+    initial_capital: float = 1000000,
+    precomputed: Optional[Dict[str, np.ndarray]] = None
 ):
-    """필터링된 볼린저 밴드 전략"""
+    """
+    필터링된 볼린저 밴드 전략
+
+    Args:
+        precomputed: precompute_indicators() 결과 (여러 설정 반복 시 재사용)
+    """
     
     print(f"\n🔍 필터링된 볼린저 밴드 전략 백테스팅")
     print(f"   - std_dev: {std_dev}")
@@ -76,147 +184,120 @@ def backtest_filtered_bb(
     print()
     
     # 지표 계산
-    ma20, upper, lower = calculate_bollinger_bands(candles, period=20, std_dev=std_dev)
-    ma240 = calculate_ma(candles, period=240)  # 4시간 이동평균
-    atr = calculate_atr(candles, period=14)
+    if precomputed is not None:
+        ma20 = precomputed['ma20']
+        upper = ma20 + (precomputed['std20'] * std_dev)
+        lower = ma20 - (precomputed['std20'] * std_dev)
+        ma240 = precomputed['ma240']
+        atr = precomputed['atr']
+        close_arr = precomputed['close']
+    else:
+        ma20, upper, lower = calculate_bollinger_bands(candles, period=20, std_dev=std_dev)
+        ma240 = calculate_ma(candles, period=240)  # 4시간 이동평균
+        atr = calculate_atr(candles, period=14)
+        
+        # 행 단위 iloc 접근 대신 배열 뷰 사용 (float64면 복사 없음)
+        close_arr = candles['close'].to_numpy(dtype=np.float64)
     
-    cash = initial_capital
-    position = 0.0
-    trades = []
-    entry_price = 0
-    last_trade_time = None
+    ts_arr = candles.index.values.astype('datetime64[ns]').view('i8')
     
-    min_minutes_between_trades = min_hours_between_trades * 60
+    (trade_type, trade_price, trade_amount, trade_profit, trade_idx,
+     cash, final_liquidation) = run_bb_backtest(
+        close_arr, upper, lower, ma240, atr, ts_arr,
+        min_hours_between_trades, atr_multiplier, initial_capital
+    )
+    k = len(trade_type)
     
-    for i in range(300, len(candles)):  # 충분한 데이터 이후부터
-        current_time = candles.iloc[i].name
-        price = candles.iloc[i]['close']
-        
-        # 시간 필터: 마지막 거래 후 충분한 시간 경과 확인
-        if last_trade_time is not None:
-            time_diff = (current_time - last_trade_time).total_seconds() / 60
-            if time_diff < min_minutes_between_trades:
-                continue
+    final_capital = cash
+    total_return = ((final_capital - initial_capital) / initial_capital) * 100
+    
+    # 거래 통계 (Structure-of-Arrays 마스크로 한 번에 집계)
+    sell_mask = trade_type == TRADE_SELL
+    sell_count = int(np.count_nonzero(sell_mask))
+    buy_count = k - sell_count
+    winning_count = int(np.count_nonzero(trade_profit[sell_mask] > 0))
+    
+    # 매수·매도가 번갈아 기록되므로 짝수 칸=매수, 홀수 칸=매도
+    buy_idx = trade_idx[0::2][:sell_count]
+    sell_idx = trade_idx[1::2]
+    holding_hours = (ts_arr[sell_idx] - ts_arr[buy_idx]) / 3.6e12
+    profit_pct = (trade_price[1::2] - trade_price[0::2][:sell_count]) / trade_price[0::2][:sell_count] * 100
+    
+    # 평균 보유 시간
+    avg_holding_time = np.mean(holding_hours)
+    
+    # 호출자용 거래 내역 (dict 리스트는 마지막에 한 번만 생성)
+    trades = []
+    for j in range(k):
+        i = trade_idx[j]
+        price = trade_price[j]
+        current_time = candles.index[i]
         
-        # 변동성 필터: ATR이 충분히 높은지 확인
-        # (가격의 일정 비율 이상의 변동성)
-        if np.isnan(atr[i]) or atr[i] < (price * atr_multiplier / 100):
+        if trade_type[j] == TRADE_BUY:
+            trades.append({
+                'type': 'buy',
+                'price': price,
+                'amount': trade_amount[j],
+                'timestamp': current_time,
+                'atr': atr[i],
+                'atr_pct': (atr[i] / price) * 100
+            })
+            
+            print(f"✅ 매수: {current_time} | "
+                  f"가격: {price:,.0f}원 | "
+                  f"ATR: {atr[i]:,.0f} ({(atr[i]/price)*100:.2f}%)")
             continue
         
-        # 매수 신호
-        if position == 0:
-            # 볼린저 밴드 하단 돌파
-            if price < lower[i] and not np.isnan(lower[i]):
-                # 추세 필터: 4시간 MA 아래에 있어야 함 (하락 추세)
-                if not np.isnan(ma240[i]) and price < ma240[i]:
-                    if cash > 0:
-                        amount = (cash * 0.99) / price
-                        fee = amount * price * 0.0005
-                        cost = amount * price + fee
-                        
-                        position = amount
-                        cash -= cost
-                        entry_price = price
-                        last_trade_time = current_time
-                        
-                        trades.append({
-                            'type': 'buy',
-                            'price': price,
-                            'amount': amount,
-                            'timestamp': current_time,
-                            'atr': atr[i],
-                            'atr_pct': (atr[i] / price) * 100
-                        })
-                        
-                        print(f"✅ 매수: {current_time} | "
-                              f"가격: {price:,.0f}원 | "
-                              f"ATR: {atr[i]:,.0f} ({(atr[i]/price)*100:.2f}%)")
-        
-        # 매도 신호
-        elif position > 0:
-            # 볼린저 밴드 상단 돌파
-            if price > upper[i] and not np.isnan(upper[i]):
-                # 추세 필터: 4시간 MA 위에 있어야 함 (상승 추세)
-                if not np.isnan(ma240[i]) and price > ma240[i]:
-                    proceeds = position * price
-                    fee = proceeds * 0.0005
-                    cash += proceeds - fee
-                    
-                    profit = (price - entry_price) * position - (amount * entry_price * 0.0005) - fee
-                    profit_pct = ((price - entry_price) / entry_price) * 100
-                    
-                    last_trade_time = current_time
-                    
-                    trades.append({
-                        'type': 'sell',
-                        'price': price,
-                        'amount': position,
-                        'profit': profit,
-                        'profit_pct': profit_pct,
-                        'timestamp': current_time,
-                        'holding_time': (current_time - trades[-1]['timestamp']).total_seconds() / 3600
-                    })
-                    
-                    print(f"✅ 매도: {current_time} | "
-                          f"가격: {price:,.0f}원 | "
-                          f"수익: {profit:,.0f}원 ({profit_pct:+.2f}%) | "
-                          f"보유: {trades[-1]['holding_time']:.1f}시간")
-                    
-                    position = 0.0
-                    entry_price = 0
-    
-    # 최종 청산
-    if position > 0:
-        final_price = candles.iloc[-1]['close']
-        final_time = candles.iloc[-1].name
-        
-        proceeds = position * final_price
-        fee = proceeds * 0.0005
-        cash += proceeds - fee
-        
-        profit = (final_price - entry_price) * position - (amount * entry_price * 0.0005) - fee
-        profit_pct = ((final_price - entry_price) / entry_price) * 100
-        
+        pair = j // 2
         trades.append({
             'type': 'sell',
-            'price': final_price,
-            'amount': position,
-            'profit': profit,
-            'profit_pct': profit_pct,
-            'timestamp': final_time,
-            'holding_time': (final_time - trades[-1]['timestamp']).total_seconds() / 3600,
-            'final_liquidation': True
+            'price': price,
+            'amount': trade_amount[j],
+            'profit': trade_profit[j],
+            'profit_pct': profit_pct[pair],
+            'timestamp': current_time,
+            'holding_time': holding_hours[pair]
         })
         
-        print(f"🔵 최종 청산: {final_time} | "
-              f"가격: {final_price:,.0f}원 | "
-              f"수익: {profit:,.0f}원 ({profit_pct:+.2f}%)")
-    
-    final_capital = cash
-    total_return = ((final_capital - initial_capital) / initial_capital) * 100
-    
-    buy_trades = [t for t in trades if t['type'] == 'buy']
-    sell_trades = [t for t in trades if t['type'] == 'sell']
-    winning_trades = [t for t in sell_trades if t.get('profit', 0) > 0]
-    
-    # 평균 보유 시간
-    avg_holding_time = np.mean([t['holding_time'] for t in sell_trades if 'holding_time' in t])
+        if final_liquidation and j == k - 1:
+            trades[-1]['final_liquidation'] = True
+            print(f"🔵 최종 청산: {current_time} | "
+                  f"가격: {price:,.0f}원 | "
+                  f"수익: {trade_profit[j]:,.0f}원 ({profit_pct[pair]:+.2f}%)")
+        else:
+            print(f"✅ 매도: {current_time} | "
+                  f"가격: {price:,.0f}원 | "
+                  f"수익: {trade_profit[j]:,.0f}원 ({profit_pct[pair]:+.2f}%) | "
+                  f"보유: {holding_hours[pair]:.1f}시간")
     
     return {
         'strategy': f'Filtered BB (std={std_dev}, wait={min_hours_between_trades}h)',
         'return': total_return,
-        'trades': len(trades),
-        'buy_count': len(buy_trades),
-        'sell_count': len(sell_trades),
-        'win_rate': (len(winning_trades) / len(sell_trades) * 100) if sell_trades else 0,
+        'trades': k,
+        'buy_count': buy_count,
+        'sell_count': sell_count,
+        'win_rate': (winning_count / sell_count * 100) if sell_count else 0,
         'final_capital': final_capital,
         'avg_holding_hours': avg_holding_time,
         'trade_list': trades
     }
 
 
-def test_multiple_configs(candles: pd.DataFrame):
-    """여러 설정 테스트"""
+def test_multiple_configs(
+    candles: pd.DataFrame,
+    dtype=np.float64,
+    symbol: Optional[str] = None,
+    use_cache: bool = False
+):
+    """
+    여러 설정 테스트
+
+    Args:
+        candles: 캔들 데이터
+        dtype: 지표 배열 타입 (np.float32로 대역폭 절감, precompute_indicators 참고)
+        symbol: 심볼 (지표 디스크 캐시 키)
+        use_cache: 지표 디스크 캐시 사용 여부
+    """
     
     configs = [
         # (std_dev, min_hours, atr_multiplier)
@@ -226,6 +307,9 @@ def test_multiple_configs(candles: pd.DataFrame):
         (3.5, 24, 0.6),   # 매우 보수적
     ]
     
+    # 설정과 무관한 지표(MA240, ATR, MA20/표준편차)는 한 번만 계산
+    indicators = precompute_indicators(candles, dtype=dtype, symbol=symbol, use_cache=use_cache)
+    
     results = []
     
     for std_dev, min_hours, atr_mult in configs:
@@ -233,7 +317,8 @@ def test_multiple_configs(candles: pd.DataFrame):
             candles,
             std_dev=std_dev,
             min_hours_between_trades=min_hours,
-            atr_multiplier=atr_mult
+            atr_multiplier=atr_mult,
+            precomputed=indicators
         )
         results.append(result)
     
@@ -247,6 +332,10 @@ def main():
     
     # 데이터 로드
     print("\n📊 1년치 데이터 로딩 중...")
+    # 데이터 수집에만 필요한 모듈은 지연 import (지표/백테스트 함수만 import할 때 비용 절감)
+    from datetime import datetime, timedelta
+    from core.historical_data import HistoricalDataFetcher
+    
     fetcher = HistoricalDataFetcher()
     
     end_date = datetime.now()
@@ -264,7 +353,7 @@ def main():
     print(f"   기간: {candles.index[0]} ~ {candles.index[-1]}")
     
     # 여러 설정 테스트
-    results = test_multiple_configs(candles)
+    results = test_multiple_configs(candles, symbol='KRW-BTC', use_cache=True)
     
     # 결과 출력
     print("\n" + "=" * 80)
@@ -273,14 +362,16 @@ def main():
     print(f"{'전략':<40} {'수익률':>10} {'거래수':>8} {'승률':>8} {'평균보유':>10}")
     print("-" * 80)
     
-    for result in sorted(results, key=lambda x: x['return'], reverse=True):
+    results_sorted = sorted(results, key=lambda x: x['return'], reverse=True)
+    
+    for result in results_sorted:
         print(f"{result['strategy']:<40} {result['return']:>9.2f}% "
               f"{result['trades']:>7}회 "
               f"{result['win_rate']:>7.1f}% "
               f"{result['avg_holding_hours']:>9.1f}h")
     
     # 최고 성과 전략의 거래 내역
-    best = max(results, key=lambda x: x['return'])
+    best = results_sorted[0]
     print("\n" + "=" * 80)
     print(f"🏆 최고 성과: {best['strategy']}")
     print(f"   수익률: {best['return']:.2f}%")
@@ -290,7 +381,9 @@ def main():
     
     # 거래 빈도 분석
     if best['buy_count'] > 0:
-        days = (candles.index[-1] - candles.index[0]).days
+        # Timedelta 대신 int64 나노초 차이로 일수 계산
+        ts = candles.index.values.astype('datetime64[ns]').view('i8')
+        days = int(ts[-1] - ts[0]) // 86_400_000_000_000
         trades_per_month = (best['buy_count'] / days) * 30
         print(f"   거래 빈도: 월 {trades_per_month:.1f}회")
     
@@ -8,12 +8,16 @@
 - XRP: std=2.0, wait=6h, atr=0.3 (기존 수익성 있음)
 """
 
+import asyncio
+import contextlib
+import io
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict
 import pandas as pd
 import numpy as np
-from core.historical_data import HistoricalDataFetcher
+from _backtest_kernel import rolling_mean, rolling_std, run_bb_backtest, TRADE_BUY, TRADE_SELL
 
 # 로깅 설정
 logging.basicConfig(
@@ -28,22 +32,28 @@ def calculate_atr(candles: pd.DataFrame, period: int = 14):
     low = candles['low'].values
     close = candles['close'].values
     
-    tr1 = high - low
-    tr2 = np.abs(high - np.roll(close, 1))
-    tr3 = np.abs(low - np.roll(close, 1))
+    # TR = max(high-low, |high-전일종가|, |low-전일종가|), 첫 값은 high-low
+    # 전일 종가는 close[:-1] 뷰로 참조하고 임시 버퍼 하나에 out=으로 기록
+    tr = high - low
+    tmp = np.empty_like(tr)
     
-    tr = np.maximum(tr1, np.maximum(tr2, tr3))
-    tr[0] = tr1[0]
+    np.subtract(high[1:], close[:-1], out=tmp[1:])
+    np.abs(tmp[1:], out=tmp[1:])
+    np.maximum(tr[1:], tmp[1:], out=tr[1:])
     
-    atr = pd.Series(tr).rolling(window=period).mean().values
+    np.subtract(low[1:], close[:-1], out=tmp[1:])
+    np.abs(tmp[1:], out=tmp[1:])
+    np.maximum(tr[1:], tmp[1:], out=tr[1:])
+    
+    atr = rolling_mean(tr, period)
     return atr
 
 
 def calculate_bollinger_bands(candles: pd.DataFrame, period: int = 20, std_dev: float = 2.0):
     """볼린저 밴드 계산"""
     closes = candles['close'].values
-    ma = pd.Series(closes).rolling(window=period).mean().values
-    std = pd.Series(closes).rolling(window=period).std().values
+    ma = rolling_mean(closes, period)
+    std = rolling_std(closes, period)
     upper = ma + (std * std_dev)
     lower = ma - (std * std_dev)
     return ma, upper, lower
@@ -52,7 +62,7 @@ def calculate_bollinger_bands(candles: pd.DataFrame, period: int = 20, std_dev:
 def calculate_ma(candles: pd.DataFrame, period: int = 240):
     """이동평균 계산"""
     closes = candles['close'].values
-    ma = pd.Series(closes).rolling(window=period).mean().values
+    ma = rolling_mean(closes, period)
     return ma
 
 
@@ -86,125 +96,130 @@ def backtest_coin_with_config(
     ma240 = calculate_ma(candles, period=240)
     atr = calculate_atr(candles, period=14)
     
-    cash = initial_capital
-    position = 0.0
-    trades = []
-    entry_price = 0
-    last_trade_time = None
-    
-    min_minutes_between_trades = config['wait_hours'] * 60
+    # 행 단위 iloc 접근 대신 배열 뷰 사용 (float64면 복사 없음)
+    close_arr = candles['close'].to_numpy(dtype=np.float64)
+    ts_arr = candles.index.values.astype('datetime64[ns]').view('i8')
     
-    for i in range(300, len(candles)):
-        current_time = candles.iloc[i].name
-        price = candles.iloc[i]['close']
-        
-        # 시간 필터
-        if last_trade_time is not None:
-            time_diff = (current_time - last_trade_time).total_seconds() / 60
-            if time_diff < min_minutes_between_trades:
-                continue
-        
-        # 변동성 필터
-        if np.isnan(atr[i]) or atr[i] < (price * config['atr_mult'] / 100):
-            continue
-        
-        # 매수 신호: 하단 밴드 아래 + 4시간 MA 아래 (하락 추세)
-        if position == 0:
-            if price < lower[i] and not np.isnan(lower[i]):
-                if not np.isnan(ma240[i]) and price < ma240[i]:
-                    if cash > 0:
-                        amount = (cash * 0.99) / price
-                        fee = amount * price * 0.0005
-                        cost = amount * price + fee
-                        
-                        position = amount
-                        cash -= cost
-                        entry_price = price
-                        last_trade_time = current_time
-                        
-                        trades.append({
-                            'type': 'buy',
-                            'price': price,
-                            'amount': amount,
-                            'timestamp': current_time
-                        })
-        
-        # 매도 신호: 상단 밴드 위 + 4시간 MA 위 (상승 추세)
-        elif position > 0:
-            if price > upper[i] and not np.isnan(upper[i]):
-                if not np.isnan(ma240[i]) and price > ma240[i]:
-                    proceeds = position * price
-                    fee = proceeds * 0.0005
-                    cash += proceeds - fee
-                    
-                    profit = (price - entry_price) * position - (trades[-1]['amount'] * entry_price * 0.0005) - fee
-                    profit_pct = ((price - entry_price) / entry_price) * 100
-                    
-                    last_trade_time = current_time
-                    
-                    trades.append({
-                        'type': 'sell',
-                        'price': price,
-                        'amount': position,
-                        'profit': profit,
-                        'profit_pct': profit_pct,
-                        'timestamp': current_time
-                    })
-                    
-                    position = 0.0
-                    entry_price = 0
-    
-    # 최종 청산
-    if position > 0:
-        final_price = candles.iloc[-1]['close']
-        final_time = candles.iloc[-1].name
-        
-        proceeds = position * final_price
-        fee = proceeds * 0.0005
-        cash += proceeds - fee
-        
-        profit = (final_price - entry_price) * position - (trades[-1]['amount'] * entry_price * 0.0005) - fee
-        profit_pct = ((final_price - entry_price) / entry_price) * 100
-        
-        trades.append({
-            'type': 'sell',
-            'price': final_price,
-            'amount': position,
-            'profit': profit,
-            'profit_pct': profit_pct,
-            'timestamp': final_time,
-            'final_liquidation': True
-        })
+    (trade_type, trade_price, trade_amount, trade_profit, trade_idx,
+     cash, final_liquidation) = run_bb_backtest(
+        close_arr, upper, lower, ma240, atr, ts_arr,
+        config['wait_hours'], config['atr_mult'], initial_capital
+    )
+    k = len(trade_type)
     
     final_capital = cash
     total_return = ((final_capital - initial_capital) / initial_capital) * 100
     
-    buy_trades = [t for t in trades if t['type'] == 'buy']
-    sell_trades = [t for t in trades if t['type'] == 'sell']
-    winning_trades = [t for t in sell_trades if t.get('profit', 0) > 0]
+    # 거래 통계 (Structure-of-Arrays 마스크로 한 번에 집계)
+    sell_mask = trade_type == TRADE_SELL
+    sell_count = int(np.count_nonzero(sell_mask))
+    buy_count = k - sell_count
+    winning_count = int(np.count_nonzero(trade_profit[sell_mask] > 0))
     
     print(f"\n  📊 결과:")
     print(f"     초기 자본: {initial_capital:,.0f}원")
     print(f"     최종 자본: {final_capital:,.0f}원")
     print(f"     수익률: {total_return:+.2f}%")
-    print(f"     거래 횟수: {len(trades)}회 (매수 {len(buy_trades)}회, 매도 {len(sell_trades)}회)")
-    if sell_trades:
-        print(f"     승률: {len(winning_trades)/len(sell_trades)*100:.1f}%")
+    print(f"     거래 횟수: {k}회 (매수 {buy_count}회, 매도 {sell_count}회)")
+    if sell_count:
+        print(f"     승률: {winning_count/sell_count*100:.1f}%")
+    
+    # 호출자용 거래 내역 (dict 리스트는 마지막에 한 번만 생성)
+    trades = []
+    for j in range(k):
+        price = trade_price[j]
+        current_time = candles.index[trade_idx[j]]
+        
+        if trade_type[j] == TRADE_BUY:
+            trades.append({
+                'type': 'buy',
+                'price': price,
+                'amount': trade_amount[j],
+                'timestamp': current_time
+            })
+        else:
+            buy_price = trades[-1]['price']
+            trades.append({
+                'type': 'sell',
+                'price': price,
+                'amount': trade_amount[j],
+                'profit': trade_profit[j],
+                'profit_pct': ((price - buy_price) / buy_price) * 100,
+                'timestamp': current_time
+            })
+    
+    if final_liquidation:
+        trades[-1]['final_liquidation'] = True
     
     return {
         'symbol': symbol,
         'initial_capital': initial_capital,
         'final_capital': final_capital,
         'return': total_return,
-        'trades': len(trades),
-        'buy_count': len(buy_trades),
-        'sell_count': len(sell_trades),
-        'win_rate': (len(winning_trades) / len(sell_trades) * 100) if sell_trades else 0,
+        'trades': k,
+        'buy_count': buy_count,
+        'sell_count': sell_count,
+        'win_rate': (winning_count / sell_count * 100) if sell_count else 0,
         'config': config,
         'trade_list': trades
     }
 
 
+async def _fetch_all(symbols, start_date: datetime, end_date: datetime):
+    """
+    여러 코인의 캔들 데이터를 동시에 수집
+
+    fetch_candles는 동기 API이므로 스레드로 넘겨 네트워크/디스크 I/O 대기를 겹칩니다.
+
+    Returns:
+        list: 심볼 순서대로 캔들 DataFrame 또는 수집 중 발생한 예외
+    """
+    # 데이터 수집에만 필요하므로 지연 import
+    from core.historical_data import HistoricalDataFetcher
+    
+    fetcher = HistoricalDataFetcher()
+    
+    return await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                fetcher.fetch_candles,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                interval='minute1',
+                use_cache=True
+            )
+            for symbol in symbols
+        ],
+        return_exceptions=True
+    )
+
+
+def _run_one(symbol: str, config: Dict, candles: pd.DataFrame):
+    """
+    워커 프로세스에서 단일 코인 백테스팅
+
+    워커 출력이 섞이지 않도록 로그는 문자열로 모아 반환합니다.
+
+    Returns:
+        tuple: (백테스팅 결과, 출력 로그)
+    """
+    log = io.StringIO()
+    
+    with contextlib.redirect_stdout(log):
+        print(f"   ✅ {len(candles):,}개 캔들 로드 완료")
+        
+        # 백테스팅 실행
+        result = backtest_coin_with_config(
+            symbol=symbol,
+            candles=candles,
+            config=config,
+            initial_capital=2000000
+        )
+    
+    return result, log.getvalue()
+
+
 def main():
     print("=" * 80)
     print("최종 3개 코인 포트폴리오 백테스팅")
@@ -244,33 +259,35 @@ def main():
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365)
     
-    fetcher = HistoricalDataFetcher()
+    # 데이터 수집 (I/O 대기이므로 코인별로 동시에 요청)
+    fetched = asyncio.run(_fetch_all(list(coin_configs), start_date, end_date))
+    candles_by_symbol = dict(zip(coin_configs, fetched))
     
-    # 각 코인별 백테스팅
+    # 각 코인별 백테스팅 (코인 간 공유 상태가 없으므로 프로세스 풀로 병렬 실행)
     results = []
     
-    for symbol, config in coin_configs.items():
+    with ProcessPoolExecutor(max_workers=len(coin_configs)) as executor:
+        futures = {
+            executor.submit(_run_one, symbol, config, candles_by_symbol[symbol]): symbol
+            for symbol, config in coin_configs.items()
+            if not isinstance(candles_by_symbol[symbol], BaseException)
+        }
+        
+        outcomes = {}
+        for future in as_completed(futures):
+            outcomes[futures[future]] = future
+    
+    # 출력은 코인 순서대로
+    for symbol in coin_configs:
         print(f"\n📊 {symbol} 데이터 로드 중...")
         
         try:
-            candles = fetcher.fetch_candles(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                interval='minute1',
-                use_cache=True
-            )
-            
-            print(f"   ✅ {len(candles):,}개 캔들 로드 완료")
-            
-            # 백테스팅 실행
-            result = backtest_coin_with_config(
-                symbol=symbol,
-                candles=candles,
-                config=config,
-                initial_capital=2000000
-            )
+            if symbol not in outcomes:
+                # 데이터 수집 단계에서 발생한 예외
+                raise candles_by_symbol[symbol]
             
+            result, log = outcomes[symbol].result()
+            print(log, end='')
             results.append(result)
             
         except Exception as e:
@@ -8,13 +8,17 @@ Advanced DCA Settings Dialog
 - JSON 파일로 설정 저장/로드
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Tuple
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QSpinBox, QDoubleSpinBox, QPushButton,
     QTableWidget, QTableWidgetItem, QGroupBox,
-    QHeaderView, QMessageBox, QCheckBox, QTabWidget
+    QHeaderView, QMessageBox, QCheckBox, QTabWidget, QStyledItemDelegate, QWidget
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QFont, QColor
 
 from gui.dca_config import (
@@ -23,6 +27,136 @@ from gui.dca_config import (
 )
 
 
+# 다단계 익절/손절 프리셋 행: (수익률/손실률 %, 매도비율 %) — 마지막 레벨은 전량 청산
+_TP_PRESET_ROWS: Tuple[Tuple[float, float], ...] = ((5.0, 30.0), (10.0, 50.0), (15.0, 100.0))
+_SL_PRESET_ROWS: Tuple[Tuple[float, float], ...] = ((10.0, 50.0), (20.0, 100.0))
+
+
+class _NumericDelegate(QStyledItemDelegate):
+    """
+    숫자 셀 편집 델리게이트
+
+    셀에는 숫자를 그대로 저장하고(EditRole) 표시만 형식 문자열로 바꿉니다.
+    편집기가 QDoubleSpinBox/QSpinBox이므로 숫자가 아닌 입력은 들어올 수 없습니다.
+    """
+
+    def __init__(self, minimum: float, maximum: float, decimals: int = 2,
+                 display_format: str = "{:.1f}", parent=None):
+        super().__init__(parent)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decimals = decimals  # 0이면 정수 편집기(QSpinBox)
+        self.display_format = display_format
+
+    def createEditor(self, parent, option, index):
+        if self.decimals == 0:
+            editor = QSpinBox(parent)
+        else:
+            editor = QDoubleSpinBox(parent)
+            editor.setDecimals(self.decimals)
+        editor.setRange(self.minimum, self.maximum)
+        editor.setAlignment(Qt.AlignCenter)
+        editor.setFrame(False)
+        return editor
+
+    def setEditorData(self, editor, index):
+        value = index.data(Qt.EditRole)
+        editor.setValue(value if isinstance(value, (int, float)) else 0)
+
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.EditRole)
+
+    def displayText(self, value, locale):
+        if isinstance(value, (int, float)):
+            return self.display_format.format(value)
+        return super().displayText(value, locale)
+
+
+@contextmanager
+def _blocked(*widgets):
+    """여러 위젯의 시그널을 한 번에 차단하고, 끝나면 이전 상태로 복원"""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
+
+@contextmanager
+def _batched(table):
+    """
+    테이블 일괄 수정 (시그널 차단 + 다시 그리기/컬럼 폭 계산은 수정이 끝난 뒤 한 번만)
+
+    수정 중에는 정렬을 끄고(행이 중간에 재배치되지 않도록)
+    컬럼 크기 모드를 Fixed로 고정했다가, 끝나면 원래 모드로 복원합니다.
+    """
+    header = table.horizontalHeader()
+    resize_modes = [header.sectionResizeMode(col) for col in range(table.columnCount())]
+    sorting = table.isSortingEnabled()
+
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    try:
+        with _blocked(table):
+            yield
+    finally:
+        for col, mode in enumerate(resize_modes):
+            header.setSectionResizeMode(col, mode)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+
+@lru_cache(maxsize=32)
+def _aggressive_weights(count: int) -> Tuple[float, ...]:
+    """공격형 프리셋 레벨별 비중 (후반 집중, 레벨 개수별 캐시)"""
+    total_weight = 100.0
+    accumulated_weight = 0.0
+    weights = [0.0] * count
+
+    # 비중 분모: 1² + 2² + … + count² (제곱합 공식)
+    denom = count * (count + 1) * (2 * count + 1) // 6
+
+    for i in range(count):
+        # 비중: 후반으로 갈수록 증가 (지수 분포)
+        if i == count - 1:
+            # 🔧 마지막 레벨: 나머지 비중 전부 할당 (100.0% 보장)
+            weight_pct = round(total_weight - accumulated_weight, 1)
+        else:
+            weight_ratio = (i + 1) ** 2 / denom
+            weight_pct = round(total_weight * weight_ratio, 1)
+            accumulated_weight += weight_pct
+        weights[i] = weight_pct
+
+    return tuple(weights)
+
+
+@lru_cache(maxsize=32)
+def _conservative_weights(count: int) -> Tuple[float, ...]:
+    """안정형 프리셋 레벨별 비중 (초반 집중, 레벨 개수별 캐시)"""
+    total_weight = 100.0
+    accumulated_weight = 0.0
+    weights = [0.0] * count
+
+    # 비중 분모: count² + … + 1² (순서만 반대인 같은 제곱합)
+    denom = count * (count + 1) * (2 * count + 1) // 6
+
+    for i in range(count):
+        # 비중: 초반으로 갈수록 증가 (역지수 분포)
+        if i == count - 1:
+            # 🔧 마지막 레벨: 나머지 비중 전부 할당 (100.0% 보장)
+            weight_pct = round(total_weight - accumulated_weight, 1)
+        else:
+            weight_ratio = (count - i) ** 2 / denom
+            weight_pct = round(total_weight * weight_ratio, 1)
+            accumulated_weight += weight_pct
+        weights[i] = weight_pct
+
+    return tuple(weights)
+
+
 class AdvancedDcaDialog(QDialog):
     """
     고급 DCA 설정 다이얼로그
@@ -33,9 +167,42 @@ class AdvancedDcaDialog(QDialog):
     # 설정 변경 시그널
     config_changed = Signal(AdvancedDcaConfig)
     
+    # 계산 컬럼 글자색 (셀마다 새로 만들지 않고 공유)
+    _COLOR_ENTRY = QColor(0, 100, 200)
+    _COLOR_QTY = QColor(0, 150, 0)
+    
+    # 셀 플래그 (셀마다 비트 연산하지 않도록 미리 계산)
+    _READONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    _EDITABLE_FLAGS = _READONLY_FLAGS | Qt.ItemIsEditable
+    
+    # 시뮬레이션 결과 표시 형식
+    _RESULT_TEMPLATE = (
+        "📊 DCA 전략 시뮬레이션\n"
+        "\n"
+        "💰 총 자산:        {total_capital:,.0f}원\n"
+        "💸 총 투자금:      {total_invested:,.0f}원\n"
+        "📊 총 비중:        {total_weight:.1f}%{weight_warning}\n"
+        "\n"
+        "📈 총 매수 수량:   {total_quantity:.8f} BTC\n"
+        "💵 평균 단가:      {avg_price:,.0f}원\n"
+        "\n"
+        "🎯 익절:           {take_profit}\n"
+        "🛑 손절:           {stop_loss}\n"
+        "\n"
+        "📉 최대 하락:      -{max_drop}%"
+    )
+    
+    # 공용 글꼴 (QApplication 생성 이후에 만들어야 하므로 첫 다이얼로그 생성 시 초기화)
+    _FONT_HEADER = None
+    _FONT_CONSOLAS_10 = None
+    _FONT_CONSOLAS_11 = None
+    _FONT_BOLD_11 = None
+    
     def __init__(self, parent=None, current_price: float = 100000000):
         super().__init__(parent)
         
+        self._init_shared_fonts()
+        
         self.current_price = current_price  # 현재가
         self.config_manager = DcaConfigManager()
         self.config = self.config_manager.load()
@@ -45,17 +212,41 @@ class AdvancedDcaDialog(QDialog):
         
         self._init_ui()
         self._load_config_to_ui()
-        self._update_simulation()
+        self._do_update_simulation()  # 첫 표시는 지연 없이
     
+    @classmethod
+    def _init_shared_fonts(cls):
+        """공용 글꼴 생성 (최초 1회)"""
+        if cls._FONT_HEADER is not None:
+            return
+
+        cls._FONT_HEADER = QFont("Consolas", 12, QFont.Bold)
+        cls._FONT_CONSOLAS_10 = QFont("Consolas", 10)
+        cls._FONT_CONSOLAS_11 = QFont("Consolas", 11)
+        cls._FONT_BOLD_11 = QFont("Arial", 11, QFont.Bold)
+
     def _init_ui(self):
         """UI 초기화"""
+        # 🔧 시뮬레이션 갱신 지연 타이머 (연속 편집은 50ms 안에 한 번으로 합침)
+        self._sim_timer = QTimer(self)
+        self._sim_timer.setSingleShot(True)
+        self._sim_timer.setInterval(50)
+        self._sim_timer.timeout.connect(self._do_update_simulation)
+
+        # 셀 아이템 원본 (가운데 정렬 + 편집 플래그를 미리 설정해 두고 복제해서 사용)
+        self._proto_editable = QTableWidgetItem()
+        self._proto_editable.setTextAlignment(Qt.AlignCenter)
+        self._proto_editable.setFlags(self._EDITABLE_FLAGS)
+        self._proto_readonly = self._proto_editable.clone()
+        self._proto_readonly.setFlags(self._READONLY_FLAGS)
+
         main_layout = QVBoxLayout(self)
 
         # 상단: 현재가 표시
         header_layout = QHBoxLayout()
 
         current_price_label = QLabel(f"📈 현재가: {self.current_price:,.0f}원")
-        current_price_label.setFont(QFont("Consolas", 12, QFont.Bold))
+        current_price_label.setFont(self._FONT_HEADER)
         header_layout.addWidget(current_price_label)
 
         header_layout.addStretch()
@@ -69,24 +260,25 @@ class AdvancedDcaDialog(QDialog):
         main_layout.addLayout(header_layout)
 
         # 탭 위젯 생성
-        tab_widget = QTabWidget()
+        self.tab_widget = QTabWidget()
 
         # 📊 매수 전략 탭
         buy_tab = self._create_buy_strategy_tab()
-        tab_widget.addTab(buy_tab, "📊 매수 전략")
+        self.tab_widget.addTab(buy_tab, "📊 매수 전략")
 
-        # 💰 매도 전략 탭
-        sell_tab = self._create_sell_strategy_tab()
-        tab_widget.addTab(sell_tab, "💰 매도 전략")
+        # 💰 매도 전략 탭 (처음 열 때 생성, 그 전까지는 빈 자리 표시 위젯)
+        self._sell_tab_built = False
+        self.tab_widget.addTab(QWidget(), "💰 매도 전략")
+        self.tab_widget.currentChanged.connect(self._maybe_build_sell_tab)
 
-        main_layout.addWidget(tab_widget)
+        main_layout.addWidget(self.tab_widget)
 
         # 하단: 시뮬레이션 결과
         result_group = QGroupBox("📊 시뮬레이션 결과")
         result_layout = QVBoxLayout()
         
         self.result_label = QLabel()
-        self.result_label.setFont(QFont("Consolas", 11))
+        self.result_label.setFont(self._FONT_CONSOLAS_11)
         self.result_label.setWordWrap(True)
         self.result_label.setStyleSheet("""
             background-color: #f0f0f0;
@@ -128,7 +320,7 @@ class AdvancedDcaDialog(QDialog):
 
         # 총 자산
         capital_label = QLabel("💰 총 투자 가능 자산:")
-        capital_label.setFont(QFont("Arial", 11, QFont.Bold))
+        capital_label.setFont(self._FONT_BOLD_11)
         capital_layout.addWidget(capital_label)
 
         self.total_capital_spin = QSpinBox()
@@ -136,7 +328,7 @@ class AdvancedDcaDialog(QDialog):
         self.total_capital_spin.setValue(self.config.total_capital)
         self.total_capital_spin.setSuffix(" 원")
         self.total_capital_spin.setSingleStep(5000)
-        self.total_capital_spin.setFont(QFont("Consolas", 11))
+        self.total_capital_spin.setFont(self._FONT_CONSOLAS_11)
         self.total_capital_spin.setToolTip("비중(%) ↔ 금액(원) 계산 기준")
         self.total_capital_spin.valueChanged.connect(self._on_total_capital_changed)
         capital_layout.addWidget(self.total_capital_spin)
@@ -145,14 +337,14 @@ class AdvancedDcaDialog(QDialog):
 
         # 레벨 개수 선택
         level_count_label = QLabel("📊 DCA 레벨 개수:")
-        level_count_label.setFont(QFont("Arial", 11, QFont.Bold))
+        level_count_label.setFont(self._FONT_BOLD_11)
         capital_layout.addWidget(level_count_label)
 
         self.level_count_spin = QSpinBox()
         self.level_count_spin.setRange(1, 10)  # 1~10단계
         self.level_count_spin.setValue(len(self.config.levels))
         self.level_count_spin.setSuffix(" 단계")
-        self.level_count_spin.setFont(QFont("Consolas", 11))
+        self.level_count_spin.setFont(self._FONT_CONSOLAS_11)
         self.level_count_spin.setToolTip("DCA 분할 매수 단계 개수 (1~10)")
         self.level_count_spin.valueChanged.connect(self._on_level_count_changed)
         capital_layout.addWidget(self.level_count_spin)
@@ -177,10 +369,20 @@ class AdvancedDcaDialog(QDialog):
         ])
 
         # 컬럼 크기 조정
-        header = self.dca_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
+        self._set_column_resize_modes(self.dca_table)
+
+        self.dca_table.setFont(self._FONT_CONSOLAS_10)
+
+        # 편집 컬럼은 숫자 편집기 사용 (하락률, 비중, 금액)
+        self._drop_delegate = _NumericDelegate(0.0, 99.99, parent=self.dca_table)
+        # (금액을 직접 입력하면 비중이 100%를 넘을 수 있으므로 비중 상한은 넉넉하게)
+        self._weight_delegate = _NumericDelegate(0.0, 1000000.0, parent=self.dca_table)
+        self._amount_delegate = _NumericDelegate(0, 1000000000, decimals=0,
+                                                 display_format="{:,}", parent=self.dca_table)
+        self.dca_table.setItemDelegateForColumn(1, self._drop_delegate)
+        self.dca_table.setItemDelegateForColumn(2, self._weight_delegate)
+        self.dca_table.setItemDelegateForColumn(3, self._amount_delegate)
 
-        self.dca_table.setFont(QFont("Consolas", 10))
         self.dca_table.cellChanged.connect(self._on_table_changed)
 
         table_layout.addWidget(self.dca_table)
@@ -228,10 +430,16 @@ class AdvancedDcaDialog(QDialog):
         self.tp_table.setRowCount(len(self.config.take_profit_levels) if self.config.is_multi_level_tp_enabled() else 1)
         self.tp_table.setColumnCount(3)
         self.tp_table.setHorizontalHeaderLabels(["레벨", "수익률 (%)", "매도비율 (%, 남은 수량 기준)"])
-        self.tp_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.tp_table.setFont(QFont("Consolas", 10))
+        self._set_column_resize_modes(self.tp_table)
+        self.tp_table.setFont(self._FONT_CONSOLAS_10)
         self.tp_table.setToolTip("각 레벨에서 현재 남은 보유량의 N%를 매도합니다.\n예: 1 BTC 보유 → L1(30%) → 0.7 BTC 남음 → L2(50%) → 0.35 BTC 남음")
+        # 수익률/매도비율은 숫자 편집기 사용 (셀에 숫자를 그대로 저장)
+        self._tp_pct_delegate = _NumericDelegate(0.0, 1000.0, parent=self.tp_table)
+        self._tp_ratio_delegate = _NumericDelegate(0.0, 100.0, parent=self.tp_table)
+        self.tp_table.setItemDelegateForColumn(1, self._tp_pct_delegate)
+        self.tp_table.setItemDelegateForColumn(2, self._tp_ratio_delegate)
         self.tp_table.cellChanged.connect(self._on_tp_table_changed)
+        self._tp_item_pool = []  # 삭제된 행 아이템 (레벨 추가 시 재사용)
         tp_layout.addWidget(self.tp_table)
 
         # 익절 버튼
@@ -262,10 +470,16 @@ class AdvancedDcaDialog(QDialog):
         self.sl_table.setRowCount(len(self.config.stop_loss_levels) if self.config.is_multi_level_sl_enabled() else 1)
         self.sl_table.setColumnCount(3)
         self.sl_table.setHorizontalHeaderLabels(["레벨", "손실률 (%)", "매도비율 (%, 남은 수량 기준)"])
-        self.sl_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.sl_table.setFont(QFont("Consolas", 10))
+        self._set_column_resize_modes(self.sl_table)
+        self.sl_table.setFont(self._FONT_CONSOLAS_10)
         self.sl_table.setToolTip("각 레벨에서 현재 남은 보유량의 N%를 매도합니다.\n예: 1 BTC 보유 → L1(50%) → 0.5 BTC 남음 → L2(100%) → 전량 청산")
+        # 손실률/매도비율은 숫자 편집기 사용 (셀에 숫자를 그대로 저장)
+        self._sl_pct_delegate = _NumericDelegate(0.0, 100.0, parent=self.sl_table)
+        self._sl_ratio_delegate = _NumericDelegate(0.0, 100.0, parent=self.sl_table)
+        self.sl_table.setItemDelegateForColumn(1, self._sl_pct_delegate)
+        self.sl_table.setItemDelegateForColumn(2, self._sl_ratio_delegate)
         self.sl_table.cellChanged.connect(self._on_sl_table_changed)
+        self._sl_item_pool = []  # 삭제된 행 아이템 (레벨 추가 시 재사용)
         sl_layout.addWidget(self.sl_table)
 
         # 손절 버튼
@@ -292,56 +506,136 @@ class AdvancedDcaDialog(QDialog):
         tab.setLayout(layout)
         return tab
 
+    @staticmethod
+    def _set_column_resize_modes(table: QTableWidget):
+        """
+        컬럼 크기 모드 설정
+
+        전체 Stretch는 셀이 바뀔 때마다 모든 컬럼 폭을 다시 나누므로,
+        마지막 컬럼만 남은 폭을 채우고 나머지는 내용 크기에 맞춥니다.
+        """
+        header = table.horizontalHeader()
+        last = table.columnCount() - 1
+        for col in range(last):
+            header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(last, QHeaderView.Stretch)
+
+    def _maybe_build_sell_tab(self, index: int):
+        """매도 전략 탭을 처음 선택했을 때 실제 탭 생성 + 익절/손절 테이블 로드"""
+        if self._sell_tab_built or index != 1:
+            return
+
+        # 탭 교체 중 currentChanged 재진입 방지를 위해 플래그 먼저 설정
+        self._sell_tab_built = True
+        sell_tab = self._create_sell_strategy_tab()
+
+        with _blocked(self.tab_widget):
+            placeholder = self.tab_widget.widget(1)
+            self.tab_widget.removeTab(1)
+            placeholder.deleteLater()
+            self.tab_widget.insertTab(1, sell_tab, "💰 매도 전략")
+            self.tab_widget.setCurrentIndex(1)
+
+        with _blocked(self.tp_table, self.sl_table):
+            self._load_tp_table()
+            self._load_sl_table()
+
+    def _set_cell(self, table: QTableWidget, row: int, col: int, value,
+                  editable: bool = True, color: QColor = None) -> QTableWidgetItem:
+        """
+        셀 값 설정
+
+        value가 문자열이면 그대로 표시하고, 숫자면 숫자로 저장합니다
+        (표시 형식은 컬럼 델리게이트가 지정).
+        이미 아이템이 있으면 새로 만들지 않고 값만 바꿉니다.
+        (재로드 시 셀마다 아이템을 다시 생성/교체하지 않도록)
+        """
+        item = table.item(row, col)
+
+        if item is None:
+            item = (self._proto_editable if editable else self._proto_readonly).clone()
+            item.setData(Qt.EditRole, value)
+            if color is not None:
+                item.setForeground(color)
+            table.setItem(row, col, item)
+            return item
+
+        item.setData(Qt.EditRole, value)
+        flags = self._EDITABLE_FLAGS if editable else self._READONLY_FLAGS
+        if item.flags() != flags:
+            item.setFlags(flags)
+        return item
+
     def _load_config_to_ui(self):
-        """설정을 UI에 로드"""
-        # DCA 테이블 업데이트 방지
-        self.dca_table.blockSignals(True)
+        """설정을 UI에 로드 (로드 중에는 모든 입력 위젯의 시그널을 한꺼번에 차단)"""
+        widgets = [self.dca_table, self.total_capital_spin,
+                   self.level_count_spin, self.enabled_checkbox]
+        if self._sell_tab_built:
+            widgets += [self.tp_table, self.sl_table]
+
+        # 다단계 익절/손절 여부 (설정이 바뀔 때만 갱신, 시뮬레이션 갱신마다 재확인하지 않음)
+        self._refresh_multi_level_flags()
+
+        with _blocked(*widgets):
+            # 상단 입력값 (기본값 복원처럼 설정이 통째로 바뀐 경우 동기화)
+            level_count = len(self.config.levels)
+            self.enabled_checkbox.setChecked(self.config.enabled)
+            self.total_capital_spin.setValue(self.config.total_capital)
+            self.level_count_spin.setValue(level_count)
+            self.table_group.setTitle(f"📊 DCA 레벨 설정 ({level_count}단계)")
+            self.dca_table.setRowCount(level_count)
+
+            # DCA 테이블 로드
+            self._reload_dca_table_only()
+
+            # 매도 전략 탭을 아직 열지 않았으면 탭 생성 시 로드
+            if self._sell_tab_built:
+                # 익절 테이블 로드
+                self._load_tp_table()
+
+                # 손절 테이블 로드
+                self._load_sl_table()
+
+    def _refresh_multi_level_flags(self):
+        """다단계 익절/손절 사용 여부 캐시 갱신"""
+        self._multi_tp = self.config.is_multi_level_tp_enabled()
+        self._multi_sl = self.config.is_multi_level_sl_enabled()
+
+    def _reload_dca_table_only(self):
+        """DCA 레벨 테이블만 로드 (익절/손절 테이블은 그대로 유지)"""
+        # DCA 테이블 업데이트 방지 (시그널 + 다시 그리기를 로드 후 한 번에)
+        with _batched(self.dca_table):
+            for i, level_config in enumerate(self.config.levels):
+                # 레벨 (읽기 전용)
+                self._set_cell(self.dca_table, i, 0, f"{level_config.level}", editable=False)
 
-        for i, level_config in enumerate(self.config.levels):
-            # 레벨 (읽기 전용)
-            level_item = QTableWidgetItem(f"{level_config.level}")
-            level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-            level_item.setTextAlignment(Qt.AlignCenter)
-            self.dca_table.setItem(i, 0, level_item)
-
-            # 하락률
-            drop_item = QTableWidgetItem(f"{level_config.drop_pct:.1f}")
-            drop_item.setTextAlignment(Qt.AlignCenter)
-            self.dca_table.setItem(i, 1, drop_item)
-
-            # 매수 비중
-            weight_item = QTableWidgetItem(f"{level_config.weight_pct:.1f}")
-            weight_item.setTextAlignment(Qt.AlignCenter)
-            self.dca_table.setItem(i, 2, weight_item)
-
-            # 주문 금액
-            amount_item = QTableWidgetItem(f"{level_config.order_amount}")
-            amount_item.setTextAlignment(Qt.AlignCenter)
-            self.dca_table.setItem(i, 3, amount_item)
-
-            # 진입가 (계산, 읽기 전용)
-            entry_price = self.current_price * (1 - level_config.drop_pct / 100)
-            entry_item = QTableWidgetItem(f"{entry_price:,.0f}")
-            entry_item.setFlags(entry_item.flags() & ~Qt.ItemIsEditable)
-            entry_item.setTextAlignment(Qt.AlignCenter)
-            entry_item.setForeground(QColor(0, 100, 200))
-            self.dca_table.setItem(i, 4, entry_item)
-
-            # 예상 수량 (계산, 읽기 전용)
-            quantity = level_config.order_amount / entry_price
-            quantity_item = QTableWidgetItem(f"{quantity:.8f}")
-            quantity_item.setFlags(quantity_item.flags() & ~Qt.ItemIsEditable)
-            quantity_item.setTextAlignment(Qt.AlignCenter)
-            quantity_item.setForeground(QColor(0, 150, 0))
-            self.dca_table.setItem(i, 5, quantity_item)
-
-        self.dca_table.blockSignals(False)
-
-        # 익절 테이블 로드
-        self._load_tp_table()
-
-        # 손절 테이블 로드
-        self._load_sl_table()
+                # 하락률
+                self._set_cell(self.dca_table, i, 1, float(level_config.drop_pct))
+
+                # 매수 비중
+                self._set_cell(self.dca_table, i, 2, float(level_config.weight_pct))
+
+                # 주문 금액
+                self._set_cell(self.dca_table, i, 3, int(level_config.order_amount))
+
+            # 진입가/예상 수량 (계산, 읽기 전용)
+            self._update_all_calculated_columns()
+
+        # 레벨 목록이 새로 로드되었으므로 총 비중 합계 재계산
+        self._recalculate_total_weight()
+
+    def _recalculate_total_weight(self):
+        """
+        총 비중 합계 전체 재계산
+
+        셀 편집 시에는 변경분만 반영하고(_adjust_total_weight),
+        레벨 목록 자체가 바뀔 때만 전체를 다시 합산합니다.
+        """
+        self._total_weight_cache = round(sum(level.weight_pct for level in self.config.levels), 6)
+
+    def _adjust_total_weight(self, old_weight: float, new_weight: float):
+        """총 비중 합계에 한 레벨의 변경분 반영 (누적 오차는 반올림으로 제거)"""
+        self._total_weight_cache = round(self._total_weight_cache + new_weight - old_weight, 6)
     
     def _on_table_changed(self, row: int, col: int):
         """테이블 셀 변경 시"""
@@ -349,19 +643,30 @@ class AdvancedDcaDialog(QDialog):
         if col not in [1, 2, 3]:
             return
 
-        try:
-            # 시그널 블록 (무한 루프 방지)
-            self.dca_table.blockSignals(True)
-
-            item = self.dca_table.item(row, col)
-            value = float(item.text().replace(',', ''))
+        # 시그널 블록 (무한 루프 방지, 예외가 나도 블록 해제)
+        with _blocked(self.dca_table):
+            # 숫자 델리게이트가 숫자로 저장하지만, 델리게이트를 거치지 않은 셀은 값이 없을 수 있음
+            try:
+                value = float(self.dca_table.item(row, col).data(Qt.EditRole))
+            except (TypeError, ValueError):
+                return
 
             level_config = self.config.levels[row]
 
+            # 값이 그대로면 (편집 없이 셀을 빠져나온 경우 등) 재계산 생략
+            current = {
+                1: level_config.drop_pct,
+                2: level_config.weight_pct,
+                3: float(level_config.order_amount),
+            }[col]
+            if value == current:
+                return
+
             if col == 1:  # 하락률
                 level_config.drop_pct = value
 
             elif col == 2:  # 매수 비중 변경 → 금액 자동 계산
+                self._adjust_total_weight(level_config.weight_pct, value)
                 level_config.weight_pct = value
 
                 # 🔧 비중 → 금액 계산
@@ -369,8 +674,7 @@ class AdvancedDcaDialog(QDialog):
                 level_config.order_amount = calculated_amount
 
                 # 금액 컬럼 업데이트
-                amount_item = self.dca_table.item(row, 3)
-                amount_item.setText(f"{calculated_amount:,}")
+                self.dca_table.item(row, 3).setData(Qt.EditRole, calculated_amount)
 
             elif col == 3:  # 주문 금액 변경 → 비중 자동 계산
                 order_amount = int(value)
@@ -378,22 +682,15 @@ class AdvancedDcaDialog(QDialog):
 
                 # 🔧 금액 → 비중 계산
                 calculated_weight = self.config.calculate_weight_from_amount(order_amount)
+                self._adjust_total_weight(level_config.weight_pct, calculated_weight)
                 level_config.weight_pct = calculated_weight
 
                 # 비중 컬럼 업데이트
-                weight_item = self.dca_table.item(row, 2)
-                weight_item.setText(f"{calculated_weight:.1f}")
+                self.dca_table.item(row, 2).setData(Qt.EditRole, calculated_weight)
 
             # 진입가/수량 재계산
             self._update_calculated_columns(row)
             self._update_simulation()
-
-            # 시그널 재활성화
-            self.dca_table.blockSignals(False)
-
-        except ValueError:
-            self.dca_table.blockSignals(False)
-            pass
     
     def _update_calculated_columns(self, row: int):
         """진입가/수량 컬럼 재계산"""
@@ -409,38 +706,58 @@ class AdvancedDcaDialog(QDialog):
         quantity_item = self.dca_table.item(row, 5)
         quantity_item.setText(f"{quantity:.8f}")
     
-    def _update_simulation(self):
-        """시뮬레이션 결과 업데이트"""
-        # 목표가 계산
-        targets = self.config.calculate_targets(self.current_price)
-
-        # 총 비중 합계 계산
-        total_weight = sum(level.weight_pct for level in self.config.levels)
+    def _update_all_calculated_columns(self):
+        """
+        모든 레벨의 진입가/수량 컬럼 재계산
 
-        # 결과 표시
-        result_text = f"""
-📊 DCA 전략 시뮬레이션
+        레벨 값을 열(하락률, 금액) 배열로 받아 한 번에 계산한 뒤 셀에 기록합니다.
+        """
+        drops, amounts = self.config.get_level_arrays()
 
-💰 총 자산:        {self.config.total_capital:,.0f}원
-💸 총 투자금:      {targets['total_invested']:,.0f}원
-📊 총 비중:        {total_weight:.1f}%"""
+        # 하락률 100%면 진입가가 0 - 행 단위 계산과 같이 ZeroDivisionError (inf를 표시하지 않음)
+        if (drops == 100).any():
+            raise ZeroDivisionError("float division by zero")
 
-        # 비중 초과 경고
-        if total_weight > 100:
-            result_text += f" ⚠️ (초과!)"
+        entry_prices = self.current_price * (1 - drops / 100)
+        quantities = amounts / entry_prices
 
-        result_text += f"""
+        # 루프 안에서 반복되는 속성 조회를 지역 변수로 미리 바인딩
+        set_cell = self._set_cell
+        table = self.dca_table
+        color_entry = self._COLOR_ENTRY
+        color_qty = self._COLOR_QTY
 
-📈 총 매수 수량:   {targets['total_quantity']:.8f} BTC
-💵 평균 단가:      {targets['avg_price']:,.0f}원
+        for i, (entry_price, quantity) in enumerate(zip(entry_prices.tolist(), quantities.tolist())):
+            # 진입가
+            set_cell(table, i, 4, f"{entry_price:,.0f}", editable=False, color=color_entry)
 
-🎯 익절:           {"다단계" if self.config.is_multi_level_tp_enabled() else f"{self.config.take_profit_pct}%"}
-🛑 손절:           {"다단계" if self.config.is_multi_level_sl_enabled() else f"{self.config.stop_loss_pct}%"}
+            # 예상 수량
+            set_cell(table, i, 5, f"{quantity:.8f}", editable=False, color=color_qty)
+    
+    def _update_simulation(self):
+        """시뮬레이션 결과 업데이트 예약 (타이머 재시작)"""
+        self._sim_timer.start()
 
-📉 최대 하락:      -{self.config.levels[-1].drop_pct}%
-        """.strip()
+    def _do_update_simulation(self):
+        """시뮬레이션 결과 업데이트"""
+        # 목표가 계산
+        targets = self.config.calculate_targets(self.current_price)
 
-        self.result_label.setText(result_text)
+        # 총 비중 합계 (편집 시 변경분만 반영된 값)
+        total_weight = self._total_weight_cache
+
+        # 결과 표시 (템플릿 한 번 포맷)
+        self.result_label.setText(self._RESULT_TEMPLATE.format(
+            total_capital=self.config.total_capital,
+            total_invested=targets.total_invested,
+            total_weight=total_weight,
+            weight_warning=" ⚠️ (초과!)" if total_weight > 100 else "",  # 비중 초과 경고
+            total_quantity=targets.total_quantity,
+            avg_price=targets.avg_price,
+            take_profit="다단계" if self._multi_tp else f"{self.config.take_profit_pct}%",
+            stop_loss="다단계" if self._multi_sl else f"{self.config.stop_loss_pct}%",
+            max_drop=self.config.levels[-1].drop_pct
+        ))
     
     def _on_level_count_changed(self, count: int):
         """레벨 개수 변경 시"""
@@ -477,32 +794,27 @@ class AdvancedDcaDialog(QDialog):
         self.dca_table.setRowCount(count)
         self.table_group.setTitle(f"📊 DCA 레벨 설정 ({count}단계)")
 
-        # UI 재로드
-        self._load_config_to_ui()
+        # DCA 테이블만 재로드 (레벨 개수는 익절/손절 테이블과 무관)
+        self._reload_dca_table_only()
         self._update_simulation()
 
     def _on_total_capital_changed(self, value: int):
         """총 자산 변경 시 모든 금액 재계산"""
         self.config.total_capital = value
 
-        # 시그널 블록
-        self.dca_table.blockSignals(True)
-
-        # 각 레벨의 금액을 비중 기준으로 재계산
-        for i, level_config in enumerate(self.config.levels):
-            # 비중을 기준으로 금액 재계산
-            calculated_amount = self.config.calculate_amount_from_weight(level_config.weight_pct)
-            level_config.order_amount = calculated_amount
-
-            # 테이블 업데이트
-            amount_item = self.dca_table.item(i, 3)
-            amount_item.setText(f"{calculated_amount:,}")
+        # 시그널 블록 + 다시 그리기는 갱신 후 한 번만
+        with _batched(self.dca_table):
+            # 각 레벨의 금액을 비중 기준으로 재계산
+            for i, level_config in enumerate(self.config.levels):
+                # 비중을 기준으로 금액 재계산
+                calculated_amount = self.config.calculate_amount_from_weight(level_config.weight_pct)
+                level_config.order_amount = calculated_amount
 
-            # 진입가/수량도 재계산
-            self._update_calculated_columns(i)
+                # 테이블 업데이트
+                self.dca_table.item(i, 3).setData(Qt.EditRole, calculated_amount)
 
-        # 시그널 재활성화
-        self.dca_table.blockSignals(False)
+            # 진입가/수량은 전체 열을 한 번에 재계산
+            self._update_all_calculated_columns()
 
         # 시뮬레이션 업데이트
         self._update_simulation()
@@ -528,11 +840,11 @@ class AdvancedDcaDialog(QDialog):
             levels = self._generate_conservative_preset(level_count)
 
         self.config.levels = levels
-        self._load_config_to_ui()
+        self._reload_dca_table_only()
         self._update_simulation()
 
-        # 총 비중 합계
-        total_weight = sum(level.weight_pct for level in levels)
+        # 총 비중 합계 (_reload_dca_table_only에서 재계산됨)
+        total_weight = self._total_weight_cache
 
         QMessageBox.information(
             self,
@@ -545,32 +857,27 @@ class AdvancedDcaDialog(QDialog):
 
     def _generate_aggressive_preset(self, count: int) -> list:
         """공격형 프리셋 생성 (후반 집중)"""
-        levels = []
-        total_weight = 100.0
-        accumulated_weight = 0.0
+        levels = [None] * count
+        amount_from_weight = self.config.calculate_amount_from_weight
+        weights = _aggressive_weights(count)
 
         for i in range(count):
             level = i + 1
             # 하락률: 0%, 5%, 10%, 20%, 30% ...
             drop_pct = 0.0 if i == 0 else (5.0 * i if i <= 2 else 10.0 * i)
 
-            # 비중: 후반으로 갈수록 증가 (지수 분포)
-            if i == count - 1:
-                # 🔧 마지막 레벨: 나머지 비중 전부 할당 (100.0% 보장)
-                weight_pct = round(total_weight - accumulated_weight, 1)
-            else:
-                weight_ratio = (i + 1) ** 2 / sum((j + 1) ** 2 for j in range(count))
-                weight_pct = round(total_weight * weight_ratio, 1)
-                accumulated_weight += weight_pct
+            # 비중: 후반으로 갈수록 증가 (레벨 개수별 캐시)
+            weight_pct = weights[i]
 
-            order_amount = self.config.calculate_amount_from_weight(weight_pct)
-            levels.append(DcaLevelConfig(level, drop_pct, weight_pct, order_amount))
+            order_amount = amount_from_weight(weight_pct)
+            levels[i] = DcaLevelConfig(level, drop_pct, weight_pct, order_amount)
 
         return levels
 
     def _generate_balanced_preset(self, count: int) -> list:
         """균형형 프리셋 생성 (균등 분배)"""
-        levels = []
+        levels = [None] * count
+        amount_from_weight = self.config.calculate_amount_from_weight
         total_weight = 100.0
         weight_per_level = round(100.0 / count, 1)
         accumulated_weight = 0.0
@@ -587,33 +894,27 @@ class AdvancedDcaDialog(QDialog):
                 weight_pct = weight_per_level
                 accumulated_weight += weight_pct
 
-            order_amount = self.config.calculate_amount_from_weight(weight_pct)
-            levels.append(DcaLevelConfig(level, drop_pct, weight_pct, order_amount))
+            order_amount = amount_from_weight(weight_pct)
+            levels[i] = DcaLevelConfig(level, drop_pct, weight_pct, order_amount)
 
         return levels
 
     def _generate_conservative_preset(self, count: int) -> list:
         """안정형 프리셋 생성 (초반 집중)"""
-        levels = []
-        total_weight = 100.0
-        accumulated_weight = 0.0
+        levels = [None] * count
+        amount_from_weight = self.config.calculate_amount_from_weight
+        weights = _conservative_weights(count)
 
         for i in range(count):
             level = i + 1
             # 하락률: 0%, 3%, 6%, 10%, 15% ...
             drop_pct = 0.0 if i == 0 else (3.0 * i if i <= 2 else 5.0 * (i - 1))
 
-            # 비중: 초반으로 갈수록 증가 (역지수 분포)
-            if i == count - 1:
-                # 🔧 마지막 레벨: 나머지 비중 전부 할당 (100.0% 보장)
-                weight_pct = round(total_weight - accumulated_weight, 1)
-            else:
-                weight_ratio = (count - i) ** 2 / sum((count - j) ** 2 for j in range(count))
-                weight_pct = round(total_weight * weight_ratio, 1)
-                accumulated_weight += weight_pct
+            # 비중: 초반으로 갈수록 증가 (레벨 개수별 캐시)
+            weight_pct = weights[i]
 
-            order_amount = self.config.calculate_amount_from_weight(weight_pct)
-            levels.append(DcaLevelConfig(level, drop_pct, weight_pct, order_amount))
+            order_amount = amount_from_weight(weight_pct)
+            levels[i] = DcaLevelConfig(level, drop_pct, weight_pct, order_amount)
 
         return levels
     
@@ -628,7 +929,8 @@ class AdvancedDcaDialog(QDialog):
 
         if reply == QMessageBox.Yes:
             self.config = self.config_manager.create_default_config()
-            self.enabled_checkbox.setChecked(self.config.enabled)
+
+            # 총 자산/레벨 개수/활성화 위젯까지 시그널 없이 한 번에 동기화
             self._load_config_to_ui()
             self._update_simulation()
     
@@ -637,17 +939,16 @@ class AdvancedDcaDialog(QDialog):
         # 테이블에서 최신 값 읽기 (현재 레벨 개수만큼)
         level_count = len(self.config.levels)
 
+        # 모든 레벨을 먼저 변환한 뒤 반영 (잘못된 값이 있으면 설정을 건드리지 않음)
+        values = []
         for i in range(level_count):
             try:
-                drop_pct = float(self.dca_table.item(i, 1).text())
-                weight_pct = float(self.dca_table.item(i, 2).text())
-                order_amount = int(self.dca_table.item(i, 3).text().replace(',', ''))
-
-                self.config.levels[i].drop_pct = drop_pct
-                self.config.levels[i].weight_pct = weight_pct
-                self.config.levels[i].order_amount = order_amount
-
-            except ValueError:
+                values.append((
+                    float(self.dca_table.item(i, 1).data(Qt.EditRole)),
+                    float(self.dca_table.item(i, 2).data(Qt.EditRole)),
+                    int(self.dca_table.item(i, 3).data(Qt.EditRole)),
+                ))
+            except (TypeError, ValueError):
                 QMessageBox.warning(
                     self,
                     "입력 오류",
@@ -655,18 +956,26 @@ class AdvancedDcaDialog(QDialog):
                 )
                 return
 
+        for level_config, (drop_pct, weight_pct, order_amount) in zip(self.config.levels, values):
+            level_config.drop_pct = drop_pct
+            level_config.weight_pct = weight_pct
+            level_config.order_amount = order_amount
+
         # 총 자산
         self.config.total_capital = self.total_capital_spin.value()
 
         # DCA 활성화
         self.config.enabled = self.enabled_checkbox.isChecked()
 
-        # 익절/손절 테이블 저장
-        self._save_tp_table()
-        self._save_sl_table()
+        # 익절/손절 테이블 저장 (탭을 열지 않았으면 불러온 설정 그대로 유지)
+        if self._sell_tab_built:
+            self._save_tp_table()
+            self._save_sl_table()
+            self._refresh_multi_level_flags()
 
-        # 🔧 검증: 총 비중 합계 경고
-        total_weight = sum(level.weight_pct for level in self.config.levels)
+        # 🔧 검증: 총 비중 합계 경고 (테이블에서 다시 읽었으므로 전체 재계산)
+        self._recalculate_total_weight()
+        total_weight = self._total_weight_cache
         if total_weight > 100:
             reply = QMessageBox.warning(
                 self,
@@ -702,97 +1011,53 @@ class AdvancedDcaDialog(QDialog):
 
     def _load_tp_table(self):
         """익절 테이블 로드"""
-        self.tp_table.blockSignals(True)
-
         if self.config.is_multi_level_tp_enabled():
             # 다단계 익절 모드
-            for i, tp_level in enumerate(self.config.take_profit_levels):
-                # 레벨 (읽기 전용)
-                level_item = QTableWidgetItem(f"{tp_level.level}")
-                level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-                level_item.setTextAlignment(Qt.AlignCenter)
-                self.tp_table.setItem(i, 0, level_item)
-
-                # 수익률
-                profit_item = QTableWidgetItem(f"{tp_level.profit_pct:.1f}")
-                profit_item.setTextAlignment(Qt.AlignCenter)
-                self.tp_table.setItem(i, 1, profit_item)
-
-                # 매도 비율
-                ratio_item = QTableWidgetItem(f"{tp_level.sell_ratio:.1f}")
-                ratio_item.setTextAlignment(Qt.AlignCenter)
-                self.tp_table.setItem(i, 2, ratio_item)
+            rows = [(tp_level.profit_pct, tp_level.sell_ratio) for tp_level in self.config.take_profit_levels]
+            self._fill_sell_table(self.tp_table, rows)
         else:
             # 단일 익절 모드 (하위 호환)
-            level_item = QTableWidgetItem("1")
-            level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-            level_item.setTextAlignment(Qt.AlignCenter)
-            self.tp_table.setItem(0, 0, level_item)
-
-            profit_item = QTableWidgetItem(f"{self.config.take_profit_pct:.1f}")
-            profit_item.setTextAlignment(Qt.AlignCenter)
-            self.tp_table.setItem(0, 1, profit_item)
-
-            ratio_item = QTableWidgetItem("100.0")
-            ratio_item.setTextAlignment(Qt.AlignCenter)
-            ratio_item.setFlags(ratio_item.flags() & ~Qt.ItemIsEditable)
-            self.tp_table.setItem(0, 2, ratio_item)
-
-        self.tp_table.blockSignals(False)
+            self._fill_sell_table(self.tp_table, [(self.config.take_profit_pct, 100.0)], single=True)
 
     def _load_sl_table(self):
         """손절 테이블 로드"""
-        self.sl_table.blockSignals(True)
-
         if self.config.is_multi_level_sl_enabled():
             # 다단계 손절 모드
-            for i, sl_level in enumerate(self.config.stop_loss_levels):
-                # 레벨 (읽기 전용)
-                level_item = QTableWidgetItem(f"{sl_level.level}")
-                level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-                level_item.setTextAlignment(Qt.AlignCenter)
-                self.sl_table.setItem(i, 0, level_item)
-
-                # 손실률
-                loss_item = QTableWidgetItem(f"{sl_level.loss_pct:.1f}")
-                loss_item.setTextAlignment(Qt.AlignCenter)
-                self.sl_table.setItem(i, 1, loss_item)
-
-                # 매도 비율
-                ratio_item = QTableWidgetItem(f"{sl_level.sell_ratio:.1f}")
-                ratio_item.setTextAlignment(Qt.AlignCenter)
-                self.sl_table.setItem(i, 2, ratio_item)
+            rows = [(sl_level.loss_pct, sl_level.sell_ratio) for sl_level in self.config.stop_loss_levels]
+            self._fill_sell_table(self.sl_table, rows)
         else:
             # 단일 손절 모드 (하위 호환)
-            level_item = QTableWidgetItem("1")
-            level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-            level_item.setTextAlignment(Qt.AlignCenter)
-            self.sl_table.setItem(0, 0, level_item)
-
-            loss_item = QTableWidgetItem(f"{self.config.stop_loss_pct:.1f}")
-            loss_item.setTextAlignment(Qt.AlignCenter)
-            self.sl_table.setItem(0, 1, loss_item)
-
-            ratio_item = QTableWidgetItem("100.0")
-            ratio_item.setTextAlignment(Qt.AlignCenter)
-            ratio_item.setFlags(ratio_item.flags() & ~Qt.ItemIsEditable)
-            self.sl_table.setItem(0, 2, ratio_item)
-
-        self.sl_table.blockSignals(False)
+            self._fill_sell_table(self.sl_table, [(self.config.stop_loss_pct, 100.0)], single=True)
+
+    def _fill_sell_table(self, table: QTableWidget, rows, single: bool = False):
+        """
+        익절/손절 테이블을 (수익률/손실률, 매도비율) 행 목록으로 한 번에 채우기
+
+        행 수를 먼저 맞춘 뒤 기존 아이템은 값만 바꾸고 모자란 칸만 새로 만들며,
+        시그널과 다시 그리기는 전체를 채운 뒤 한 번만 처리합니다.
+        single=True면 단일 모드 (매도비율 100% 고정, 편집 불가).
+        """
+        with _batched(table):
+            table.setRowCount(len(rows))
+            for i, (pct, sell_ratio) in enumerate(rows):
+                # 레벨 (읽기 전용)
+                self._set_cell(table, i, 0, f"{i + 1}", editable=False)
+                self._set_cell(table, i, 1, float(pct))
+                self._set_cell(table, i, 2, float(sell_ratio), editable=not single)
 
     def _save_tp_table(self):
         """익절 테이블 저장"""
         if self.tp_table.rowCount() == 1:
             # 단일 모드
-            profit_pct = float(self.tp_table.item(0, 1).text())
+            profit_pct = float(self.tp_table.item(0, 1).data(Qt.EditRole))
             self.config.take_profit_pct = profit_pct
             self.config.take_profit_levels = []  # 빈 리스트 = 단일 모드
         else:
             # 다단계 모드
             tp_levels = []
             for i in range(self.tp_table.rowCount()):
-                profit_pct = float(self.tp_table.item(i, 1).text())
-                sell_ratio = float(self.tp_table.item(i, 2).text())
+                profit_pct = float(self.tp_table.item(i, 1).data(Qt.EditRole))
+                sell_ratio = float(self.tp_table.item(i, 2).data(Qt.EditRole))
                 tp_levels.append(TakeProfitLevel(level=i+1, profit_pct=profit_pct, sell_ratio=sell_ratio))
             self.config.take_profit_levels = tp_levels
 
@@ -800,15 +1065,15 @@ class AdvancedDcaDialog(QDialog):
         """손절 테이블 저장"""
         if self.sl_table.rowCount() == 1:
             # 단일 모드
-            loss_pct = float(self.sl_table.item(0, 1).text())
+            loss_pct = float(self.sl_table.item(0, 1).data(Qt.EditRole))
             self.config.stop_loss_pct = loss_pct
             self.config.stop_loss_levels = []  # 빈 리스트 = 단일 모드
         else:
             # 다단계 모드
             sl_levels = []
             for i in range(self.sl_table.rowCount()):
-                loss_pct = float(self.sl_table.item(i, 1).text())
-                sell_ratio = float(self.sl_table.item(i, 2).text())
+                loss_pct = float(self.sl_table.item(i, 1).data(Qt.EditRole))
+                sell_ratio = float(self.sl_table.item(i, 2).data(Qt.EditRole))
                 sl_levels.append(StopLossLevel(level=i+1, loss_pct=loss_pct, sell_ratio=sell_ratio))
             self.config.stop_loss_levels = sl_levels
 
@@ -826,113 +1091,61 @@ class AdvancedDcaDialog(QDialog):
 
     def _add_tp_level(self):
         """익절 레벨 추가"""
-        row_count = self.tp_table.rowCount()
-        self.tp_table.setRowCount(row_count + 1)
-
-        # 레벨 (읽기 전용)
-        level_item = QTableWidgetItem(f"{row_count + 1}")
-        level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-        level_item.setTextAlignment(Qt.AlignCenter)
-        self.tp_table.setItem(row_count, 0, level_item)
-
         # 기본값: 수익률 +5%, 매도비율 30%
-        profit_item = QTableWidgetItem("5.0")
-        profit_item.setTextAlignment(Qt.AlignCenter)
-        self.tp_table.setItem(row_count, 1, profit_item)
-
-        ratio_item = QTableWidgetItem("30.0")
-        ratio_item.setTextAlignment(Qt.AlignCenter)
-        self.tp_table.setItem(row_count, 2, ratio_item)
+        self._add_sell_level(self.tp_table, self._tp_item_pool, 5.0, 30.0)
 
     def _remove_tp_level(self):
         """익절 레벨 삭제"""
-        row_count = self.tp_table.rowCount()
-        if row_count > 1:
-            self.tp_table.setRowCount(row_count - 1)
+        self._remove_sell_level(self.tp_table, self._tp_item_pool)
 
     def _add_sl_level(self):
         """손절 레벨 추가"""
-        row_count = self.sl_table.rowCount()
-        self.sl_table.setRowCount(row_count + 1)
-
-        # 레벨 (읽기 전용)
-        level_item = QTableWidgetItem(f"{row_count + 1}")
-        level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-        level_item.setTextAlignment(Qt.AlignCenter)
-        self.sl_table.setItem(row_count, 0, level_item)
-
         # 기본값: 손실률 -10%, 매도비율 50%
-        loss_item = QTableWidgetItem("10.0")
-        loss_item.setTextAlignment(Qt.AlignCenter)
-        self.sl_table.setItem(row_count, 1, loss_item)
-
-        ratio_item = QTableWidgetItem("50.0")
-        ratio_item.setTextAlignment(Qt.AlignCenter)
-        self.sl_table.setItem(row_count, 2, ratio_item)
+        self._add_sell_level(self.sl_table, self._sl_item_pool, 10.0, 50.0)
 
     def _remove_sl_level(self):
         """손절 레벨 삭제"""
-        row_count = self.sl_table.rowCount()
-        if row_count > 1:
-            self.sl_table.setRowCount(row_count - 1)
+        self._remove_sell_level(self.sl_table, self._sl_item_pool)
+
+    def _add_sell_level(self, table: QTableWidget, pool: list, pct: float, sell_ratio: float):
+        """익절/손절 레벨 한 행 추가 (삭제했던 행의 아이템이 있으면 새로 만들지 않고 재사용)"""
+        row_count = table.rowCount()
+
+        with _batched(table):
+            table.setRowCount(row_count + 1)
+
+            if pool:
+                for col, item in enumerate(pool.pop()):
+                    table.setItem(row_count, col, item)
+
+            # 레벨 (읽기 전용)
+            self._set_cell(table, row_count, 0, f"{row_count + 1}", editable=False)
+            self._set_cell(table, row_count, 1, pct)
+            self._set_cell(table, row_count, 2, sell_ratio)
+
+    def _remove_sell_level(self, table: QTableWidget, pool: list):
+        """익절/손절 마지막 레벨 삭제 (아이템은 다음 추가 때 재사용하도록 보관)"""
+        row_count = table.rowCount()
+        if row_count <= 1:
+            return
+
+        # setRowCount로 줄이면 아이템이 삭제되므로 먼저 꺼내서 보관
+        last = row_count - 1
+        pool.append(tuple(table.takeItem(last, col) for col in range(table.columnCount())))
+        table.setRowCount(last)
 
     def _apply_tp_preset(self):
         """익절 프리셋 적용"""
         # 3단계 익절 프리셋: 5% (30%), 10% (50%), 15% (100% 전량 청산)
-        self.tp_table.setRowCount(3)
-        self.tp_table.blockSignals(True)
-
-        presets = [
-            (1, 5.0, 30.0),
-            (2, 10.0, 50.0),
-            (3, 15.0, 100.0)  # 마지막은 전량 청산
-        ]
-
-        for i, (level, profit_pct, sell_ratio) in enumerate(presets):
-            level_item = QTableWidgetItem(f"{level}")
-            level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-            level_item.setTextAlignment(Qt.AlignCenter)
-            self.tp_table.setItem(i, 0, level_item)
-
-            profit_item = QTableWidgetItem(f"{profit_pct:.1f}")
-            profit_item.setTextAlignment(Qt.AlignCenter)
-            self.tp_table.setItem(i, 1, profit_item)
-
-            ratio_item = QTableWidgetItem(f"{sell_ratio:.1f}")
-            ratio_item.setTextAlignment(Qt.AlignCenter)
-            self.tp_table.setItem(i, 2, ratio_item)
-
-        self.tp_table.blockSignals(False)
+        self._fill_sell_table(self.tp_table, _TP_PRESET_ROWS)
         self._update_simulation()
 
         QMessageBox.information(self, "프리셋 적용", "✅ 익절 프리셋이 적용되었습니다.\n\n레벨1: +5% (남은 수량의 30%)\n레벨2: +10% (남은 수량의 50%)\n레벨3: +15% (남은 수량의 100%, 전량 청산)")
 
     def _apply_sl_preset(self):
         """손절 프리셋 적용"""
-        # 2단계 손절 프리셋: -10% (50%), -20% (50%)
-        self.sl_table.setRowCount(2)
-        self.sl_table.blockSignals(True)
-
-        presets = [
-            (1, 10.0, 50.0),
-            (2, 20.0, 100.0)  # 마지막은 전량 청산
-        ]
-
-        for i, (level, loss_pct, sell_ratio) in enumerate(presets):
-            level_item = QTableWidgetItem(f"{level}")
-            level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-            level_item.setTextAlignment(Qt.AlignCenter)
-            self.sl_table.setItem(i, 0, level_item)
-
-            loss_item = QTableWidgetItem(f"{loss_pct:.1f}")
-            loss_item.setTextAlignment(Qt.AlignCenter)
-            self.sl_table.setItem(i, 1, loss_item)
-
-            ratio_item = QTableWidgetItem(f"{sell_ratio:.1f}")
-            ratio_item.setTextAlignment(Qt.AlignCenter)
-            self.sl_table.setItem(i, 2, ratio_item)
-
-        self.sl_table.blockSignals(False)
+        # 2단계 손절 프리셋: -10% (50%), -20% (100% 전량 청산)
+        self._fill_sell_table(self.sl_table, _SL_PRESET_ROWS)
         self._update_simulation()
 
         QMessageBox.information(self, "프리셋 적용", "✅ 손절 프리셋이 적용되었습니다.\n\n레벨1: -10% (남은 수량의 50%)\n레벨2: -20% (남은 수량의 100%, 전량 청산)")
@@ -958,24 +1171,7 @@ class AdvancedDcaDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.tp_table.setRowCount(1)
-                self.tp_table.blockSignals(True)
-
-                level_item = QTableWidgetItem("1")
-                level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-                level_item.setTextAlignment(Qt.AlignCenter)
-                self.tp_table.setItem(0, 0, level_item)
-
-                profit_item = QTableWidgetItem("10.0")
-                profit_item.setTextAlignment(Qt.AlignCenter)
-                self.tp_table.setItem(0, 1, profit_item)
-
-                ratio_item = QTableWidgetItem("100.0")
-                ratio_item.setTextAlignment(Qt.AlignCenter)
-                ratio_item.setFlags(ratio_item.flags() & ~Qt.ItemIsEditable)
-                self.tp_table.setItem(0, 2, ratio_item)
-
-                self.tp_table.blockSignals(False)
+                self._fill_sell_table(self.tp_table, [(10.0, 100.0)], single=True)
                 self._update_simulation()
 
     def _toggle_sl_single_mode(self):
@@ -999,24 +1195,7 @@ class AdvancedDcaDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.sl_table.setRowCount(1)
-                self.sl_table.blockSignals(True)
-
-                level_item = QTableWidgetItem("1")
-                level_item.setFlags(level_item.flags() & ~Qt.ItemIsEditable)
-                level_item.setTextAlignment(Qt.AlignCenter)
-                self.sl_table.setItem(0, 0, level_item)
-
-                loss_item = QTableWidgetItem("25.0")
-                loss_item.setTextAlignment(Qt.AlignCenter)
-                self.sl_table.setItem(0, 1, loss_item)
-
-                ratio_item = QTableWidgetItem("100.0")
-                ratio_item.setTextAlignment(Qt.AlignCenter)
-                ratio_item.setFlags(ratio_item.flags() & ~Qt.ItemIsEditable)
-                self.sl_table.setItem(0, 2, ratio_item)
-
-                self.sl_table.blockSignals(False)
+                self._fill_sell_table(self.sl_table, [(25.0, 100.0)], single=True)
                 self._update_simulation()
 
 
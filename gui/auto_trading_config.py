@@ -6,12 +6,45 @@ AutoTradingConfig - 완전 자동 트레이딩 설정 관리
 
 import json
 import logging
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 설정 검증 규칙: (통과 조건, 실패 메시지) - 순서대로 검사, 첫 실패 메시지를 반환
+# 메시지의 {c.xxx}는 설정 값으로 채워짐
+_VALIDATORS = (
+    # 매수 금액 체크
+    (lambda c: c.buy_amount >= 5000,
+     "매수 금액은 5,000원 이상이어야 합니다 (Upbit 최소 주문 금액)"),
+    # 모니터링 모드 체크
+    (lambda c: c.monitoring_mode in ("top_marketcap", "custom_list"),
+     "잘못된 모니터링 모드: {c.monitoring_mode}"),
+    # 커스텀 리스트 모드인데 심볼이 없으면
+    (lambda c: c.monitoring_mode != "custom_list" or len(c.custom_symbols) > 0,
+     "커스텀 리스트 모드인데 모니터링할 심볼이 지정되지 않았습니다"),
+    # 리스크 관리 값 체크
+    (lambda c: not c.max_positions_enabled or c.max_positions_limit >= 1,
+     "최대 포지션 수는 1개 이상이어야 합니다"),
+    (lambda c: not c.daily_trades_enabled or c.daily_trades_limit >= 1,
+     "일일 거래 횟수는 1회 이상이어야 합니다"),
+    (lambda c: not c.min_krw_balance_enabled or c.min_krw_balance_amount >= 0,
+     "최소 잔고는 0원 이상이어야 합니다"),
+    (lambda c: not c.stop_on_loss_enabled or c.stop_on_loss_daily_pct > 0,
+     "일일 손실 한도는 0보다 커야 합니다"),
+    # 스캔 주기 체크
+    (lambda c: c.scan_interval >= 10,
+     "스캔 주기는 10초 이상이어야 합니다 (API 제한)"),
+)
+
 
+@dataclass(slots=True, eq=False)
 class AutoTradingConfig:
     """
     완전 자동 트레이딩 설정 클래스
@@ -20,38 +53,41 @@ class AutoTradingConfig:
     - 매수 금액 설정
     - 모니터링 코인 선택 (상위 N개 또는 커스텀 리스트)
     - 선택적 리스크 관리 (4가지 옵션)
+    
+    인자 없이 생성하면 기본값으로 초기화됩니다.
     """
     
-    def __init__(self):
-        """기본값으로 초기화"""
-        # 기본 설정
-        self.enabled: bool = True
-        self.buy_amount: float = 10000.0
-        
-        # 모니터링 설정
-        self.monitoring_mode: str = "top_marketcap"  # "top_marketcap" | "custom_list"
-        self.top_n: int = 10
-        self.custom_symbols: List[str] = []
-        
-        # 리스크 관리 - 최대 포지션 수
-        self.max_positions_enabled: bool = True
-        self.max_positions_limit: int = 3
-        
-        # 리스크 관리 - 일일 거래 횟수
-        self.daily_trades_enabled: bool = True
-        self.daily_trades_limit: int = 5
-        
-        # 리스크 관리 - 최소 잔고
-        self.min_krw_balance_enabled: bool = True
-        self.min_krw_balance_amount: float = 50000.0
-        
-        # 리스크 관리 - 일일 손실 한도
-        self.stop_on_loss_enabled: bool = True
-        self.stop_on_loss_daily_pct: float = 10.0
-        
-        # 전략 설정
-        self.strategy_type: str = "scalping"
-        self.scan_interval: int = 60  # 초
+    # 기본 설정
+    enabled: bool = True
+    buy_amount: float = 10000.0
+    
+    # 모니터링 설정
+    monitoring_mode: str = "top_marketcap"  # "top_marketcap" | "custom_list"
+    top_n: int = 10
+    custom_symbols: List[str] = field(default_factory=list)
+    
+    # 리스크 관리 - 최대 포지션 수
+    max_positions_enabled: bool = True
+    max_positions_limit: int = 3
+    
+    # 리스크 관리 - 일일 거래 횟수
+    daily_trades_enabled: bool = True
+    daily_trades_limit: int = 5
+    
+    # 리스크 관리 - 최소 잔고
+    min_krw_balance_enabled: bool = True
+    min_krw_balance_amount: float = 50000.0
+    
+    # 리스크 관리 - 일일 손실 한도
+    stop_on_loss_enabled: bool = True
+    stop_on_loss_daily_pct: float = 10.0
+    
+    # 전략 설정
+    strategy_type: str = "scalping"
+    scan_interval: int = 60  # 초
+    
+    # 마지막으로 검증을 통과한 설정 값 (같은 값이면 재검증 생략)
+    _last_valid_key: tuple = field(default=None, init=False, repr=False)
     
     @classmethod
     def from_file(cls, file_path: str) -> 'AutoTradingConfig':
@@ -67,8 +103,12 @@ class AutoTradingConfig:
         config = cls()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson 설치 시 C 구현으로 파싱 (없으면 표준 json)
+            if orjson is not None:
+                data = orjson.loads(Path(file_path).read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # 기본 설정
             config.enabled = data.get('enabled', True)
@@ -122,6 +162,40 @@ class AutoTradingConfig:
             logger.error(f"❌ 설정 로드 실패: {e}")
             return config
     
+    def _to_dict(self) -> Dict[str, Any]:
+        """설정 파일 구조의 딕셔너리로 변환"""
+        return {
+            "enabled": self.enabled,
+            "buy_amount": self.buy_amount,
+            "monitoring": {
+                "mode": self.monitoring_mode,
+                "top_n": self.top_n,
+                "custom_symbols": self.custom_symbols
+            },
+            "risk_management": {
+                "max_positions": {
+                    "enabled": self.max_positions_enabled,
+                    "limit": self.max_positions_limit
+                },
+                "daily_trades": {
+                    "enabled": self.daily_trades_enabled,
+                    "limit": self.daily_trades_limit
+                },
+                "min_krw_balance": {
+                    "enabled": self.min_krw_balance_enabled,
+                    "amount": self.min_krw_balance_amount
+                },
+                "stop_on_loss": {
+                    "enabled": self.stop_on_loss_enabled,
+                    "daily_loss_pct": self.stop_on_loss_daily_pct
+                }
+            },
+            "strategy": {
+                "type": self.strategy_type,
+                "scan_interval": self.scan_interval
+            }
+        }
+    
     def to_file(self, file_path: str):
         """
         JSON 파일로 설정 저장
@@ -130,40 +204,12 @@ class AutoTradingConfig:
             file_path: 저장할 파일 경로
         """
         try:
-            data = {
-                "enabled": self.enabled,
-                "buy_amount": self.buy_amount,
-                "monitoring": {
-                    "mode": self.monitoring_mode,
-                    "top_n": self.top_n,
-                    "custom_symbols": self.custom_symbols
-                },
-                "risk_management": {
-                    "max_positions": {
-                        "enabled": self.max_positions_enabled,
-                        "limit": self.max_positions_limit
-                    },
-                    "daily_trades": {
-                        "enabled": self.daily_trades_enabled,
-                        "limit": self.daily_trades_limit
-                    },
-                    "min_krw_balance": {
-                        "enabled": self.min_krw_balance_enabled,
-                        "amount": self.min_krw_balance_amount
-                    },
-                    "stop_on_loss": {
-                        "enabled": self.stop_on_loss_enabled,
-                        "daily_loss_pct": self.stop_on_loss_daily_pct
-                    }
-                },
-                "strategy": {
-                    "type": self.strategy_type,
-                    "scan_interval": self.scan_interval
-                }
-            }
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # 직렬화 결과를 한 번에 기록 (orjson 설치 시 사용, 없으면 표준 json — 출력 형식은 동일)
+            data = self._to_dict()
+            if orjson is not None:
+                Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                Path(file_path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
             
             logger.info(f"✅ 설정 저장 완료: {file_path}")
             
@@ -185,42 +231,36 @@ class AutoTradingConfig:
             # top_marketcap 모드는 런타임에 조회
             return []
     
+    def _validation_key(self) -> tuple:
+        """검증 대상 설정 값 묶음 (검증 결과 캐시 키)"""
+        return (
+            self.enabled, self.buy_amount,
+            self.monitoring_mode, self.top_n, tuple(self.custom_symbols),
+            self.max_positions_enabled, self.max_positions_limit,
+            self.daily_trades_enabled, self.daily_trades_limit,
+            self.min_krw_balance_enabled, self.min_krw_balance_amount,
+            self.stop_on_loss_enabled, self.stop_on_loss_daily_pct,
+            self.strategy_type, self.scan_interval,
+        )
+    
     def validate(self) -> tuple[bool, str]:
         """
         설정 유효성 검증
         
+        마지막으로 통과한 설정과 값이 같으면 검증을 다시 하지 않습니다.
+        
         Returns:
             tuple[bool, str]: (유효 여부, 에러 메시지)
         """
-        # 매수 금액 체크
-        if self.buy_amount < 5000:
-            return False, "매수 금액은 5,000원 이상이어야 합니다 (Upbit 최소 주문 금액)"
-        
-        # 모니터링 모드 체크
-        if self.monitoring_mode not in ["top_marketcap", "custom_list"]:
-            return False, f"잘못된 모니터링 모드: {self.monitoring_mode}"
-        
-        # 커스텀 리스트 모드인데 심볼이 없으면
-        if self.monitoring_mode == "custom_list" and len(self.custom_symbols) == 0:
-            return False, "커스텀 리스트 모드인데 모니터링할 심볼이 지정되지 않았습니다"
-        
-        # 리스크 관리 값 체크
-        if self.max_positions_enabled and self.max_positions_limit < 1:
-            return False, "최대 포지션 수는 1개 이상이어야 합니다"
-        
-        if self.daily_trades_enabled and self.daily_trades_limit < 1:
-            return False, "일일 거래 횟수는 1회 이상이어야 합니다"
-        
-        if self.min_krw_balance_enabled and self.min_krw_balance_amount < 0:
-            return False, "최소 잔고는 0원 이상이어야 합니다"
-        
-        if self.stop_on_loss_enabled and self.stop_on_loss_daily_pct <= 0:
-            return False, "일일 손실 한도는 0보다 커야 합니다"
+        key = self._validation_key()
+        if key == self._last_valid_key:
+            return True, "OK"
         
-        # 스캔 주기 체크
-        if self.scan_interval < 10:
-            return False, "스캔 주기는 10초 이상이어야 합니다 (API 제한)"
+        for passes, message in _VALIDATORS:
+            if not passes(self):
+                return False, message.format(c=self)
         
+        self._last_valid_key = key
         return True, "OK"
     
     def __repr__(self):
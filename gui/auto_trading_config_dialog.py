@@ -2,6 +2,8 @@
 AutoTradingConfigDialog - 완전 자동 트레이딩 설정 다이얼로그
 """
 
+import copy
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QPushButton, QLabel, QSpinBox, QDoubleSpinBox,
@@ -19,7 +21,11 @@ class AutoTradingConfigDialog(QDialog):
     def __init__(self, config: AutoTradingConfig, parent=None):
         super().__init__(parent)
         
-        self.config = config.copy() if hasattr(config, 'copy') else config
+        # 원본은 그대로 두고, 사용자가 처음 값을 바꿀 때만 복사본을 만들어 편집
+        # (변경 없이 닫으면 복사 없음, 저장 검증에 실패해도 원본은 바뀌지 않음)
+        self._orig = config
+        self.config = config
+        self._dirty = False
         
         self.setWindowTitle("🤖 완전 자동 트레이딩 설정")
         self.setMinimumWidth(600)
@@ -27,6 +33,7 @@ class AutoTradingConfigDialog(QDialog):
         
         self._init_ui()
         self._load_config()
+        self._connect_dirty_signals()
     
     def _init_ui(self):
         """UI 초기화"""
@@ -181,8 +188,40 @@ class AutoTradingConfigDialog(QDialog):
         self.stop_on_loss_check.setChecked(self.config.stop_on_loss_enabled)
         self.stop_on_loss_spin.setValue(self.config.stop_on_loss_daily_pct)
     
+    def _connect_dirty_signals(self):
+        """입력 위젯 변경 시그널 연결 (설정 로드 후 연결해 로드는 변경으로 치지 않음)"""
+        for spin in (self.buy_amount_spin, self.scan_interval_spin, self.top_n_spin,
+                     self.max_positions_spin, self.daily_trades_spin,
+                     self.min_krw_balance_spin, self.stop_on_loss_spin):
+            spin.valueChanged.connect(self._mark_dirty)
+        
+        for check in (self.top_marketcap_radio, self.custom_list_radio,
+                      self.max_positions_check, self.daily_trades_check,
+                      self.min_krw_balance_check, self.stop_on_loss_check):
+            check.toggled.connect(self._mark_dirty)
+    
+    def _mark_dirty(self, *args):
+        """첫 변경 시 원본 설정 복사"""
+        if not self._dirty:
+            self.config = copy.deepcopy(self._orig)
+            self._dirty = True
+    
     def _save_config(self):
         """설정 저장"""
+        # 변경이 있을 때만 복사본에 UI 값 반영 (변경이 없으면 원본 그대로 사용)
+        if self._dirty:
+            self._apply_ui_to_config()
+        
+        # 유효성 검증 (변경이 없어도 불러온 설정 자체가 잘못됐을 수 있으므로 항상 검사)
+        is_valid, error_msg = self.config.validate()
+        if not is_valid:
+            QMessageBox.warning(self, "설정 오류", error_msg)
+            return
+        
+        self.accept()
+    
+    def _apply_ui_to_config(self):
+        """UI 입력값을 설정 객체에 반영"""
         # 기본 설정
         self.config.buy_amount = float(self.buy_amount_spin.value())
         self.config.scan_interval = self.scan_interval_spin.value()
@@ -207,15 +246,11 @@ class AutoTradingConfigDialog(QDialog):
         
         self.config.stop_on_loss_enabled = self.stop_on_loss_check.isChecked()
         self.config.stop_on_loss_daily_pct = self.stop_on_loss_spin.value()
-        
-        # 유효성 검증
-        is_valid, error_msg = self.config.validate()
-        if not is_valid:
-            QMessageBox.warning(self, "설정 오류", error_msg)
-            return
-        
-        self.accept()
     
     def get_config(self) -> AutoTradingConfig:
         """설정 반환"""
         return self.config
+    
+    def is_modified(self) -> bool:
+        """UI에서 설정이 변경되었는지 여부 (변경이 없으면 파일 저장 생략 가능)"""
+        return self._dirty
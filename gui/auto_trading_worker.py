@@ -29,11 +29,16 @@ class AutoTradingWorker(QThread):
     
     # 시그널 정의
     log_signal = Signal(str)
+    # 틱당 한 번, 통계와 포지션 리스트를 한 dict로 묶어서 전송
+    # 'seq'는 전송마다 1씩 증가 (수신 측에서 이미 그린 것보다 오래된 상태는 무시 가능)
     status_signal = Signal(dict)
     error_signal = Signal(str)
     position_update_signal = Signal(dict)
     trade_signal = Signal(dict)
     
+    # 상태 변경이 몰릴 때 묶어서 보낼 대기 시간 (GUI 갱신 최대 초당 4회)
+    STATUS_COALESCE_SEC = 0.25
+    
     def __init__(
         self,
         access_key: str,
@@ -60,6 +65,7 @@ class AutoTradingWorker(QThread):
 
         self._running = False
         self._loop = None
+        self._seq = 0
     
     def run(self):
         """스레드 실행"""
@@ -84,7 +90,7 @@ class AutoTradingWorker(QThread):
     async def _async_main(self):
         """비동기 메인 로직"""
         try:
-            # 1. API 초기화
+            # 1. API 초기화 (HTTP 세션 하나를 모든 매니저가 공유)
             self.api = UpbitAPI(self.access_key, self.secret_key)
             self.log_signal.emit("✅ Upbit API 연결")
             
@@ -96,6 +102,9 @@ class AutoTradingWorker(QThread):
             )
             self.log_signal.emit("✅ OrderManager 초기화")
 
+            # 상태 변경 이벤트 (매니저가 상태를 바꾸면 set → 즉시 상태 전송)
+            self._status_changed = asyncio.Event()
+            
             # 3. SemiAutoManager 초기화
             self.semi_auto_manager = SemiAutoManager(
                 upbit_api=self.api,
@@ -103,7 +112,8 @@ class AutoTradingWorker(QThread):
                 dca_config=self.dca_config,
                 scan_interval=10,
                 notification_callback=self._notification_callback,
-                balance_update_callback=self.balance_update_callback  # 🔧 잔고 갱신 콜백 전달
+                balance_update_callback=self.balance_update_callback,  # 🔧 잔고 갱신 콜백 전달
+                status_callback=self._status_changed.set
             )
             self.log_signal.emit("✅ SemiAutoManager 초기화")
             
@@ -114,7 +124,8 @@ class AutoTradingWorker(QThread):
                 semi_auto_manager=self.semi_auto_manager,
                 config=self.auto_config,
                 notification_callback=self._notification_callback,
-                dry_run=self.dry_run
+                dry_run=self.dry_run,
+                status_callback=self._status_changed.set
             )
             self.log_signal.emit("✅ AutoTradingManager 초기화")
             
@@ -126,8 +137,15 @@ class AutoTradingWorker(QThread):
             self.log_signal.emit("🎯 모니터링 시작")
             
             # 6. 상태 모니터링 루프
+            # 상태가 바뀌면 즉시 전송, 변화가 없어도 잔고/손익 갱신을 위해 30초마다 전송
             while self._running:
-                await asyncio.sleep(30)  # 30초마다 상태 업데이트
+                try:
+                    await asyncio.wait_for(self._status_changed.wait(), timeout=30)
+                    # 잠시 기다려 연달아 들어오는 변경을 한 번의 전송으로 합침
+                    await asyncio.sleep(self.STATUS_COALESCE_SEC)
+                except asyncio.TimeoutError:
+                    pass
+                self._status_changed.clear()
                 
                 # 상태 정보 수집
                 auto_status = self.auto_trading_manager.get_status()
@@ -140,8 +158,10 @@ class AutoTradingWorker(QThread):
                     'daily_trades': auto_status['daily_trades'],
                     'daily_pnl_pct': auto_status['daily_pnl_pct'],
                     'krw_balance': auto_status['krw_balance'],
-                    'positions': semi_status.get('positions', [])
+                    'positions': semi_status.get('positions', []),
+                    'seq': self._seq
                 }
+                self._seq += 1
                 
                 self.status_signal.emit(status)
         
@@ -156,6 +176,8 @@ class AutoTradingWorker(QThread):
                 await self.auto_trading_manager.stop()
             if self.semi_auto_manager:
                 await self.semi_auto_manager.stop()
+            if self.api:
+                self.api.close()  # 공유 HTTP 세션 (연결 풀) 종료
     
     async def _notification_callback(self, message: str):
         """알림 콜백"""
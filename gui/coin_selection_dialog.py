@@ -7,9 +7,9 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QCheckBox,
     QPushButton, QLabel, QGroupBox, QScrollArea, QWidget, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QFont
-from typing import List
+from typing import List, Sequence
 
 
 class CoinSelectionDialog(QDialog):
@@ -48,13 +48,19 @@ class CoinSelectionDialog(QDialog):
         'KRW-USDT': 'Tether (테더)',
     }
 
-    def __init__(self, parent=None, selected_coins: List[str] = None):
+    # 표시용 이름 (클래스 로드 시 한 번만 생성)
+    _DISPLAY_NAMES = {symbol: f"{symbol} - {name}" for symbol, name in COIN_NAMES.items()}
+
+    # 짧은 이름 (예: 'KRW-BTC' → 'BTC', 선택 정보 표시용)
+    SHORT_NAMES = {symbol: symbol.replace('KRW-', '') for symbol in ALL_COINS}
+
+    def __init__(self, parent=None, selected_coins: Sequence[str] = None):
         """
         코인 선택 다이얼로그 초기화
 
         Args:
             parent: 부모 위젯
-            selected_coins: 현재 선택된 코인 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+            selected_coins: 현재 선택된 코인 목록 (예: ['KRW-BTC', 'KRW-ETH'])
         """
         super().__init__(parent)
 
@@ -62,13 +68,22 @@ class CoinSelectionDialog(QDialog):
         if selected_coins is None:
             selected_coins = []
 
-        self.selected_coins = selected_coins.copy()  # 복사본 생성
+        # 선택이 바뀌면 새 리스트로 교체하고 제자리 수정은 하지 않으므로 복사하지 않음
+        self.selected_coins = selected_coins
         self.checkboxes = {}  # {심볼: QCheckBox}
+        # 체크된 코인 집합 (체크박스 변경 시 이 집합만 갱신, 리스트는 여기서 만듦)
+        self._selected_set = set(self.selected_coins).intersection(self.ALL_COINS)
 
         self.setWindowTitle("🎯 거래할 코인 선택")
         self.setMinimumSize(500, 400)
         self.setModal(True)  # 모달 다이얼로그 (다른 창 조작 불가)
 
+        # 선택 정보 라벨 갱신 타이머 (연속 변경 시 이벤트 루프로 돌아간 뒤 한 번만 갱신)
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.setInterval(0)
+        self._info_timer.timeout.connect(self._update_selection_info)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -102,11 +117,13 @@ class CoinSelectionDialog(QDialog):
             checkbox.setFont(QFont("맑은 고딕", 10))
 
             # 현재 선택된 코인이면 체크
-            if symbol in self.selected_coins:
+            if symbol in self._selected_set:
                 checkbox.setChecked(True)
 
-            # 체크박스 상태 변경 시그널 연결
-            checkbox.stateChanged.connect(self._on_checkbox_changed)
+            # 체크박스 상태 변경 시그널 연결 (어느 코인이 바뀌었는지 함께 전달)
+            checkbox.toggled.connect(
+                lambda checked, s=symbol: self._on_checkbox_changed(s, checked)
+            )
 
             # 저장
             self.checkboxes[symbol] = checkbox
@@ -157,6 +174,25 @@ class CoinSelectionDialog(QDialog):
 
         main_layout.addLayout(button_layout)
 
+    def set_selection(self, selected_coins: Sequence[str]):
+        """
+        선택 상태 다시 적용 (다이얼로그를 재사용할 때 호출)
+
+        체크박스 시그널을 막은 채로 상태를 바꾸고, 선택 정보는 한 번만 갱신합니다.
+
+        Args:
+            selected_coins: 선택할 코인 목록
+        """
+        self.selected_coins = selected_coins
+        self._selected_set = set(self.selected_coins).intersection(self.ALL_COINS)
+
+        for symbol, checkbox in self.checkboxes.items():
+            checkbox.blockSignals(True)
+            checkbox.setChecked(symbol in self._selected_set)
+            checkbox.blockSignals(False)
+
+        self._update_selection_info()
+
     def _get_coin_display_name(self, symbol: str) -> str:
         """
         코인 심볼을 표시용 이름으로 변환
@@ -167,8 +203,19 @@ class CoinSelectionDialog(QDialog):
         Returns:
             str: 표시용 이름 (예: 'KRW-BTC - Bitcoin (비트코인)')
         """
-        coin_name = self.COIN_NAMES.get(symbol, symbol)
-        return f"{symbol} - {coin_name}"
+        display_name = self._DISPLAY_NAMES.get(symbol)
+        if display_name is None:
+            # 이름 매핑이 없는 코인은 심볼로 표시
+            display_name = f"{symbol} - {symbol}"
+        return display_name
+
+    def _get_short_names_str(self) -> str:
+        """선택된 코인의 짧은 이름 문자열 (예: 'BTC, ETH')"""
+        short_names = self.SHORT_NAMES
+        return ", ".join(
+            short_names.get(symbol) or symbol.replace('KRW-', '')
+            for symbol in self.selected_coins
+        )
 
     def _get_selection_info(self) -> str:
         """선택 정보 텍스트 생성"""
@@ -176,34 +223,67 @@ class CoinSelectionDialog(QDialog):
         if count == 0:
             return "⚠️ 코인이 선택되지 않았습니다 (최소 1개 필요)"
         else:
-            coins_str = ", ".join([symbol.replace('KRW-', '') for symbol in self.selected_coins])
-            return f"✅ {count}개 선택됨: {coins_str}"
-
-    def _on_checkbox_changed(self):
-        """체크박스 상태 변경 시 호출"""
-        # 현재 선택된 코인 리스트 업데이트
-        self.selected_coins = [
-            symbol for symbol, checkbox in self.checkboxes.items()
-            if checkbox.isChecked()
-        ]
-
-        # 선택 정보 업데이트
+            return f"✅ {count}개 선택됨: {self._get_short_names_str()}"
+
+    def _on_checkbox_changed(self, symbol: str, checked: bool):
+        """
+        체크박스 상태 변경 시 호출
+
+        Args:
+            symbol: 변경된 코인 심볼
+            checked: 체크 여부
+        """
+        if checked:
+            self._selected_set.add(symbol)
+        else:
+            self._selected_set.discard(symbol)
+
+        self._refresh_selection()
+
+    def _refresh_selection(self):
+        """선택 집합으로 선택 코인 리스트(ALL_COINS 순서)와 선택 정보 갱신"""
+        selected_set = self._selected_set
+        self.selected_coins = [symbol for symbol in self.ALL_COINS if symbol in selected_set]
+
+        # 선택 정보 업데이트 (지연 실행)
+        self._info_timer.start()
+
+    @Slot()
+    def _update_selection_info(self):
+        """선택 정보 라벨 갱신"""
         self.selection_info_label.setText(self._get_selection_info())
 
+    def _set_all_checked(self, checked: bool):
+        """
+        모든 체크박스 상태 일괄 변경
+
+        체크박스마다 시그널이 발생하지 않도록 막고, 끝난 뒤 선택 정보를 한 번만 갱신합니다.
+        """
+        for checkbox in self.checkboxes.values():
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
+
+        self._selected_set = set(self.ALL_COINS) if checked else set()
+        self._refresh_selection()
+
+    @Slot()
     def _select_all(self):
         """전체 선택"""
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(True)
+        self._set_all_checked(True)
 
+    @Slot()
     def _deselect_all(self):
         """전체 해제"""
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(False)
+        self._set_all_checked(False)
 
+    @Slot()
     def _save_and_close(self):
         """저장하고 닫기"""
+        count = len(self.selected_coins)
+
         # 검증: 최소 1개 선택 필요
-        if len(self.selected_coins) == 0:
+        if count == 0:
             QMessageBox.warning(
                 self,
                 "선택 필요",
@@ -212,21 +292,21 @@ class CoinSelectionDialog(QDialog):
             return
 
         # 검증: 최대 6개까지
-        if len(self.selected_coins) > 6:
+        if count > 6:
             QMessageBox.warning(
                 self,
                 "선택 초과",
-                f"⚠️ 최대 6개까지만 선택할 수 있습니다.\n현재 {len(self.selected_coins)}개 선택됨"
+                f"⚠️ 최대 6개까지만 선택할 수 있습니다.\n현재 {count}개 선택됨"
             )
             return
 
         # 확인 메시지
-        coins_str = ", ".join([symbol.replace('KRW-', '') for symbol in self.selected_coins])
+        coins_str = self._get_short_names_str()
         reply = QMessageBox.question(
             self,
             "코인 선택 저장",
             f"선택한 코인을 저장하시겠습니까?\n\n"
-            f"선택된 코인 ({len(self.selected_coins)}개):\n{coins_str}\n\n"
+            f"선택된 코인 ({count}개):\n{coins_str}\n\n"
             f"이 코인들만 감시하고 전략을 적용합니다.",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes
@@ -234,7 +314,7 @@ class CoinSelectionDialog(QDialog):
 
         if reply == QMessageBox.Yes:
             # 시그널 발생 (MainWindow에서 받음)
-            self.coins_changed.emit(self.selected_coins)
+            self.coins_changed.emit(list(self.selected_coins))
 
             # 다이얼로그 닫기 (성공)
             self.accept()
@@ -246,7 +326,7 @@ class CoinSelectionDialog(QDialog):
         Returns:
             List[str]: 선택된 코인 심볼 리스트
         """
-        return self.selected_coins.copy()
+        return list(self.selected_coins)
 
 
 # 테스트 코드
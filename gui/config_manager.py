@@ -3,10 +3,45 @@ GUI Configuration Manager
 .env 파일 및 설정 관리
 """
 
+import io
 import os
+import re
+import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from dotenv import load_dotenv, set_key, unset_key
+from dotenv import load_dotenv
+
+# ConfigManager가 관리하는 설정 키
+_CONFIG_KEYS = (
+    'UPBIT_ACCESS_KEY', 'UPBIT_SECRET_KEY',
+    'TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHAT_ID',
+    'SELECTED_COINS',
+    'MIN_ORDER_AMOUNT', 'ORDER_TIMEOUT',
+    'STRATEGY_TYPE',
+)
+
+# Chat ID 형식: 숫자 또는 -로 시작하는 숫자
+_CHAT_ID_RE = re.compile(r'-?\d+')
+
+
+@lru_cache(maxsize=4)
+def _is_valid_telegram_config(bot_token: str, chat_id: str) -> bool:
+    """Telegram 설정 형식 검사 (같은 입력이면 캐시된 결과 반환)"""
+    # 기본값이 아닌지 확인
+    if bot_token == 'your_telegram_bot_token_here' or not bot_token:
+        return False
+
+    if chat_id == 'your_telegram_chat_id_here' or not chat_id:
+        return False
+
+    # Bot Token 형식 확인 (숫자:영문숫자)
+    if ':' not in bot_token:
+        return False
+
+    # Chat ID는 숫자 또는 -로 시작하는 숫자
+    return _CHAT_ID_RE.fullmatch(chat_id) is not None
 
 
 class ConfigManager:
@@ -17,6 +52,33 @@ class ConfigManager:
     GUI에서 설정을 쉽게 변경할 수 있도록 지원
     """
 
+    # API 키 검증 결과 유효 시간 (초) - 같은 키로 다시 검증하면 API 호출 생략
+    KEY_VALIDATION_TTL = 60.0
+
+    # 전략별 기본 파라미터
+    _STRATEGY_DEFAULTS = {
+        'filtered_bb': {
+            'bb_period': 20,
+            'ma_period': 240,
+            'atr_period': 14,
+            # 코인별 파라미터는 FilteredBollingerBandsStrategy.create_for_coin()에서 자동 적용
+        },
+        'bb': {
+            'period': 20,
+            'std_dev': 2.0
+        },
+        'rsi': {
+            'period': 14,
+            'oversold': 30,
+            'overbought': 70
+        },
+        'macd': {
+            'fast_period': 12,
+            'slow_period': 26,
+            'signal_period': 9
+        },
+    }
+
     def __init__(self, env_path: Optional[Path] = None):
         """
         초기화
@@ -31,15 +93,42 @@ class ConfigManager:
 
         self.env_path = env_path
 
+        # 파싱한 설정 값 캐시 (set_* / reload 시 비움)
+        self._cache: Dict[str, Any] = {}
+
+        # API 키 검증용 클라이언트 및 마지막 검증 성공 기록
+        self._api_client = None
+        self._validated_keys = None  # (access_key, secret_key)
+        self._validated_at = 0.0
+
         # .env 파일이 없으면 생성
-        if not self.env_path.exists():
-            self._create_default_env()
+        self._create_default_env()
 
         # 환경 변수 로드
         load_dotenv(self.env_path)
+        self._load_values()
+
+    def _load_values(self):
+        """
+        설정 값을 환경 변수에서 한 번에 읽어 보관 (getter는 이 dict만 조회)
+
+        load_dotenv 이후의 환경 변수를 그대로 옮기므로,
+        이미 설정된 OS 환경 변수가 .env보다 우선하는 동작은 그대로 유지됩니다.
+        """
+        environ = os.environ
+        self._values: Dict[str, str] = {
+            key: environ[key] for key in _CONFIG_KEYS if key in environ
+        }
+        self._cache.clear()
 
     def _create_default_env(self):
-        """기본 .env 파일 생성"""
+        """
+        기본 .env 파일 생성
+
+        파일이 이미 있으면 아무것도 하지 않습니다.
+        존재 확인과 생성을 한 번에 처리하므로 (배타적 생성 모드)
+        두 프로세스가 동시에 시작해도 한쪽만 파일을 씁니다.
+        """
         default_content = """# Upbit API Keys
 UPBIT_ACCESS_KEY=your_access_key_here
 UPBIT_SECRET_KEY=your_secret_key_here
@@ -59,7 +148,80 @@ STRATEGY_TYPE=filtered_bb
 TELEGRAM_BOT_TOKEN=your_telegram_bot_token_here
 TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 """
-        self.env_path.write_text(default_content, encoding='utf-8')
+        try:
+            with open(self.env_path, 'x', encoding='utf-8') as f:
+                f.write(default_content)
+        except FileExistsError:
+            pass
+
+    def _set_keys(self, values: Dict[str, str]):
+        """
+        여러 키를 .env 파일에 한 번에 저장
+
+        파일을 한 번 읽고 한 번만 씁니다 (임시 파일에 쓴 뒤 교체).
+        파일의 값이 모두 같으면 쓰지 않습니다.
+        줄 형식은 dotenv.set_key와 같고 (KEY='value'), 나머지 줄/주석은 그대로 유지합니다.
+        저장 후 환경 변수도 함께 업데이트합니다.
+
+        Args:
+            values: {키: 값}
+        """
+        from dotenv.parser import parse_stream
+
+        # dotenv.set_key와 동일한 형식 (작은따옴표, \와 ' 이스케이프)
+        new_lines = {}
+        for key, value in values.items():
+            escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+            new_lines[key] = f"{key}='{escaped}'\n"
+
+        try:
+            source = self.env_path.read_text(encoding='utf-8')
+            original_mode = self.env_path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            source = ''
+            original_mode = None
+
+        out = []
+        written = set()
+        changed = False
+        missing_newline = False
+        for binding in parse_stream(io.StringIO(source)):
+            line = new_lines.get(binding.key)
+            if line is not None:
+                out.append(line)
+                written.add(binding.key)
+                if binding.value != values[binding.key]:
+                    changed = True
+            else:
+                out.append(binding.original.string)
+                missing_newline = not binding.original.string.endswith('\n')
+
+        # 파일에 없던 키는 끝에 추가
+        for key, line in new_lines.items():
+            if key not in written:
+                changed = True
+                if missing_newline:
+                    out.append('\n')
+                    missing_newline = False
+                out.append(line)
+
+        # 값이 바뀐 경우에만 파일 교체
+        if changed:
+            fd, tmp_path = tempfile.mkstemp(prefix='.tmp_', dir=self.env_path.parent)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(''.join(out))
+                if original_mode is not None:
+                    os.chmod(tmp_path, original_mode)
+                os.replace(tmp_path, self.env_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+        # 환경 변수도 업데이트
+        os.environ.update(values)
+        self._values.update(values)
+        self._cache.clear()
 
     # ========================================
     # Upbit API 설정
@@ -67,11 +229,11 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 
     def get_upbit_access_key(self) -> str:
         """Upbit Access Key 조회"""
-        return os.getenv('UPBIT_ACCESS_KEY', '')
+        return self._values.get('UPBIT_ACCESS_KEY', '')
 
     def get_upbit_secret_key(self) -> str:
         """Upbit Secret Key 조회"""
-        return os.getenv('UPBIT_SECRET_KEY', '')
+        return self._values.get('UPBIT_SECRET_KEY', '')
 
     def set_upbit_keys(self, access_key: str, secret_key: str) -> bool:
         """
@@ -85,12 +247,13 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             성공 여부
         """
         try:
-            set_key(str(self.env_path), 'UPBIT_ACCESS_KEY', access_key)
-            set_key(str(self.env_path), 'UPBIT_SECRET_KEY', secret_key)
+            self._set_keys({
+                'UPBIT_ACCESS_KEY': access_key,
+                'UPBIT_SECRET_KEY': secret_key,
+            })
 
-            # 환경 변수도 업데이트
-            os.environ['UPBIT_ACCESS_KEY'] = access_key
-            os.environ['UPBIT_SECRET_KEY'] = secret_key
+            # 키가 바뀌었으므로 다음 검증은 API로 다시 확인
+            self._validated_keys = None
 
             return True
         except Exception as e:
@@ -103,11 +266,11 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 
     def get_telegram_bot_token(self) -> str:
         """Telegram Bot Token 조회"""
-        return os.getenv('TELEGRAM_BOT_TOKEN', '')
+        return self._values.get('TELEGRAM_BOT_TOKEN', '')
 
     def get_telegram_chat_id(self) -> str:
         """Telegram Chat ID 조회"""
-        return os.getenv('TELEGRAM_CHAT_ID', '')
+        return self._values.get('TELEGRAM_CHAT_ID', '')
 
     def set_telegram_config(self, bot_token: str, chat_id: str) -> bool:
         """
@@ -121,12 +284,10 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             성공 여부
         """
         try:
-            set_key(str(self.env_path), 'TELEGRAM_BOT_TOKEN', bot_token)
-            set_key(str(self.env_path), 'TELEGRAM_CHAT_ID', chat_id)
-
-            # 환경 변수도 업데이트
-            os.environ['TELEGRAM_BOT_TOKEN'] = bot_token
-            os.environ['TELEGRAM_CHAT_ID'] = chat_id
+            self._set_keys({
+                'TELEGRAM_BOT_TOKEN': bot_token,
+                'TELEGRAM_CHAT_ID': chat_id,
+            })
 
             return True
         except Exception as e:
@@ -139,21 +300,26 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 
     def get_selected_coins(self) -> List[str]:
         """
-        선택된 코인 리스트 조회
+        선택된 코인 목록 조회
 
         Returns:
             List[str]: 선택된 코인 심볼 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+                       파싱 결과는 캐시하고, 호출자가 수정해도 되도록 새 리스트로 반환
         """
-        coins_str = os.getenv('SELECTED_COINS', 'KRW-XRP,KRW-BTC,KRW-ETH')
+        cache = self._cache
+        if 'SELECTED_COINS' not in cache:
+            coins_str = self._values.get('SELECTED_COINS', 'KRW-XRP,KRW-BTC,KRW-ETH')
 
-        # 쉼표로 분리하여 리스트로 변환
-        coins = [coin.strip() for coin in coins_str.split(',') if coin.strip()]
+            # 쉼표로 분리하여 리스트로 변환
+            coins = [coin.strip() for coin in coins_str.split(',') if coin.strip()]
 
-        # 빈 리스트면 기본값 반환
-        if not coins:
-            return ['KRW-XRP', 'KRW-BTC', 'KRW-ETH']
+            # 빈 리스트면 기본값 사용
+            if not coins:
+                coins = ['KRW-XRP', 'KRW-BTC', 'KRW-ETH']
 
-        return coins
+            cache['SELECTED_COINS'] = tuple(coins)
+
+        return list(cache['SELECTED_COINS'])
 
     def set_selected_coins(self, coins: List[str]) -> bool:
         """
@@ -175,10 +341,7 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             coins_str = ','.join(coins)
 
             # .env 파일에 저장
-            set_key(str(self.env_path), 'SELECTED_COINS', coins_str)
-
-            # 환경 변수도 업데이트
-            os.environ['SELECTED_COINS'] = coins_str
+            self._set_keys({'SELECTED_COINS': coins_str})
 
             return True
         except Exception as e:
@@ -191,11 +354,17 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 
     def get_min_order_amount(self) -> int:
         """최소 주문 금액 조회"""
-        return int(os.getenv('MIN_ORDER_AMOUNT', '5000'))
+        cache = self._cache
+        if 'MIN_ORDER_AMOUNT' not in cache:
+            cache['MIN_ORDER_AMOUNT'] = int(self._values.get('MIN_ORDER_AMOUNT', '5000'))
+        return cache['MIN_ORDER_AMOUNT']
 
     def get_order_timeout(self) -> int:
         """주문 타임아웃 조회"""
-        return int(os.getenv('ORDER_TIMEOUT', '30'))
+        cache = self._cache
+        if 'ORDER_TIMEOUT' not in cache:
+            cache['ORDER_TIMEOUT'] = int(self._values.get('ORDER_TIMEOUT', '30'))
+        return cache['ORDER_TIMEOUT']
 
     def set_trading_config(self, min_order_amount: int, order_timeout: int) -> bool:
         """
@@ -209,12 +378,10 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             성공 여부
         """
         try:
-            set_key(str(self.env_path), 'MIN_ORDER_AMOUNT', str(min_order_amount))
-            set_key(str(self.env_path), 'ORDER_TIMEOUT', str(order_timeout))
-
-            # 환경 변수도 업데이트
-            os.environ['MIN_ORDER_AMOUNT'] = str(min_order_amount)
-            os.environ['ORDER_TIMEOUT'] = str(order_timeout)
+            self._set_keys({
+                'MIN_ORDER_AMOUNT': str(min_order_amount),
+                'ORDER_TIMEOUT': str(order_timeout),
+            })
 
             return True
         except Exception as e:
@@ -236,7 +403,7 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             - 'rsi': RSI 전략
             - 'macd': MACD 전략
         """
-        return os.getenv('STRATEGY_TYPE', 'filtered_bb')
+        return self._values.get('STRATEGY_TYPE', 'filtered_bb')
     
     def set_strategy_type(self, strategy_type: str) -> bool:
         """
@@ -254,8 +421,7 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
                 print(f"⚠️ 유효하지 않은 전략 타입: {strategy_type}")
                 return False
             
-            set_key(str(self.env_path), 'STRATEGY_TYPE', strategy_type)
-            os.environ['STRATEGY_TYPE'] = strategy_type
+            self._set_keys({'STRATEGY_TYPE': strategy_type})
             
             return True
         except Exception as e:
@@ -276,31 +442,10 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             'auto_optimize': True,  # 코인별 자동 최적화
         }
         
-        # 전략별 기본 파라미터
-        if strategy_type == 'filtered_bb':
-            config.update({
-                'bb_period': 20,
-                'ma_period': 240,
-                'atr_period': 14,
-                # 코인별 파라미터는 FilteredBollingerBandsStrategy.create_for_coin()에서 자동 적용
-            })
-        elif strategy_type == 'bb':
-            config.update({
-                'period': 20,
-                'std_dev': 2.0
-            })
-        elif strategy_type == 'rsi':
-            config.update({
-                'period': 14,
-                'oversold': 30,
-                'overbought': 70
-            })
-        elif strategy_type == 'macd':
-            config.update({
-                'fast_period': 12,
-                'slow_period': 26,
-                'signal_period': 9
-            })
+        # 전략별 기본 파라미터 (알 수 없는 전략이면 추가 파라미터 없음)
+        defaults = self._STRATEGY_DEFAULTS.get(strategy_type)
+        if defaults:
+            config.update(defaults)
         
         return config
 
@@ -334,12 +479,12 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
             'strategy': self.get_strategy_config()
         }
 
-    def validate_upbit_keys(self) -> bool:
+    def has_upbit_keys(self) -> bool:
         """
-        Upbit API 키 유효성 검사 (실제 API 연결 테스트)
+        Upbit API 키 입력 여부 확인 (API 호출 없이 형식만 검사)
 
         Returns:
-            유효 여부
+            키가 설정되어 있고 형식이 맞으면 True
         """
         access_key = self.get_upbit_access_key()
         secret_key = self.get_upbit_secret_key()
@@ -355,15 +500,46 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
         if len(access_key) < 20 or len(secret_key) < 20:
             return False
 
+        return True
+
+    def validate_upbit_keys(self) -> bool:
+        """
+        Upbit API 키 유효성 검사 (실제 API 연결 테스트)
+
+        네트워크 호출이 있으므로 GUI에서는 워커 스레드에서 호출하세요.
+
+        Returns:
+            유효 여부
+        """
+        if not self.has_upbit_keys():
+            return False
+
+        access_key = self.get_upbit_access_key()
+        secret_key = self.get_upbit_secret_key()
+
+        # 같은 키가 최근에 검증됐으면 API 호출 생략
+        keys = (access_key, secret_key)
+        if (keys == self._validated_keys
+                and time.monotonic() - self._validated_at < self.KEY_VALIDATION_TTL):
+            return True
+
         # 3. 🔧 실제 API 연결 테스트 (가장 중요!)
         try:
             from core.upbit_api import UpbitAPI
 
-            api = UpbitAPI(access_key, secret_key)
+            # 같은 키면 클라이언트(HTTP 세션) 재사용
+            api = self._api_client
+            if api is None or (api.access_key, api.secret_key) != keys:
+                if api is not None:
+                    api.close()
+                api = self._api_client = UpbitAPI(access_key, secret_key)
+
             accounts = api.get_accounts()  # 실제 API 호출
 
             # 계좌 조회 성공 → 유효한 키
             if accounts and isinstance(accounts, list):
+                self._validated_keys = keys
+                self._validated_at = time.monotonic()
                 return True
             else:
                 return False
@@ -380,26 +556,12 @@ TELEGRAM_CHAT_ID=your_telegram_chat_id_here
         Returns:
             유효 여부
         """
-        bot_token = self.get_telegram_bot_token()
-        chat_id = self.get_telegram_chat_id()
-
-        # 기본값이 아닌지 확인
-        if bot_token == 'your_telegram_bot_token_here' or not bot_token:
-            return False
-
-        if chat_id == 'your_telegram_chat_id_here' or not chat_id:
-            return False
-
-        # Bot Token 형식 확인 (숫자:영문숫자)
-        if ':' not in bot_token:
-            return False
-
-        # Chat ID는 숫자 또는 -로 시작하는 숫자
-        if not (chat_id.isdigit() or (chat_id.startswith('-') and chat_id[1:].isdigit())):
-            return False
-
-        return True
+        return _is_valid_telegram_config(
+            self.get_telegram_bot_token(),
+            self.get_telegram_chat_id()
+        )
 
     def reload(self):
         """환경 변수 다시 로드"""
         load_dotenv(self.env_path, override=True)
+        self._load_values()
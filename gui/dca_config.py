@@ -13,12 +13,19 @@ DCA Configuration Manager
 """
 
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, NamedTuple
+from dataclasses import dataclass
+import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class DcaLevelConfig:
     """
     개별 DCA 레벨 설정
@@ -36,7 +43,12 @@ class DcaLevelConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return asdict(self)
+        return {
+            'level': self.level,
+            'drop_pct': self.drop_pct,
+            'weight_pct': self.weight_pct,
+            'order_amount': self.order_amount
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DcaLevelConfig':
@@ -44,7 +56,7 @@ class DcaLevelConfig:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class TakeProfitLevel:
     """
     익절 레벨 설정
@@ -60,7 +72,11 @@ class TakeProfitLevel:
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return asdict(self)
+        return {
+            'level': self.level,
+            'profit_pct': self.profit_pct,
+            'sell_ratio': self.sell_ratio
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TakeProfitLevel':
@@ -68,7 +84,7 @@ class TakeProfitLevel:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class StopLossLevel:
     """
     손절 레벨 설정
@@ -84,7 +100,11 @@ class StopLossLevel:
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return asdict(self)
+        return {
+            'level': self.level,
+            'loss_pct': self.loss_pct,
+            'sell_ratio': self.sell_ratio
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StopLossLevel':
@@ -92,7 +112,25 @@ class StopLossLevel:
         return cls(**data)
 
 
-@dataclass
+class Targets(NamedTuple):
+    """
+    평균 단가 기준 목표가 계산 결과
+
+    Attributes:
+        avg_price: 평균 단가
+        take_profit_price: 익절가
+        stop_loss_price: 손절가
+        total_invested: 총 투자금
+        total_quantity: 총 매수 수량
+    """
+    avg_price: float
+    take_profit_price: float
+    stop_loss_price: float
+    total_invested: float
+    total_quantity: float
+
+
+@dataclass(slots=True)
 class AdvancedDcaConfig:
     """
     고급 DCA 전략 설정
@@ -192,6 +230,18 @@ class AdvancedDcaConfig:
             return 0.0
         return round(order_amount / self.total_capital * 100, 2)
     
+    def get_level_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        레벨 설정을 열 단위 배열로 변환
+
+        Returns:
+            (하락률 배열, 주문 금액 배열), 둘 다 float64
+        """
+        count = len(self.levels)
+        drops = np.fromiter((lc.drop_pct for lc in self.levels), np.float64, count)
+        amounts = np.fromiter((lc.order_amount for lc in self.levels), np.float64, count)
+        return drops, amounts
+
     def calculate_average_price(self, current_price: float) -> tuple[float, float, float]:
         """
         평균 단가 계산
@@ -219,7 +269,7 @@ class AdvancedDcaConfig:
         
         return total_invested, total_quantity, avg_price
     
-    def calculate_targets(self, current_price: float) -> Dict[str, float]:
+    def calculate_targets(self, current_price: float) -> Targets:
         """
         익절/손절가 계산
 
@@ -227,20 +277,20 @@ class AdvancedDcaConfig:
             current_price: 현재가
 
         Returns:
-            {'avg_price', 'take_profit_price', 'stop_loss_price', 'total_invested'}
+            Targets(avg_price, take_profit_price, stop_loss_price, total_invested, total_quantity)
         """
         total_invested, total_quantity, avg_price = self.calculate_average_price(current_price)
 
         take_profit_price = avg_price * (1 + self.take_profit_pct / 100)
         stop_loss_price = avg_price * (1 - self.stop_loss_pct / 100)
 
-        return {
-            'avg_price': avg_price,
-            'take_profit_price': take_profit_price,
-            'stop_loss_price': stop_loss_price,
-            'total_invested': total_invested,
-            'total_quantity': total_quantity
-        }
+        return Targets(
+            avg_price=avg_price,
+            take_profit_price=take_profit_price,
+            stop_loss_price=stop_loss_price,
+            total_invested=total_invested,
+            total_quantity=total_quantity
+        )
 
     def is_multi_level_tp_enabled(self) -> bool:
         """다단계 익절 사용 여부"""
@@ -318,6 +368,10 @@ class DcaConfigManager:
     JSON 파일로 설정 저장/로드
     """
     
+    # 파싱한 설정 캐시 {파일 경로: ((수정 시각 ns, 크기), 설정 dict)}
+    # 파일이 그대로면 다시 읽지 않음 (설정 객체는 매번 새로 만들므로 호출 측 수정과 무관)
+    _cache: Dict[Path, tuple] = {}
+    
     def __init__(self, config_path: Optional[Path] = None):
         """
         초기화
@@ -338,12 +392,24 @@ class DcaConfigManager:
         Returns:
             AdvancedDcaConfig 인스턴스
         """
-        if not self.config_path.exists():
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             return self.create_default_config()
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            file_key = (st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(self.config_path)
+            
+            if cached is not None and cached[0] == file_key:
+                data = cached[1]
+            else:
+                # orjson 설치 시 바이트를 바로 파싱
+                if orjson is not None:
+                    data = orjson.loads(self.config_path.read_bytes())
+                else:
+                    data = json.loads(self.config_path.read_text(encoding='utf-8'))
+                self._cache[self.config_path] = (file_key, data)
             
             return AdvancedDcaConfig.from_dict(data)
         
@@ -362,8 +428,26 @@ class DcaConfigManager:
             성공 여부
         """
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+            data = config.to_dict()
+            
+            # 직렬화 (orjson 설치 시 사용, 출력 형식은 동일)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            # 임시 파일에 한 번에 기록한 뒤 교체 (저장 중 중단돼도 기존 파일 유지)
+            tmp_path = self.config_path.with_suffix(self.config_path.suffix + '.tmp')
+            try:
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            
+            # 저장한 내용으로 캐시 갱신 (다음 로드에서 다시 읽지 않음)
+            st = self.config_path.stat()
+            self._cache[self.config_path] = ((st.st_mtime_ns, st.st_size), data)
             
             print(f"✅ DCA 설정 저장 완료: {self.config_path}")
             return True
@@ -431,8 +515,8 @@ if __name__ == "__main__":
     print("=" * 60)
     print(f"📈 시뮬레이션 (현재가: {current_price:,}원)")
     print("=" * 60)
-    print(f"총 투자금: {targets['total_invested']:,.0f}원")
-    print(f"평균 단가: {targets['avg_price']:,.0f}원")
-    print(f"익절가: {targets['take_profit_price']:,.0f}원")
-    print(f"손절가: {targets['stop_loss_price']:,.0f}원")
+    print(f"총 투자금: {targets.total_invested:,.0f}원")
+    print(f"평균 단가: {targets.avg_price:,.0f}원")
+    print(f"익절가: {targets.take_profit_price:,.0f}원")
+    print(f"손절가: {targets.stop_loss_price:,.0f}원")
     print("=" * 60)
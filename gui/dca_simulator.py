@@ -3,13 +3,14 @@ DCA Simulator - DCA 전략 시뮬레이터
 사용자가 파라미터를 조정하며 DCA 결과를 미리 계산
 """
 
+import numpy as np
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QSpinBox, QDoubleSpinBox, QPushButton,
     QTextEdit, QGroupBox, QTableWidget, QTableWidgetItem,
     QHeaderView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 
@@ -34,6 +35,12 @@ class DcaSimulatorDialog(QDialog):
 
     def _init_ui(self):
         """UI 초기화"""
+        # 🔧 재계산 지연 타이머 (연속 입력은 50ms 안에 한 번으로 합침)
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self._calculate_dca)
+
         main_layout = QVBoxLayout(self)
 
         # 상단: 입력 파라미터
@@ -46,7 +53,7 @@ class DcaSimulatorDialog(QDialog):
         self.price_spin.setValue(self.initial_price)
         self.price_spin.setSuffix(" 원")
         self.price_spin.setSingleStep(100000)
-        self.price_spin.valueChanged.connect(self._calculate_dca)
+        self.price_spin.valueChanged.connect(self._recalc_timer.start)
         input_layout.addRow("📈 현재가:", self.price_spin)
 
         # 주문 금액
@@ -55,14 +62,14 @@ class DcaSimulatorDialog(QDialog):
         self.amount_spin.setValue(self.order_amount)
         self.amount_spin.setSuffix(" 원")
         self.amount_spin.setSingleStep(1000)
-        self.amount_spin.valueChanged.connect(self._calculate_dca)
+        self.amount_spin.valueChanged.connect(self._recalc_timer.start)
         input_layout.addRow("💰 주문 금액:", self.amount_spin)
 
         # DCA 레벨 수
         self.levels_spin = QSpinBox()
         self.levels_spin.setRange(1, 10)
         self.levels_spin.setValue(5)
-        self.levels_spin.valueChanged.connect(self._calculate_dca)
+        self.levels_spin.valueChanged.connect(self._recalc_timer.start)
         input_layout.addRow("🔢 DCA 레벨 수:", self.levels_spin)
 
         # 하락 간격 %
@@ -72,7 +79,7 @@ class DcaSimulatorDialog(QDialog):
         self.drop_interval_spin.setSuffix(" %")
         self.drop_interval_spin.setDecimals(1)
         self.drop_interval_spin.setSingleStep(0.5)
-        self.drop_interval_spin.valueChanged.connect(self._calculate_dca)
+        self.drop_interval_spin.valueChanged.connect(self._recalc_timer.start)
         input_layout.addRow("📉 하락 간격:", self.drop_interval_spin)
 
         # DCA 배수
@@ -81,7 +88,7 @@ class DcaSimulatorDialog(QDialog):
         self.multiplier_spin.setValue(2.0)
         self.multiplier_spin.setDecimals(1)
         self.multiplier_spin.setSingleStep(0.1)
-        self.multiplier_spin.valueChanged.connect(self._calculate_dca)
+        self.multiplier_spin.valueChanged.connect(self._recalc_timer.start)
         input_layout.addRow("⚡ DCA 배수:", self.multiplier_spin)
 
         # 익절 목표 %
@@ -91,7 +98,7 @@ class DcaSimulatorDialog(QDialog):
         self.target_spin.setSuffix(" %")
         self.target_spin.setDecimals(1)
         self.target_spin.setSingleStep(0.5)
-        self.target_spin.valueChanged.connect(self._calculate_dca)
+        self.target_spin.valueChanged.connect(self._recalc_timer.start)
         input_layout.addRow("🎯 익절 목표:", self.target_spin)
 
         input_group.setLayout(input_layout)
@@ -112,6 +119,20 @@ class DcaSimulatorDialog(QDialog):
         header.setSectionResizeMode(QHeaderView.Stretch)
 
         self.dca_table.setFont(QFont("Consolas", 10))
+
+        # 셀 아이템 미리 생성 (최대 레벨 수만큼, 재계산 시에는 텍스트만 갱신)
+        max_levels = self.levels_spin.maximum()
+        self.dca_table.setRowCount(max_levels)
+        self._cells = []
+        for row in range(max_levels):
+            cells = []
+            for col in range(5):
+                item = QTableWidgetItem(f"{row + 1}" if col == 0 else "")
+                item.setTextAlignment(Qt.AlignCenter)
+                self.dca_table.setItem(row, col, item)
+                cells.append(item)
+            self._cells.append(cells)
+
         table_layout.addWidget(self.dca_table)
 
         table_group.setLayout(table_layout)
@@ -157,55 +178,38 @@ class DcaSimulatorDialog(QDialog):
         multiplier = self.multiplier_spin.value()
         target_pct = self.target_spin.value()
 
-        # 테이블 초기화
-        self.dca_table.setRowCount(levels)
-
-        total_invested = 0
-        total_quantity = 0
-
-        dca_data = []
-
-        for i in range(levels):
-            # 레벨 (1부터 시작)
-            level = i + 1
-
-            # 하락률 계산
-            drop_pct = drop_interval * i
-
-            # 진입가 계산
-            entry_price = current_price * (1 - drop_pct / 100)
-
-            # 매수 금액 계산 (배수 적용)
-            if i == 0:
-                buy_amount = amount
-            else:
-                buy_amount = amount * (multiplier ** i)
-
-            # 매수 수량 계산
-            buy_quantity = buy_amount / entry_price
-
-            # 누적
-            total_invested += buy_amount
-            total_quantity += buy_quantity
-
-            dca_data.append({
-                'level': level,
-                'drop_pct': drop_pct,
-                'entry_price': entry_price,
-                'buy_amount': buy_amount,
-                'total_invested': total_invested
-            })
-
-            # 테이블에 추가
-            self.dca_table.setItem(i, 0, QTableWidgetItem(f"{level}"))
-            self.dca_table.setItem(i, 1, QTableWidgetItem(f"-{drop_pct:.1f}%"))
-            self.dca_table.setItem(i, 2, QTableWidgetItem(f"{entry_price:,.0f}원"))
-            self.dca_table.setItem(i, 3, QTableWidgetItem(f"{buy_amount:,.0f}원"))
-            self.dca_table.setItem(i, 4, QTableWidgetItem(f"{total_invested:,.0f}원"))
-
-            # 가운데 정렬
-            for col in range(5):
-                self.dca_table.item(i, col).setTextAlignment(Qt.AlignCenter)
+        # 레벨별 하락률 / 진입가 / 매수 금액(배수 적용)을 배열로 한 번에 계산
+        steps = np.arange(levels)
+        drops = drop_interval * steps
+        entry_prices = current_price * (1 - drops / 100)
+        buy_amounts = amount * multiplier ** steps
+        buy_amounts[0] = amount
+        quantities = buy_amounts / entry_prices
+        cum_invested = buy_amounts.cumsum()
+
+        total_invested = float(cum_invested[-1])
+        total_quantity = float(quantities.sum())
+
+        # 테이블 일괄 갱신 (시그널 차단, 다시 그리기는 갱신이 끝난 뒤 한 번만)
+        self.dca_table.setUpdatesEnabled(False)
+        was_blocked = self.dca_table.blockSignals(True)
+        try:
+            # 사용하지 않는 레벨 행은 숨김 (행 수를 줄이면 미리 만든 아이템이 삭제됨)
+            for row in range(len(self._cells)):
+                self.dca_table.setRowHidden(row, row >= levels)
+
+            rows = zip(drops.tolist(), entry_prices.tolist(),
+                       buy_amounts.tolist(), cum_invested.tolist())
+            for i, (drop_pct, entry_price, buy_amount, invested) in enumerate(rows):
+                # 테이블 갱신 (레벨 번호 칸은 고정)
+                cells = self._cells[i]
+                cells[1].setText(f"-{drop_pct:.1f}%")
+                cells[2].setText(f"{entry_price:,.0f}원")
+                cells[3].setText(f"{buy_amount:,.0f}원")
+                cells[4].setText(f"{invested:,.0f}원")
+        finally:
+            self.dca_table.blockSignals(was_blocked)
+            self.dca_table.setUpdatesEnabled(True)
 
         # 평균 단가 계산
         avg_price = total_invested / total_quantity if total_quantity > 0 else 0
@@ -29,7 +29,6 @@ from gui.trading_worker import TradingEngineWorker
 from gui.multi_coin_worker import MultiCoinTradingWorker  # 🔧 다중 코인 워커 추가
 from gui.auto_trading_worker import AutoTradingWorker  # 🔧 완전 자동 워커 추가
 from gui.semi_auto_worker import SemiAutoWorker  # 🔧 반자동 워커 추가 (수동매수 + 자동관리)
-from gui.dca_simulator import DcaSimulatorDialog
 from gui.advanced_dca_dialog import AdvancedDcaDialog
 from gui.dca_config import DcaConfigManager
 from gui.coin_selection_dialog import CoinSelectionDialog  # 🔧 코인 선택 다이얼로그
@@ -86,6 +85,25 @@ class BalanceWorker(QThread):
             self.error.emit(str(e))
 
 
+class KeyValidationWorker(QThread):
+    """
+    API 키 검증 워커 스레드
+
+    실제 API 호출로 키를 확인하는 동안 GUI가 멈추지 않도록 백그라운드에서 실행
+    """
+
+    # 시그널 정의
+    validated = Signal(bool)  # 검증 결과 (유효 여부)
+
+    def __init__(self, config_manager: ConfigManager):
+        super().__init__()
+        self.config_manager = config_manager
+
+    def run(self):
+        """백그라운드에서 API 키 검증 실행"""
+        self.validated.emit(self.config_manager.validate_upbit_keys())
+
+
 class MainWindow(QMainWindow):
     """
     메인 윈도우
@@ -107,6 +125,8 @@ class MainWindow(QMainWindow):
         
         self.is_running = False
         self.balance_worker = None  # 잔고 조회 워커 스레드
+        self.key_validation_worker = None  # API 키 검증 워커 스레드
+        self.coin_selection_dialog = None  # 코인 선택 다이얼로그 (재사용)
         self.trading_worker = None  # Trading Engine 워커 스레드
         self._shutdown_timer = None  # 비동기 종료 타이머
         self._shutdown_elapsed = 0  # 종료 대기 시간
@@ -616,7 +636,8 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             # 설정이 변경되면 업데이트
             self.auto_trading_config = dialog.get_config()
-            self.auto_trading_config.to_file('auto_trading_config.json')
+            if dialog.is_modified():
+                self.auto_trading_config.to_file('auto_trading_config.json')
             self._update_auto_config_display()
             self._add_log("✅ 완전 자동 설정이 업데이트되었습니다")
     
@@ -695,14 +716,17 @@ class MainWindow(QMainWindow):
         # 현재 선택된 코인 리스트 가져오기
         selected_coins = self.config_manager.get_selected_coins()
 
-        # 코인 선택 다이얼로그 열기
-        dialog = CoinSelectionDialog(self, selected_coins=selected_coins)
+        # 코인 선택 다이얼로그 열기 (처음 한 번만 생성하고 이후에는 선택 상태만 다시 적용)
+        if self.coin_selection_dialog is None:
+            self.coin_selection_dialog = CoinSelectionDialog(self, selected_coins=selected_coins)
 
-        # 코인 선택 변경 시그널 연결
-        dialog.coins_changed.connect(self._on_coins_changed)
+            # 코인 선택 변경 시그널 연결
+            self.coin_selection_dialog.coins_changed.connect(self._on_coins_changed)
+        else:
+            self.coin_selection_dialog.set_selection(selected_coins)
 
         # 다이얼로그 실행
-        dialog.exec()
+        self.coin_selection_dialog.exec()
 
     def _on_coins_changed(self, coins):
         """코인 선택 변경 시그널 핸들러"""
@@ -727,6 +751,8 @@ class MainWindow(QMainWindow):
 
     def _open_dca_simulator(self):
         """DCA 시뮬레이터 열기"""
+        from gui.dca_simulator import DcaSimulatorDialog
+
         # 현재 DOGE 가격 가져오기 (가능하면)
         try:
             import pyupbit
@@ -887,11 +913,26 @@ class MainWindow(QMainWindow):
             self._add_log("⏳ 이전 엔진이 종료되는 중입니다. 잠시만 기다려주세요...")
             return
 
-        # 🔧 API 키 검증 (실제 연결 테스트)
+        # 키 검증이 진행 중이면 무시
+        if self.key_validation_worker and self.key_validation_worker.isRunning():
+            return
+
+        # 🔧 API 키 검증 (실제 연결 테스트) - 네트워크 호출이므로 워커 스레드에서 실행
         self._add_log("🔑 API 키 검증 중...")
         self.statusbar.showMessage("API 키 검증 중...")
 
-        if not self.config_manager.validate_upbit_keys():
+        self.key_validation_worker = KeyValidationWorker(self.config_manager)
+        self.key_validation_worker.validated.connect(self._on_start_keys_validated)
+        self.key_validation_worker.start()
+
+    def _on_start_keys_validated(self, valid: bool):
+        """
+        API 키 검증 완료 후 트레이딩 시작 계속
+
+        Args:
+            valid: API 키 유효 여부
+        """
+        if not valid:
             self._add_log("❌ API 키 검증 실패")
             QMessageBox.warning(
                 self,
@@ -1202,7 +1243,8 @@ class MainWindow(QMainWindow):
 
     def _refresh_balance(self):
         """잔고 새로고침 (비동기)"""
-        if not self.config_manager.validate_upbit_keys():
+        # 키 형식만 확인 (잘못된 키는 잔고 조회 워커에서 오류로 보고됨)
+        if not self.config_manager.has_upbit_keys():
             QMessageBox.warning(
                 self,
                 "설정 오류",
@@ -1675,6 +1717,7 @@ class MainWindow(QMainWindow):
                 - daily_pnl_pct: 오늘 손익률
                 - krw_balance: KRW 잔고
                 - positions: 포지션 리스트
+                - seq: 상태 일련번호 (전송마다 1씩 증가)
         """
         try:
             # 상단 통계 업데이트
@@ -1932,6 +1975,11 @@ class MainWindow(QMainWindow):
             self.balance_worker.wait(1000)
             self.balance_worker = None
 
+        # API 키 검증 워커도 정리
+        if self.key_validation_worker and self.key_validation_worker.isRunning():
+            self.key_validation_worker.wait(1000)
+            self.key_validation_worker = None
+
         event.accept()
 
 
@@ -0,0 +1,253 @@
+"""
+볼린저 밴드 백테스트 커널 검증 테스트
+
+합성 OHLCV 데이터로 _backtest_kernel.run_bb_backtest(AOT/JIT/순수 Python)를 돌려
+원래의 캔들 단위 루프와 거래 내역 / 최종 자본이 같은지 확인합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import _backtest_kernel as kernel
+
+
+FEE = 0.0005
+INITIAL_CAPITAL = 1000000
+
+
+def generate_candles(n: int = 6000, seed: int = 7) -> pd.DataFrame:
+    """1분봉 합성 데이터 (변동성 구간이 섞인 랜덤 워크)"""
+    rng = np.random.default_rng(seed)
+
+    vol = np.where((np.arange(n) // 500) % 2 == 0, 0.004, 0.012)
+    close = 100000000 * np.exp(np.cumsum(rng.normal(0, vol)))
+    spread = close * vol * rng.uniform(0.5, 1.5, n)
+
+    index = pd.date_range('2024-01-01', periods=n, freq='1min')
+    return pd.DataFrame({
+        'open': close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    }, index=index)
+
+
+def calculate_indicators(candles: pd.DataFrame, std_dev: float = 2.0):
+    """원래 백테스트 스크립트와 같은 방식의 pandas 지표 계산"""
+    close = candles['close'].values
+    high = candles['high'].values
+    low = candles['low'].values
+
+    ma = pd.Series(close).rolling(window=20).mean().values
+    std = pd.Series(close).rolling(window=20).std().values
+    upper = ma + std * std_dev
+    lower = ma - std * std_dev
+
+    ma240 = pd.Series(close).rolling(window=240).mean().values
+
+    tr1 = high - low
+    tr2 = np.abs(high - np.roll(close, 1))
+    tr3 = np.abs(low - np.roll(close, 1))
+    tr = np.maximum(tr1, np.maximum(tr2, tr3))
+    tr[0] = tr1[0]
+    atr = pd.Series(tr).rolling(window=14).mean().values
+
+    return close, upper, lower, ma240, atr
+
+
+def reference_backtest(candles, close, upper, lower, ma240, atr,
+                       min_hours_between_trades, atr_multiplier):
+    """커널 도입 전의 캔들 단위 루프 (기대값 계산용)"""
+    cash = INITIAL_CAPITAL
+    position = 0.0
+    entry_price = 0
+    amount = 0.0
+    last_trade_time = None
+    trades = []
+
+    min_minutes_between_trades = min_hours_between_trades * 60
+
+    for i in range(300, len(candles)):
+        current_time = candles.index[i]
+        price = close[i]
+
+        # 시간 필터
+        if last_trade_time is not None:
+            time_diff = (current_time - last_trade_time).total_seconds() / 60
+            if time_diff < min_minutes_between_trades:
+                continue
+
+        # 변동성 필터
+        if np.isnan(atr[i]) or atr[i] < (price * atr_multiplier / 100):
+            continue
+
+        if position == 0:
+            if price < lower[i] and not np.isnan(lower[i]):
+                if not np.isnan(ma240[i]) and price < ma240[i]:
+                    if cash > 0:
+                        amount = (cash * 0.99) / price
+                        fee = amount * price * FEE
+                        position = amount
+                        cash -= amount * price + fee
+                        entry_price = price
+                        last_trade_time = current_time
+                        trades.append(('buy', i, price, amount, 0.0))
+
+        elif position > 0:
+            if price > upper[i] and not np.isnan(upper[i]):
+                if not np.isnan(ma240[i]) and price > ma240[i]:
+                    proceeds = position * price
+                    fee = proceeds * FEE
+                    cash += proceeds - fee
+                    profit = (price - entry_price) * position - (amount * entry_price * FEE) - fee
+                    last_trade_time = current_time
+                    trades.append(('sell', i, price, position, profit))
+                    position = 0.0
+                    entry_price = 0
+
+    # 최종 청산
+    if position > 0:
+        final_price = close[-1]
+        proceeds = position * final_price
+        fee = proceeds * FEE
+        cash += proceeds - fee
+        profit = (final_price - entry_price) * position - (amount * entry_price * FEE) - fee
+        trades.append(('sell', len(close) - 1, final_price, position, profit))
+
+    return trades, cash
+
+
+def kernel_backends() -> dict:
+    """사용 가능한 커널 구현 (순수 Python은 항상 포함)"""
+    loop = kernel._run_bb_loop
+    backends = {'python': getattr(loop, 'py_func', loop)}
+    if kernel.NUMBA_AVAILABLE:
+        backends['jit'] = loop
+    if kernel.KERNEL_BACKEND == 'aot':
+        backends['aot'] = kernel._bb_loop
+    return backends
+
+
+def run_kernel(loop, candles, close, upper, lower, ma240, atr,
+               min_hours_between_trades, atr_multiplier):
+    """지정한 커널 구현으로 run_bb_backtest 실행 후 거래 튜플 목록으로 변환"""
+    original = kernel._bb_loop
+    kernel._bb_loop = loop
+    try:
+        (trade_type, trade_price, trade_amount, trade_profit,
+         trade_idx, cash, _) = kernel.run_bb_backtest(
+            close, upper, lower, ma240, atr,
+            candles.index.values.astype('datetime64[ns]').view('i8'),
+            min_hours_between_trades, atr_multiplier, INITIAL_CAPITAL, FEE
+        )
+    finally:
+        kernel._bb_loop = original
+
+    trades = [
+        ('buy' if t == kernel.TRADE_BUY else 'sell', int(i), p, a, pr)
+        for t, i, p, a, pr in zip(trade_type.tolist(), trade_idx.tolist(),
+                                  trade_price.tolist(), trade_amount.tolist(),
+                                  trade_profit.tolist())
+    ]
+    return trades, cash
+
+
+def assert_same_trades(expected, actual, label):
+    """거래 유형/캔들 위치는 정확히, 가격/수량/수익은 부동소수점 오차 내에서 비교"""
+    assert len(actual) == len(expected), f"{label}: 거래 수 불일치 {len(actual)} != {len(expected)}"
+    for exp, act in zip(expected, actual):
+        assert act[:2] == exp[:2], f"{label}: 거래 불일치 {act} != {exp}"
+        np.testing.assert_allclose(act[2:], exp[2:], rtol=1e-12, atol=1e-6, err_msg=label)
+
+
+def test_kernel_matches_reference_loop():
+    """모든 커널 구현이 원래 루프와 같은 거래/최종 자본을 내는지 검증"""
+    candles = generate_candles()
+    indicators = calculate_indicators(candles)
+
+    for min_hours, atr_mult in [(0, 0.0), (1, 0.1), (6, 0.3)]:
+        expected_trades, expected_cash = reference_backtest(
+            candles, *indicators, min_hours, atr_mult
+        )
+
+        for name, loop in kernel_backends().items():
+            label = f"{name} (min_hours={min_hours}, atr_mult={atr_mult})"
+            trades, cash = run_kernel(loop, candles, *indicators, min_hours, atr_mult)
+
+            assert_same_trades(expected_trades, trades, label)
+            np.testing.assert_allclose(cash, expected_cash, rtol=1e-12, err_msg=label)
+
+    print("✅ 커널 결과 검증 통과")
+
+
+def test_kernel_final_liquidation():
+    """기간 종료 시 보유 포지션을 청산하는 경로 검증 (첫 매수 직후에서 데이터를 자름)"""
+    candles = generate_candles()[:600]
+    indicators = calculate_indicators(candles)
+
+    expected_trades, expected_cash = reference_backtest(candles, *indicators, 1, 0.1)
+    assert expected_trades[-1][:2] == ('sell', len(candles) - 1), "최종 청산이 발생하지 않음"
+
+    for name, loop in kernel_backends().items():
+        trades, cash = run_kernel(loop, candles, *indicators, 1, 0.1)
+
+        assert_same_trades(expected_trades, trades, name)
+        np.testing.assert_allclose(cash, expected_cash, rtol=1e-12, err_msg=name)
+
+    print("✅ 최종 청산 검증 통과")
+
+
+def test_kernel_produces_trades():
+    """합성 데이터에서 매수/매도가 충분히 발생하는지 확인 (검증 데이터 자체 점검)"""
+    candles = generate_candles()
+    indicators = calculate_indicators(candles)
+
+    trades, _ = reference_backtest(candles, *indicators, 0, 0.0)
+    kinds = {t[0] for t in trades}
+    assert len(trades) >= 4, f"거래가 너무 적음: {len(trades)}"
+    assert kinds == {'buy', 'sell'}
+
+    print("✅ 합성 데이터 거래 발생 확인")
+
+
+def test_rolling_indicators_match_pandas():
+    """rolling_mean / rolling_std가 pandas rolling 결과와 같은지 검증"""
+    close = generate_candles(n=2000)['close'].values
+
+    expected_mean = pd.Series(close).rolling(window=20).mean().values
+    expected_std = pd.Series(close).rolling(window=20).std().values
+
+    # bottleneck 사용 경로와 NumPy 대체 경로 모두 확인
+    original = kernel.bn
+    try:
+        for bn in {original, None}:
+            kernel.bn = bn
+            np.testing.assert_allclose(kernel.rolling_mean(close, 20), expected_mean, rtol=1e-9)
+            np.testing.assert_allclose(kernel.rolling_std(close, 20), expected_std, rtol=1e-6)
+    finally:
+        kernel.bn = original
+
+    print("✅ 이동평균/표준편차 검증 통과")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print(f"볼린저 밴드 백테스트 커널 검증 (backend: {kernel.KERNEL_BACKEND})")
+    print("=" * 60)
+    print()
+
+    test_kernel_produces_trades()
+    test_kernel_matches_reference_loop()
+    test_kernel_final_liquidation()
+    test_rolling_indicators_match_pandas()
+
+    print()
+    print("✅ 모든 커널 검증 테스트 통과!")
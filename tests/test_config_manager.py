@@ -0,0 +1,146 @@
+"""
+ConfigManager .env 저장 검증 테스트
+
+_set_keys가 dotenv.set_key와 같은 형식으로 .env를 다시 쓰는지,
+없는 키 추가 / 값이 같을 때 쓰기 생략 / 파일 권한 유지를 확인합니다.
+"""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from dotenv import dotenv_values, set_key
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from gui.config_manager import ConfigManager, _CONFIG_KEYS
+
+
+ENV_CONTENT = """# Upbit API Keys
+UPBIT_ACCESS_KEY=your_access_key_here
+UPBIT_SECRET_KEY=your_secret_key_here
+
+# Telegram Bot
+TELEGRAM_BOT_TOKEN=your_telegram_bot_token_here
+TELEGRAM_CHAT_ID=your_telegram_chat_id_here
+export EXTRA_SETTING="keep me"  # 주석 유지
+"""
+
+
+@contextmanager
+def temp_env_file(content: str = ENV_CONTENT):
+    """임시 .env 파일 생성 (테스트 후 파일과 환경 변수 원상 복구)"""
+    saved = {key: os.environ.get(key) for key in _CONFIG_KEYS}
+    tmp_dir = Path(tempfile.mkdtemp())
+    env_path = tmp_dir / '.env'
+    env_path.write_text(content, encoding='utf-8')
+    try:
+        yield env_path
+    finally:
+        shutil.rmtree(tmp_dir)
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def test_special_values_match_set_key():
+    """따옴표 / # / 공백 / 역슬래시가 들어간 값이 dotenv.set_key와 같은 내용으로 저장되는지 검증"""
+    bot_token = "123:ab'c # not a comment"
+    chat_id = ' -100 "x" \\ y '
+
+    with temp_env_file() as env_path:
+        expected_path = env_path.with_name('.env.expected')
+        shutil.copy(env_path, expected_path)
+        set_key(expected_path, 'TELEGRAM_BOT_TOKEN', bot_token)
+        set_key(expected_path, 'TELEGRAM_CHAT_ID', chat_id)
+
+        manager = ConfigManager(env_path)
+        assert manager.set_telegram_config(bot_token, chat_id)
+
+        assert env_path.read_text(encoding='utf-8') == expected_path.read_text(encoding='utf-8')
+
+        values = dotenv_values(env_path)
+        assert values['TELEGRAM_BOT_TOKEN'] == bot_token
+        assert values['TELEGRAM_CHAT_ID'] == chat_id
+        assert values['EXTRA_SETTING'] == 'keep me'
+
+        assert manager.get_telegram_bot_token() == bot_token
+        assert os.environ['TELEGRAM_CHAT_ID'] == chat_id
+
+    print("✅ 특수 문자 값 저장 검증 통과")
+
+
+def test_missing_key_appended():
+    """파일에 없는 키는 끝에 추가하고 나머지 줄은 그대로 유지하는지 검증 (끝 줄바꿈 없는 파일 포함)"""
+    with temp_env_file(ENV_CONTENT.rstrip('\n')) as env_path:
+        manager = ConfigManager(env_path)
+        assert manager.set_strategy_type('rsi')
+
+        text = env_path.read_text(encoding='utf-8')
+        assert text == ENV_CONTENT + "STRATEGY_TYPE='rsi'\n"
+        assert dotenv_values(env_path)['STRATEGY_TYPE'] == 'rsi'
+        assert manager.get_strategy_type() == 'rsi'
+
+    print("✅ 없는 키 추가 검증 통과")
+
+
+def test_unchanged_values_skip_write():
+    """값이 모두 같으면 파일을 다시 쓰지 않는지 검증 (inode / 수정 시각 유지)"""
+    with temp_env_file() as env_path:
+        manager = ConfigManager(env_path)
+        assert manager.set_trading_config(7000, 45)
+        before = env_path.stat()
+
+        assert manager.set_trading_config(7000, 45)
+        after = env_path.stat()
+
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert manager.get_min_order_amount() == 7000
+        assert manager.get_order_timeout() == 45
+
+        # 값이 하나라도 바뀌면 다시 씀
+        assert manager.set_trading_config(7000, 60)
+        assert env_path.stat().st_ino != before.st_ino
+        assert dotenv_values(env_path)['ORDER_TIMEOUT'] == '60'
+
+    print("✅ 변경 없음 쓰기 생략 검증 통과")
+
+
+def test_file_mode_preserved():
+    """임시 파일로 교체한 뒤에도 원래 파일 권한이 유지되는지 검증"""
+    with temp_env_file() as env_path:
+        os.chmod(env_path, 0o640)
+
+        manager = ConfigManager(env_path)
+        assert manager.set_upbit_keys('a' * 32, 'b' * 32)
+
+        assert stat.S_IMODE(env_path.stat().st_mode) == 0o640
+        assert dotenv_values(env_path)['UPBIT_ACCESS_KEY'] == 'a' * 32
+
+        # 임시 파일이 남지 않아야 함
+        assert [p.name for p in env_path.parent.iterdir()] == ['.env']
+
+    print("✅ 파일 권한 유지 검증 통과")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ConfigManager .env 저장 검증 테스트")
+    print("=" * 60)
+    print()
+
+    test_special_values_match_set_key()
+    test_missing_key_appended()
+    test_unchanged_values_skip_write()
+    test_file_mode_preserved()
+
+    print()
+    print("✅ 모든 .env 저장 검증 테스트 통과!")
@@ -0,0 +1,33 @@
+"""
+Numba JIT 데코레이터 (선택적 의존성)
+
+numba가 설치되어 있으면 numba.njit를 그대로 사용하고,
+없으면 원본 함수를 반환하는 no-op 데코레이터로 대체합니다.
+
+Example:
+    >>> from utils._njit import njit
+    >>> @njit(cache=True)
+    ... def kernel(x):
+    ...     return x * 2
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 순수 Python으로 실행"""
+        # @njit 형태 (인자 없이 사용)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        # @njit(cache=True) 형태
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']